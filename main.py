@@ -1,40 +1,104 @@
-import pygame
 import sys
 import os
-from scripts.game import Game
-from scripts.menu import Menu
-from scripts.campaign import Campaign
+import argparse
+from scripts.startup import startup_profiler
 
-# Initialize pygame
-pygame.init()
-pygame.mixer.init()
+# Time each import (including the modules it pulls in) for --profile-startup
+with startup_profiler.section("import", "pygame"):
+    import pygame
+with startup_profiler.section("import", "scripts.game"):
+    from scripts.game import Game
+with startup_profiler.section("import", "scripts.menu"):
+    from scripts.menu import Menu
+with startup_profiler.section("import", "scripts.campaign"):
+    from scripts.campaign import Campaign
+with startup_profiler.section("import", "scripts.replay"):
+    from scripts.replay import ReplayRecorder
+with startup_profiler.section("import", "scripts.shape_library"):
+    from scripts.shape_library import shape_library, SHAPE_CACHE_PATH
+
+# Initialize pygame (the mixer is opened by pygame.init; sounds load on first play)
+with startup_profiler.section("init", "pygame.init"):
+    pygame.init()
 
 # Game constants
 SCREEN_WIDTH = 800
 SCREEN_HEIGHT = 600
 FPS = 60
+MAX_STEPS_PER_FRAME = 5  # Cap on simulation catch-up steps after a slow frame
+MAX_FRAME_TIME = 0.25  # Longer frames (e.g. window drags) are clamped to this
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Asteroid Dodger")
+    parser.add_argument("--fps", type=int, default=FPS,
+                        help="render frame rate cap, 0 for uncapped (the simulation always runs at 60 Hz)")
+    parser.add_argument("--vsync", action="store_true", help="synchronise rendering with the display")
+    parser.add_argument("--profile-out", metavar="PATH",
+                        help="on exit, write per-phase frame timings to PATH (.json or .csv)")
+    parser.add_argument("--dirty-rects", action="store_true",
+                        help="only redraw and update the changed parts of the screen (for slow hardware)")
+    parser.add_argument("--record", metavar="PATH",
+                        help="record each game's seed and inputs to PATH (verify with python -m scripts.replay PATH)")
+    parser.add_argument("--profile-startup", action="store_true",
+                        help="print the time to the first menu frame, split by import and constructor, then exit")
+    parser.add_argument("--asteroid-bounce", action="store_true",
+                        help="make asteroids collide and bounce off each other")
+    return parser.parse_args()
+
+args = parse_args()
 
 # Create the game window
-screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-pygame.display.set_caption("Asteroid Dodger")
+with startup_profiler.section("init", "display"):
+    if args.vsync:
+        screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SCALED, vsync=1)
+    else:
+        screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    pygame.display.set_caption("Asteroid Dodger")
 
 # Set up the clock
 clock = pygame.time.Clock()
 
+def start_recording(game, sector_index=-1):
+    """Attach a fresh input recorder to a game that has just been reset"""
+    if args.record:
+        game.recorder = ReplayRecorder(game, sector_index)
+
+def save_recording(game):
+    """Write and detach the current recording, if any"""
+    if game.recorder:
+        game.recorder.save(args.record)
+        print(f"Wrote replay to {args.record}")
+        game.recorder = None
+
 def main():
-    # Create game and menu instances
-    game = Game(screen, SCREEN_WIDTH, SCREEN_HEIGHT)
-    menu = Menu(screen, SCREEN_WIDTH, SCREEN_HEIGHT, game)
+    # Asteroid shapes are loaded from the cache (or generated and cached) when the first one spawns
+    shape_library.cache_path = SHAPE_CACHE_PATH
+    
+    # Create game and menu instances. The game world is only built when the first game starts.
+    with startup_profiler.section("constructor", "Game"):
+        game = Game(screen, SCREEN_WIDTH, SCREEN_HEIGHT, lazy=True, asteroid_bounce=args.asteroid_bounce)
+        if args.dirty_rects:
+            game.enable_dirty_rects()
+    with startup_profiler.section("constructor", "Menu"):
+        menu = Menu(screen, SCREEN_WIDTH, SCREEN_HEIGHT, game)
     
     # Game state
     current_state = "menu"  # Can be "menu", "game", "game_over", "campaign_select"
+    drawn_state = None  # State shown by the last drawn frame
     
     # Create campaign instance
     campaign = None
     
+    # Unsimulated time carried over between frames
+    accumulator = 0.0
+    alpha = 1.0
+    
     # Main game loop
     running = True
     while running:
+        # Measure the real time since the last frame
+        frame_time = min(clock.tick(args.fps) / 1000.0, MAX_FRAME_TIME)
+        
         # Handle events
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
@@ -47,6 +111,7 @@ def main():
                     current_state = "game"
                     game.reset()
                     game.game_mode = "arcade"
+                    start_recording(game)
                 elif menu_action == "campaign":
                     current_state = "campaign_select"
                     campaign = Campaign(SCREEN_WIDTH, SCREEN_HEIGHT)
@@ -63,6 +128,7 @@ def main():
                 if game_over_action == "restart":
                     current_state = "game"
                     game.reset()
+                    start_recording(game)
                 elif game_over_action == "menu":
                     current_state = "menu"
             elif current_state == "paused":
@@ -71,53 +137,101 @@ def main():
                     current_state = "game"
                 elif pause_action == "menu":
                     current_state = "menu"
+                    save_recording(game)
         
         # Update the current state
         if current_state == "menu":
             menu.update()
         elif current_state == "game":
-            game_status = game.update()
-            if game_status == "game_over":
-                current_state = "game_over"
-                menu.set_final_score(game.score)
+            # Run as many fixed steps as the elapsed time requires
+            accumulator += frame_time
+            steps = 0
+            while accumulator >= game.fixed_dt and steps < MAX_STEPS_PER_FRAME:
+                accumulator -= game.fixed_dt
+                steps += 1
+                game_status = game.update()
+                if game_status == "game_over":
+                    current_state = "game_over"
+                    menu.set_final_score(game.score)
+                    save_recording(game)
+                    break
+            
+            # Drop any backlog we couldn't catch up on instead of spiralling
+            if steps == MAX_STEPS_PER_FRAME:
+                accumulator = min(accumulator, game.fixed_dt)
+            alpha = accumulator / game.fixed_dt
         elif current_state == "game_over":
             menu.update_game_over()
         elif current_state == "paused":
             menu.update_pause()
         elif current_state == "campaign_select":
             if campaign:
-                campaign.update(1/60)  # Assuming 60 FPS
+                campaign.update(frame_time)
                 campaign_action = campaign.handle_event(event)
                 if campaign_action == "start_mission":
                     current_state = "game"
                     game.reset()
                     game.game_mode = "campaign"
                     game.set_campaign_mission(campaign.get_current_sector())
+                    start_recording(game, campaign.selected_sector)
                 elif campaign_action == "back_to_menu":
                     current_state = "menu"
         
-        # Draw the current state
+        # Screens that only redraw on change must redraw fully after a switch
+        if current_state != drawn_state:
+            menu.invalidate()
+            if game.shop:
+                game.shop.needs_redraw = True
+            if game.dirty_renderer:
+                game.dirty_renderer.invalidate()
+            drawn_state = current_state
+        
+        # Draw the current state (the game draws the shop on top while it is open)
+        drawn = True
         if current_state == "menu":
-            menu.draw()
+            with startup_profiler.section("draw", "first menu frame"):
+                drawn = menu.draw()
         elif current_state == "game":
-            game.draw()
-            # If shop is active, draw it on top
-            if game.shop_active:
-                game.shop.draw(screen)
+            drawn = game.draw(alpha)
         elif current_state == "game_over":
-            menu.draw_game_over()
+            drawn = menu.draw_game_over()
         elif current_state == "paused":
-            game.draw()
-            menu.draw_pause()
+            # The pause screen darkens the last game frame, which is still on screen
+            drawn = menu.draw_pause()
         elif current_state == "campaign_select":
             if campaign:
                 campaign.draw(screen)
         
-        # Update the display
-        pygame.display.flip()
+        # Don't carry simulation time over from other screens
+        if current_state != "game":
+            accumulator = 0.0
+            alpha = 1.0
+        
+        # Update the display if anything changed
+        if drawn:
+            if current_state == "game":
+                game.present()
+            else:
+                pygame.display.flip()
         
-        # Cap the frame rate
-        clock.tick(FPS)
+        # Close the profiler frame for gameplay frames
+        if current_state == "game":
+            game.end_frame()
+        
+        # The first frame is on screen, so startup is over
+        if startup_profiler.active:
+            startup_profiler.finish()
+            if args.profile_startup:
+                print(startup_profiler.get_report())
+                running = False
+    
+    # Keep the recording of a game that was still running at exit
+    save_recording(game)
+    
+    # Write the frame timing report
+    if args.profile_out:
+        game.profiler.dump(args.profile_out)
+        print(f"Wrote frame profile to {args.profile_out}")
     
     # Clean up
     pygame.quit()
@@ -1,11 +1,40 @@
 import pygame
 import math
 import random
+from .sprite_cache import sprite_cache
+from .shape_library import shape_library
+from .entity_store import (Column, X, Y, PREV_X, PREV_Y, VELOCITY_1, VELOCITY_2, RADIUS, LIFETIME,
+                           ROTATION, ROTATION_SPEED)
 
 class Asteroid:
-    def __init__(self, x, y, asteroid_type, angle, wave):
+    __slots__ = ("rng", "_x", "_y", "_prev_x", "_prev_y", "type", "_angle", "_lifetime", "_radius",
+                 "_speed", "color", "shape_key", "points", "health", "_rotation", "_rotation_speed",
+                 "store", "store_index")
+    
+    # Kept in the game's EntityStore columns while the asteroid is in play
+    x = Column(X)
+    y = Column(Y)
+    prev_x = Column(PREV_X, optional=True)
+    prev_y = Column(PREV_Y, optional=True)
+    angle = Column(VELOCITY_1)
+    speed = Column(VELOCITY_2)
+    radius = Column(RADIUS)
+    lifetime = Column(LIFETIME)
+    rotation = Column(ROTATION)
+    rotation_speed = Column(ROTATION_SPEED)
+    
+    def __init__(self, x, y, asteroid_type, angle, wave, rng=None):
+        self.store = None
+        self.reset(x, y, asteroid_type, angle, wave, rng)
+    
+    def reset(self, x, y, asteroid_type, angle, wave, rng=None):
+        """(Re)initialise the asteroid; pooled asteroids are reused through this"""
+        # Random source for shape and spin; the game passes its seeded generator
+        self.rng = rng if rng is not None else random
         self.x = x
         self.y = y
+        self.prev_x = None
+        self.prev_y = None
         self.type = asteroid_type
         self.angle = angle  # Direction of movement
         self.lifetime = 30.0  # Maximum lifetime in seconds
@@ -15,48 +44,33 @@ class Asteroid:
             self.radius = 10
             self.speed = 3.0 + (wave * 0.1)  # Small asteroids are fast
             self.color = (200, 200, 200)  # Light gray
-            self.points = self.generate_asteroid_points(self.radius, 5, 0.3)
+            self.shape_key, self.points = shape_library.pick_shape("small", self.rng)
             self.health = 1
         elif asteroid_type == "medium":
             self.radius = 20
             self.speed = 2.0 + (wave * 0.05)  # Medium speed
             self.color = (150, 150, 150)  # Medium gray
-            self.points = self.generate_asteroid_points(self.radius, 8, 0.4)
+            self.shape_key, self.points = shape_library.pick_shape("medium", self.rng)
             self.health = 2
         elif asteroid_type == "boss":
             self.radius = 50
             self.speed = 1.0 + (wave * 0.02)  # Slow but dangerous
             self.color = (255, 100, 100)  # Reddish
-            self.points = self.generate_asteroid_points(self.radius, 12, 0.2)
+            self.shape_key, self.points = shape_library.pick_shape("boss", self.rng)
             self.health = 10
         else:  # large
             self.radius = 30
             self.speed = 1.0 + (wave * 0.03)  # Large asteroids are slow
             self.color = (100, 100, 100)  # Dark gray
-            self.points = self.generate_asteroid_points(self.radius, 10, 0.5)
+            self.shape_key, self.points = shape_library.pick_shape("large", self.rng)
             self.health = 3
         
         # Add some rotation
         self.rotation = 0
-        self.rotation_speed = random.uniform(-0.02, 0.02)
-    
-    def generate_asteroid_points(self, radius, num_points, irregularity):
-        """Generate irregular asteroid shape with the given radius and number of points"""
-        points = []
-        angle_step = 2 * math.pi / num_points
-        
-        for i in range(num_points):
-            angle = i * angle_step
-            # Add some irregularity to the radius
-            r = radius * (1 + random.uniform(-irregularity, irregularity))
-            x = math.cos(angle) * r
-            y = math.sin(angle) * r
-            points.append((x, y))
-        
-        return points
+        self.rotation_speed = self.rng.uniform(-0.02, 0.02)
     
     def update(self, dt):
-        # Move the asteroid
+        # Move the asteroid (the game's EntityStore does this in a batch instead)
         self.x += math.cos(self.angle) * self.speed * dt * 60
         self.y += math.sin(self.angle) * self.speed * dt * 60
         
@@ -64,15 +78,13 @@ class Asteroid:
         self.rotation += self.rotation_speed * dt * 60
         
         # Update lifetime
-        if hasattr(self, 'lifetime'):
-            self.lifetime -= dt
+        self.lifetime -= dt
     
     def is_offscreen(self, screen_width, screen_height, buffer=0):
         """Check if the asteroid is completely off the screen"""
         # Add a time-based check to ensure asteroids don't stay forever
-        if hasattr(self, 'lifetime'):
-            if self.lifetime <= 0:
-                return True
+        if self.lifetime <= 0:
+            return True
         
         return (self.x + self.radius + buffer < 0 or 
                 self.x - self.radius - buffer > screen_width or 
@@ -80,21 +92,8 @@ class Asteroid:
                 self.y - self.radius - buffer > screen_height)
     
     def draw(self, screen):
-        # Transform asteroid points based on position and rotation
-        transformed_points = []
-        for point in self.points:
-            # Rotate
-            rotated_x = point[0] * math.cos(self.rotation) - point[1] * math.sin(self.rotation)
-            rotated_y = point[0] * math.sin(self.rotation) + point[1] * math.cos(self.rotation)
-            
-            # Translate
-            transformed_points.append((rotated_x + self.x, rotated_y + self.y))
-        
-        # Draw the asteroid
-        pygame.draw.polygon(screen, self.color, transformed_points)
-        
-        # Draw outline for better visibility
-        pygame.draw.polygon(screen, (255, 255, 255), transformed_points, 1)
+        # Blit the pre-rendered rotation frame (filled shape with a white outline)
+        sprite_cache.draw(screen, self.shape_key, self.points, self.color, self.x, self.y, self.rotation)
         
         # For boss asteroids, draw a health indicator
         if self.type == "boss":
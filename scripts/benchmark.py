@@ -0,0 +1,304 @@
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+import pygame
+from .game import INPUT_LEFT, INPUT_FIRE
+from .headless import create_headless_game
+from .hazard import BlackHole
+from .profiler import FrameProfiler
+
+# Version of the baseline file format
+BASELINE_VERSION = 1
+
+# Metrics compared against a baseline (lower is better for all of them)
+COMPARED_METRICS = [
+    ("update_ms", "mean"), ("update_ms", "p95"),
+    ("draw_ms", "mean"), ("draw_ms", "p95"),
+    ("peak_memory_kb", None)
+]
+
+
+class Scenario:
+    """A repeatable stress test: builds a game state and keeps it loaded every tick"""
+    name = ""
+    description = ""
+    input_bits = 0
+
+    def setup(self, game):
+        pass
+
+    def prepare(self, game):
+        """Called before every tick (outside the timed section)"""
+        # Keep the player alive and the wave running so the load stays constant
+        game.player.health = 3
+        game.wave_timer = 0
+
+    def fill_asteroids(self, game, count):
+        """Top the field up to count asteroids, spread over the whole screen"""
+        while len(game.asteroids) < count:
+            game.spawn_asteroid()
+            asteroid = game.asteroids[-1]
+            asteroid.x = game.rng.uniform(0, game.width)
+            asteroid.y = game.rng.uniform(0, game.height)
+
+
+class AsteroidFieldScenario(Scenario):
+    name = "asteroids_500"
+    description = "500 asteroids crossing the screen"
+
+    def setup(self, game):
+        game.max_asteroids = 500
+        self.fill_asteroids(game, 500)
+
+    def prepare(self, game):
+        super().prepare(game)
+        self.fill_asteroids(game, 500)
+
+
+class AsteroidBounceScenario(AsteroidFieldScenario):
+    name = "asteroids_500_bounce"
+    description = "500 asteroids crossing the screen and bouncing off each other"
+
+    def setup(self, game):
+        game.asteroid_bounce = True
+        super().setup(game)
+
+
+class RingOfFireScenario(Scenario):
+    name = "boss_ring_of_fire"
+    description = "Boss casting its ring-of-fire particle storm twice a second"
+
+    def setup(self, game):
+        # Wave 15 brings the ring-of-fire boss type
+        game.clear_asteroids()
+        game.wave = 15
+        game.spawn_boss()
+        game.boss.special_cooldown = 0.5
+
+    def prepare(self, game):
+        super().prepare(game)
+        game.boss.health = game.boss.max_health
+
+
+class StormBlackHoleScenario(Scenario):
+    name = "storm_black_hole"
+    description = "Space storm and a black hole pulling 60 asteroids"
+
+    def setup(self, game):
+        game.spawn_space_storm()
+        game.spawn_black_hole()
+        game.max_asteroids = 60
+        self.fill_asteroids(game, 60)
+
+    def prepare(self, game):
+        super().prepare(game)
+        # Keep both hazards from expiring
+        for hazard in game.hazards:
+            if hasattr(hazard, "time_left"):
+                hazard.time_left = hazard.duration
+            else:
+                hazard.lifetime = 30.0
+        self.fill_asteroids(game, 60)
+
+
+class BlackHoleSwarmScenario(Scenario):
+    name = "black_holes_24"
+    description = "24 black holes pulling 150 asteroids"
+
+    def setup(self, game):
+        for _ in range(24):
+            game.hazards.append(BlackHole(game.rng.uniform(0, game.width), game.rng.uniform(0, game.height),
+                                          rng=game.rng))
+        game.max_asteroids = 150
+        self.fill_asteroids(game, 150)
+
+    def prepare(self, game):
+        super().prepare(game)
+        for hazard in game.hazards:
+            hazard.lifetime = 30.0
+        self.fill_asteroids(game, 150)
+
+
+class RapidFireScenario(Scenario):
+    name = "rapid_fire_maxed"
+    description = "Spinning rapid-fire spread with every shop upgrade maxed"
+    input_bits = INPUT_LEFT | INPUT_FIRE
+
+    def setup(self, game):
+        for item in game.shop.items:
+            item.current_level = item.max_level
+        game.upgrades.update(game.shop.get_upgrades())
+        game.apply_upgrades()
+        game.max_asteroids = 50
+        self.fill_asteroids(game, 50)
+
+    def prepare(self, game):
+        super().prepare(game)
+        game.active_powerups["rapid_fire"] = 8.0
+        self.fill_asteroids(game, 50)
+
+
+SCENARIOS = [AsteroidFieldScenario, AsteroidBounceScenario, RingOfFireScenario, StormBlackHoleScenario,
+             BlackHoleSwarmScenario, RapidFireScenario]
+
+
+def create_game(scenario, seed):
+    """Create a headless game that draws to an offscreen surface, set up for the scenario"""
+    game = create_headless_game()
+    game.reset(seed)
+    game.screen = pygame.Surface((game.width, game.height))
+    scenario.setup(game)
+    return game
+
+
+def run_ticks(game, scenario, ticks, update_ms=None, draw_ms=None):
+    for _ in range(ticks):
+        scenario.prepare(game)
+        game.apply_input(scenario.input_bits)
+
+        start = time.perf_counter()
+        game.update()
+        updated = time.perf_counter()
+        game.draw()
+        drawn = time.perf_counter()
+        game.end_frame()
+
+        if update_ms is not None:
+            update_ms.append((updated - start) * 1000)
+            draw_ms.append((drawn - updated) * 1000)
+
+
+def run_scenario(scenario, ticks=600, warmup=60, seed=0):
+    """Measure a scenario's update and draw cost per tick and its peak Python memory"""
+    # Timing pass (tracemalloc would slow it down)
+    game = create_game(scenario, seed)
+    run_ticks(game, scenario, warmup)
+    update_ms = []
+    draw_ms = []
+    run_ticks(game, scenario, ticks, update_ms, draw_ms)
+    entities = game.get_entity_counts()
+    pools = game.get_pool_stats()
+
+    # Memory pass over the same ticks
+    game = create_game(scenario, seed)
+    run_ticks(game, scenario, warmup)
+    tracemalloc.start()
+    run_ticks(game, scenario, ticks)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return {
+        "description": scenario.description,
+        "update_ms": FrameProfiler.summarize(update_ms),
+        "draw_ms": FrameProfiler.summarize(draw_ms),
+        "peak_memory_kb": peak / 1024,
+        "entities": entities,
+        "pools": pools
+    }
+
+
+def run_benchmarks(names=None, ticks=600, warmup=60, seed=0, progress=None):
+    results = {}
+    for scenario_class in SCENARIOS:
+        if names and scenario_class.name not in names:
+            continue
+        if progress:
+            progress(scenario_class.name)
+        results[scenario_class.name] = run_scenario(scenario_class(), ticks, warmup, seed)
+
+    return {
+        "version": BASELINE_VERSION,
+        "ticks": ticks,
+        "seed": seed,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "scenarios": results
+    }
+
+
+def get_metric(result, metric, stat):
+    return result[metric] if stat is None else result[metric][stat]
+
+
+def compare(baseline, current, threshold=0.15):
+    """Return (scenario, metric, baseline, current, change, regressed) rows for every shared scenario"""
+    rows = []
+    for name, result in current["scenarios"].items():
+        reference = baseline["scenarios"].get(name)
+        if reference is None:
+            continue
+        for metric, stat in COMPARED_METRICS:
+            old = get_metric(reference, metric, stat)
+            new = get_metric(result, metric, stat)
+            change = (new - old) / old if old > 0 else 0.0
+            label = metric if stat is None else f"{metric} {stat}"
+            rows.append((name, label, old, new, change, change > threshold))
+    return rows
+
+
+def print_results(results):
+    print(f"{'scenario':<20}  {'update mean':>11}  {'update p95':>10}  {'draw mean':>9}  {'draw p95':>8}  {'peak KB':>9}")
+    for name, result in results["scenarios"].items():
+        print(f"{name:<20}  {result['update_ms']['mean']:>11.3f}  {result['update_ms']['p95']:>10.3f}  "
+              f"{result['draw_ms']['mean']:>9.3f}  {result['draw_ms']['p95']:>8.3f}  {result['peak_memory_kb']:>9.0f}")
+
+
+def print_comparison(rows, threshold):
+    print(f"{'scenario':<20}  {'metric':<16}  {'baseline':>10}  {'current':>10}  {'change':>8}")
+    for name, label, old, new, change, regressed in rows:
+        flag = "  REGRESSION" if regressed else ""
+        print(f"{name:<20}  {label:<16}  {old:>10.3f}  {new:>10.3f}  {change:>+8.1%}{flag}")
+
+    regressions = sum(1 for row in rows if row[5])
+    if regressions:
+        print(f"\n{regressions} metric(s) regressed by more than {threshold:.0%}")
+    else:
+        print(f"\nNo regressions beyond {threshold:.0%}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark Asteroid Dodger stress scenarios")
+    parser.add_argument("--scenarios", default=None,
+                        help="comma-separated scenarios (default: all of " +
+                             ", ".join(scenario.name for scenario in SCENARIOS) + ")")
+    parser.add_argument("--ticks", type=int, default=600, help="measured ticks per scenario")
+    parser.add_argument("--warmup", type=int, default=60, help="unmeasured ticks before measuring")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--save", metavar="PATH", help="write the results to PATH as a JSON baseline")
+    parser.add_argument("--compare", metavar="BASELINE", help="compare the results with a saved baseline")
+    parser.add_argument("--threshold", type=float, default=0.15,
+                        help="relative increase counted as a regression (default: 0.15)")
+    args = parser.parse_args(argv)
+
+    names = [name.strip() for name in args.scenarios.split(",")] if args.scenarios else None
+    known = [scenario.name for scenario in SCENARIOS]
+    if names and set(names) - set(known):
+        parser.error(f"unknown scenarios: {', '.join(sorted(set(names) - set(known)))}")
+
+    results = run_benchmarks(names, args.ticks, args.warmup, args.seed,
+                             progress=lambda name: print(f"Running {name}...", flush=True))
+    print()
+    print_results(results)
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"\nWrote baseline to {args.save}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        print()
+        if baseline.get("ticks") != results["ticks"]:
+            print(f"Warning: the baseline measured {baseline.get('ticks')} ticks per scenario, "
+                  f"this run {results['ticks']}")
+        if print_comparison(compare(baseline, results, args.threshold), args.threshold):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
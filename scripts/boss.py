@@ -2,9 +2,12 @@ import pygame
 import math
 import random
 from .enemy import HomingMissile
+from .text_cache import text_cache
+from .sprite_cache import sprite_cache
 
 class Boss:
-    def __init__(self, x, y, wave, screen_width, screen_height):
+    def __init__(self, x, y, wave, screen_width, screen_height, rng=None):
+        self.rng = rng if rng is not None else random
         self.x = x
         self.y = y
         self.screen_width = screen_width
@@ -23,7 +26,7 @@ class Boss:
         self.target_x = screen_width // 2
         self.target_y = screen_height // 3
         self.movement_timer = 0
-        self.movement_change = random.uniform(3, 6)
+        self.movement_change = self.rng.uniform(3, 6)
         
         # Attack patterns
         self.attack_timer = 0
@@ -36,6 +39,7 @@ class Boss:
         self.rotation_speed = 0.01
         self.color = self.get_boss_color()
         self.points = self.generate_boss_points()
+        self.shape_key = (self.type, self.radius)  # The outline only depends on these
         
         # Special abilities based on boss type
         self.special_timer = 0
@@ -112,9 +116,9 @@ class Boss:
         self.movement_timer += dt
         if self.movement_timer >= self.movement_change:
             self.movement_timer = 0
-            self.movement_change = random.uniform(3, 6)
-            self.target_x = random.randint(self.radius, self.screen_width - self.radius)
-            self.target_y = random.randint(self.radius, self.screen_height // 2)
+            self.movement_change = self.rng.uniform(3, 6)
+            self.target_x = self.rng.randint(self.radius, self.screen_width - self.radius)
+            self.target_y = self.rng.randint(self.radius, self.screen_height // 2)
         
         # Move towards target position
         dx = self.target_x - self.x
@@ -129,7 +133,7 @@ class Boss:
         self.attack_timer += dt
         if self.attack_timer >= self.attack_cooldown:
             self.attack_timer = 0
-            self.attack_cooldown = random.uniform(1.5, 3.0)
+            self.attack_cooldown = self.rng.uniform(1.5, 3.0)
             self.perform_attack(player, particle_system)
         
         # Update special ability timer
@@ -152,16 +156,16 @@ class Boss:
         
         if self.attack_pattern == 0:
             # Single missile attack
-            missile = HomingMissile(self.x, self.y, player, self.wave)
+            missile = HomingMissile(self.x, self.y, player, self.wave, self.rng)
             self.missiles.append(missile)
             
         elif self.attack_pattern == 1:
             # Triple missile attack
             for i in range(3):
-                angle = random.uniform(0, 2 * math.pi)
+                angle = self.rng.uniform(0, 2 * math.pi)
                 offset_x = math.cos(angle) * self.radius
                 offset_y = math.sin(angle) * self.radius
-                missile = HomingMissile(self.x + offset_x, self.y + offset_y, player, self.wave)
+                missile = HomingMissile(self.x + offset_x, self.y + offset_y, player, self.wave, self.rng)
                 self.missiles.append(missile)
                 
         else:
@@ -194,8 +198,8 @@ class Boss:
             
             # Visual effect for healing
             for _ in range(20):
-                angle = random.uniform(0, 2 * math.pi)
-                distance = random.uniform(0, self.radius)
+                angle = self.rng.uniform(0, 2 * math.pi)
+                distance = self.rng.uniform(0, self.radius)
                 particle_system.create_healing_particle(
                     self.x + math.cos(angle) * distance,
                     self.y + math.sin(angle) * distance
@@ -204,10 +208,10 @@ class Boss:
         else:  # boss_3
             # Boss 3: Missile barrage - launch many missiles
             for _ in range(5):
-                angle = random.uniform(0, 2 * math.pi)
+                angle = self.rng.uniform(0, 2 * math.pi)
                 offset_x = math.cos(angle) * self.radius
                 offset_y = math.sin(angle) * self.radius
-                missile = HomingMissile(self.x + offset_x, self.y + offset_y, player, self.wave)
+                missile = HomingMissile(self.x + offset_x, self.y + offset_y, player, self.wave, self.rng)
                 self.missiles.append(missile)
     
     def take_damage(self, damage, particle_system):
@@ -242,23 +246,12 @@ class Boss:
                          bar_width * health_percent, bar_height))
         
         # Draw boss name
-        font = pygame.font.SysFont(None, 24)
-        name_text = font.render(f"{self.type.upper()}", True, (255, 255, 255))
+        name_text = text_cache.render(text_cache.get_font(24), self.type.upper(), (255, 255, 255))
         screen.blit(name_text, (self.x - name_text.get_width() // 2, self.y - self.radius - 40))
         
-        # Draw the boss
-        transformed_points = []
-        for point in self.points:
-            # Rotate
-            rotated_x = point[0] * math.cos(self.rotation) - point[1] * math.sin(self.rotation)
-            rotated_y = point[0] * math.sin(self.rotation) + point[1] * math.cos(self.rotation)
-            
-            # Translate
-            transformed_points.append((rotated_x + self.x, rotated_y + self.y))
-        
-        # Draw the boss shape
-        pygame.draw.polygon(screen, self.color, transformed_points)
-        pygame.draw.polygon(screen, (255, 255, 255), transformed_points, 2)
+        # Draw the boss shape from its pre-rendered rotation frames
+        sprite_cache.draw(screen, self.shape_key, self.points, self.color, self.x, self.y, self.rotation,
+                          outline_width=2)
         
         # Draw core
         pygame.draw.circle(screen, (255, 255, 255), (int(self.x), int(self.y)), int(self.radius * 0.3))
@@ -1,7 +1,8 @@
 import pygame
 import random
 import math
-from .particle import ParticleSystem
+from .particle import create_particle_system
+from .text_cache import text_cache, SharedFont
 
 class Sector:
     def __init__(self, name, description, difficulty, background_type, special_feature=None):
@@ -71,6 +72,12 @@ class Sector:
 
 
 class Campaign:
+    # Fonts (loaded on first use)
+    font_title = SharedFont(48)
+    font_large = SharedFont(36)
+    font_medium = SharedFont(28)
+    font_small = SharedFont(20)
+    
     def __init__(self, width, height):
         self.width = width
         self.height = height
@@ -79,12 +86,6 @@ class Campaign:
         self.map_scroll_x = 0
         self.selected_sector = 0
         
-        # Load fonts
-        self.font_title = pygame.font.SysFont(None, 48)
-        self.font_large = pygame.font.SysFont(None, 36)
-        self.font_medium = pygame.font.SysFont(None, 28)
-        self.font_small = pygame.font.SysFont(None, 20)
-        
         # Create buttons
         self.start_button = {
             'rect': pygame.Rect(width // 2 - 100, height - 80, 200, 50),
@@ -99,7 +100,7 @@ class Campaign:
         }
         
         # Create particle system for map
-        self.particle_system = ParticleSystem()
+        self.particle_system = create_particle_system(capacity=1024)
         
         # Create background stars
         self.background_stars = []
@@ -111,7 +112,8 @@ class Campaign:
                 'brightness': random.randint(100, 255)
             })
     
-    def create_sectors(self):
+    @staticmethod
+    def create_sectors():
         """Create all campaign sectors"""
         sectors = [
             Sector("Training Grounds", "Learn the basics of asteroid dodging", 1, "space"),
@@ -121,7 +123,7 @@ class Campaign:
             Sector("Fire Sector", "Avoid solar flares and hot asteroids", 4, "fire", "solar_flares"),
             Sector("Toxic Zone", "Poisonous gas clouds slow your ship", 4, "toxic", "toxic_clouds"),
             Sector("Black Hole Cluster", "Navigate around dangerous black holes", 5, "space", "black_holes"),
-            Sector("Wormhole Nexus", "Unpredictable wormholes teleport asteroids", 5, "nebula", "wormholes")
+            Sector("Wormhole Nexus", "Linked wormholes teleport anything that enters them", 5, "nebula", "wormholes")
         ]
         
         # Add special mission types
@@ -249,7 +251,7 @@ class Campaign:
         self.particle_system.draw(screen)
         
         # Draw campaign title
-        title_text = self.font_title.render("CAMPAIGN MODE", True, (255, 255, 255))
+        title_text = text_cache.render(self.font_title, "CAMPAIGN MODE", (255, 255, 255))
         screen.blit(title_text, (self.width // 2 - title_text.get_width() // 2, 50))
         
         # Draw sector map
@@ -304,7 +306,7 @@ class Campaign:
             pygame.draw.circle(screen, outer_color, (int(x), int(y)), 40, 3)
             
             # Draw sector number
-            num_text = self.font_large.render(str(i + 1), True, (255, 255, 255))
+            num_text = text_cache.render(self.font_large, str(i + 1), (255, 255, 255))
             screen.blit(num_text, (x - num_text.get_width() // 2, y - num_text.get_height() // 2))
             
             # Draw stars if completed
@@ -328,21 +330,21 @@ class Campaign:
         sector = self.get_current_sector()
         if sector:
             # Draw sector name
-            name_text = self.font_large.render(sector.name, True, (255, 255, 255))
+            name_text = text_cache.render(self.font_large, sector.name, (255, 255, 255))
             screen.blit(name_text, (self.width // 2 - name_text.get_width() // 2, self.height - 200))
             
             # Draw sector description
-            desc_text = self.font_medium.render(sector.description, True, (200, 200, 200))
+            desc_text = text_cache.render(self.font_medium, sector.description, (200, 200, 200))
             screen.blit(desc_text, (self.width // 2 - desc_text.get_width() // 2, self.height - 160))
             
             # Draw difficulty
-            diff_text = self.font_medium.render(f"Difficulty: {'★' * sector.difficulty}", True, (255, 200, 0))
+            diff_text = text_cache.render(self.font_medium, f"Difficulty: {'★' * sector.difficulty}", (255, 200, 0))
             screen.blit(diff_text, (self.width // 2 - diff_text.get_width() // 2, self.height - 130))
             
             # Draw special feature if any
             if sector.special_feature:
                 feature_name = sector.special_feature.replace('_', ' ').title()
-                feature_text = self.font_medium.render(f"Special: {feature_name}", True, (0, 200, 255))
+                feature_text = text_cache.render(self.font_medium, f"Special: {feature_name}", (0, 200, 255))
                 screen.blit(feature_text, (self.width // 2 - feature_text.get_width() // 2, self.height - 100))
     
     def draw_buttons(self, screen):
@@ -354,7 +356,7 @@ class Campaign:
         pygame.draw.rect(screen, start_color, self.start_button['rect'])
         pygame.draw.rect(screen, (100, 255, 100), self.start_button['rect'], 2)
         
-        start_text = self.font_medium.render(self.start_button['text'], True, (255, 255, 255))
+        start_text = text_cache.render(self.font_medium, self.start_button['text'], (255, 255, 255))
         start_text_rect = start_text.get_rect(center=self.start_button['rect'].center)
         screen.blit(start_text, start_text_rect)
         
@@ -363,6 +365,6 @@ class Campaign:
         pygame.draw.rect(screen, back_color, self.back_button['rect'])
         pygame.draw.rect(screen, (255, 100, 100), self.back_button['rect'], 2)
         
-        back_text = self.font_medium.render(self.back_button['text'], True, (255, 255, 255))
+        back_text = text_cache.render(self.font_medium, self.back_button['text'], (255, 255, 255))
         back_text_rect = back_text.get_rect(center=self.back_button['rect'].center)
         screen.blit(back_text, back_text_rect)
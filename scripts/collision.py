@@ -0,0 +1,260 @@
+import math
+from collections import OrderedDict
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, the pairs are tested one by one without it
+    np = None
+
+# Below this many pairs NumPy's per-call overhead costs more than testing them one by one
+MIN_BATCH_SIZE = 64
+
+
+def sweep_time(start_x, start_y, move_x, move_y, radius):
+    """Return the earliest t in [0, 1] at which start + t * move is within radius of the origin, or None"""
+    # Solve |start + t * move|^2 = radius^2 for the first root
+    c = start_x * start_x + start_y * start_y - radius * radius
+    if c < 0:
+        return 0.0  # Already overlapping at the start
+    a = move_x * move_x + move_y * move_y
+    if a == 0:
+        return None
+    b = 2 * (start_x * move_x + start_y * move_y)
+    discriminant = b * b - 4 * a * c
+    if discriminant < 0:
+        return None
+    t = (-b - math.sqrt(discriminant)) / (2 * a)
+    return t if 0 <= t <= 1 else None
+
+
+def find_sweep_hits(start_x, start_y, move_x, move_y, radius):
+    """Sweep many moving points against circles around the origin at once.
+
+    Each argument is a sequence with one entry per pair (usually a moving
+    shape relative to another, with the radii summed). Returns (t, index)
+    for every pair that touches within the step, t being the earliest
+    time of contact in [0, 1].
+    """
+    if np is None or len(start_x) < MIN_BATCH_SIZE:
+        hits = []
+        for index, pair in enumerate(zip(start_x, start_y, move_x, move_y, radius)):
+            t = sweep_time(*pair)
+            if t is not None:
+                hits.append((t, index))
+        return hits
+
+    start_x = np.asarray(start_x, float)
+    start_y = np.asarray(start_y, float)
+    move_x = np.asarray(move_x, float)
+    move_y = np.asarray(move_y, float)
+    radius = np.asarray(radius, float)
+
+    a = move_x * move_x + move_y * move_y
+    b = 2 * (start_x * move_x + start_y * move_y)
+    c = start_x * start_x + start_y * start_y - radius * radius
+    discriminant = b * b - 4 * a * c
+
+    # First root of the quadratic where it exists (pairs that don't move never hit on the way)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t = (-b - np.sqrt(np.maximum(discriminant, 0))) / (2 * a)
+    t = np.where((a > 0) & (discriminant >= 0), t, np.inf)
+    t = np.where(c < 0, 0.0, t)
+
+    indices = np.flatnonzero((t >= 0) & (t <= 1))
+    return list(zip(t[indices].tolist(), indices.tolist()))
+
+
+def convex_hull(points):
+    """Return the convex hull of a set of points, counter-clockwise (Andrew's monotone chain)"""
+    points = sorted(set(points))
+    if len(points) < 3:
+        return tuple(points)
+
+    def cross(o, a, b):
+        return (a[0] - o[0]) * (b[1] - o[1]) - (a[1] - o[1]) * (b[0] - o[0])
+
+    lower = []
+    for point in points:
+        while len(lower) >= 2 and cross(lower[-2], lower[-1], point) <= 0:
+            lower.pop()
+        lower.append(point)
+    upper = []
+    for point in reversed(points):
+        while len(upper) >= 2 and cross(upper[-2], upper[-1], point) <= 0:
+            upper.pop()
+        upper.append(point)
+    return tuple(lower[:-1] + upper[:-1])
+
+
+def segment_distance_sq(px, py, ax, ay, bx, by):
+    """Squared distance from a point to the segment a-b"""
+    dx = bx - ax
+    dy = by - ay
+    length_sq = dx * dx + dy * dy
+    t = 0.0 if length_sq == 0 else max(0.0, min(1.0, ((px - ax) * dx + (py - ay) * dy) / length_sq))
+    ex = ax + t * dx - px
+    ey = ay + t * dy - py
+    return ex * ex + ey * ey
+
+
+def segments_cross(ax, ay, bx, by, cx, cy, dx, dy):
+    """Whether the segments a-b and c-d intersect (touching counts)"""
+    d1 = (bx - ax) * (cy - ay) - (by - ay) * (cx - ax)
+    d2 = (bx - ax) * (dy - ay) - (by - ay) * (dx - ax)
+    d3 = (dx - cx) * (ay - cy) - (dy - cy) * (ax - cx)
+    d4 = (dx - cx) * (by - cy) - (dy - cy) * (bx - cx)
+    return d1 * d2 <= 0 and d3 * d4 <= 0
+
+
+class ConvexHull:
+    """Convex hull of a polygon in its own (unrotated) frame, with SAT overlap tests.
+
+    Tests take shapes already transformed into the hull's frame, so a
+    rotated object is handled by rotating the few query points instead of
+    regenerating the hull.
+    """
+    def __init__(self, points):
+        self.points = convex_hull(points)
+        self.radius = max(math.hypot(x, y) for x, y in self.points)
+
+        # Edges with outward unit normals and their offset from the origin
+        self.edges = []
+        count = len(self.points)
+        for i in range(count):
+            ax, ay = self.points[i]
+            bx, by = self.points[(i + 1) % count]
+            length = math.hypot(bx - ax, by - ay) or 1.0
+            nx = (by - ay) / length
+            ny = (ax - bx) / length
+            self.edges.append((ax, ay, bx, by, nx, ny, nx * ax + ny * ay))
+
+    def contains(self, x, y):
+        for _, _, _, _, nx, ny, offset in self.edges:
+            if nx * x + ny * y > offset:
+                return False
+        return True
+
+    def overlaps_circle(self, x, y, radius):
+        # Separated along an edge normal
+        inside = True
+        for _, _, _, _, nx, ny, offset in self.edges:
+            distance = nx * x + ny * y - offset
+            if distance > radius:
+                return False
+            if distance > 0:
+                inside = False
+        if inside:
+            return True
+
+        # Near a corner the nearest point on the outline decides
+        radius_sq = radius * radius
+        return any(segment_distance_sq(x, y, ax, ay, bx, by) <= radius_sq
+                   for ax, ay, bx, by, _, _, _ in self.edges)
+
+    def overlaps_polygon(self, points):
+        """SAT test against a convex polygon given in this hull's frame"""
+        # Axes of this hull
+        for _, _, _, _, nx, ny, offset in self.edges:
+            if min(nx * x + ny * y for x, y in points) > offset:
+                return False
+
+        # Axes of the other polygon
+        count = len(points)
+        for i in range(count):
+            ax, ay = points[i]
+            bx, by = points[(i + 1) % count]
+            nx = by - ay
+            ny = ax - bx
+            theirs = [nx * x + ny * y for x, y in points]
+            ours = [nx * x + ny * y for x, y in self.points]
+            if min(theirs) > max(ours) or max(theirs) < min(ours):
+                return False
+        return True
+
+    def overlaps_capsule(self, x0, y0, x1, y1, radius):
+        """Whether a circle swept from (x0, y0) to (x1, y1) touches the hull"""
+        if self.contains(x0, y0) or self.contains(x1, y1):
+            return True
+        radius_sq = radius * radius
+        for ax, ay, bx, by, _, _, _ in self.edges:
+            if (segments_cross(x0, y0, x1, y1, ax, ay, bx, by)
+                    or segment_distance_sq(ax, ay, x0, y0, x1, y1) <= radius_sq
+                    or segment_distance_sq(x0, y0, ax, ay, bx, by) <= radius_sq
+                    or segment_distance_sq(x1, y1, ax, ay, bx, by) <= radius_sq):
+                return True
+        return False
+
+
+class HullCache:
+    """Convex hulls of polygon shapes, built once per shape.
+
+    Shapes are keyed by identity: asteroids share the shape library's
+    vertex tuples and the player and bosses keep theirs for their whole
+    life. Each entry holds a reference to its shape, so an id can't be
+    reused while it is cached. The oldest entries are evicted once
+    max_hulls is exceeded.
+    """
+    def __init__(self, max_hulls=1024):
+        self.max_hulls = max_hulls
+        self.hulls = OrderedDict()
+
+    def get(self, points):
+        entry = self.hulls.get(id(points))
+        if entry is not None and entry[0] is points:
+            return entry[1]
+
+        hull = ConvexHull(points)
+        self.hulls[id(points)] = (points, hull)
+        if len(self.hulls) > self.max_hulls:
+            self.hulls.popitem(last=False)
+        return hull
+
+    def clear(self):
+        self.hulls.clear()
+
+
+# Shared instance used by the collision checks
+hull_cache = HullCache()
+
+
+def to_local(x, y, shape):
+    """Transform a world point into the unrotated frame of a shape (an object with x, y and rotation)"""
+    dx = x - shape.x
+    dy = y - shape.y
+    cos_r = math.cos(shape.rotation)
+    sin_r = math.sin(shape.rotation)
+    return dx * cos_r + dy * sin_r, -dx * sin_r + dy * cos_r
+
+
+def get_bounding_radius(obj):
+    """Radius of the circle around an object's whole outline, used before the polygon test"""
+    points = getattr(obj, "points", None)
+    if points is None:
+        return obj.radius
+    return hull_cache.get(points).radius
+
+
+def get_world_hull(points, x, y, rotation, scale=1.0):
+    """Return the convex hull of a shape placed in the world"""
+    cos_r = math.cos(rotation) * scale
+    sin_r = math.sin(rotation) * scale
+    return [(px * cos_r - py * sin_r + x, px * sin_r + py * cos_r + y)
+            for px, py in hull_cache.get(points).points]
+
+
+def circle_hits_shape(x, y, radius, shape):
+    """Polygon-accurate test of a circle against a shape whose bounding circle it already touches"""
+    local_x, local_y = to_local(x, y, shape)
+    return hull_cache.get(shape.points).overlaps_circle(local_x, local_y, radius)
+
+
+def polygon_hits_shape(points, shape):
+    """SAT test of a convex polygon in world space against a shape"""
+    return hull_cache.get(shape.points).overlaps_polygon([to_local(x, y, shape) for x, y in points])
+
+
+def path_hits_shape(x0, y0, x1, y1, radius, shape):
+    """Test a circle moving along a path (relative to the shape's current position) against a shape"""
+    local_x0, local_y0 = to_local(x0, y0, shape)
+    local_x1, local_y1 = to_local(x1, y1, shape)
+    return hull_cache.get(shape.points).overlaps_capsule(local_x0, local_y0, local_x1, local_y1, radius)
@@ -0,0 +1,66 @@
+import pygame
+
+class DirtyRectRenderer:
+    """Redraws and presents only the parts of the screen that changed.
+
+    At the start of a frame the regions drawn last frame are restored from a
+    static background surface. Draw code then adds the rects it draws into,
+    and present() sends the old and new regions to the display with
+    pygame.display.update(rects). When the changed area gets large, or
+    invalidate() was called, it falls back to a full redraw and flip.
+    """
+    def __init__(self, screen, full_redraw_ratio=0.5, max_rects=600):
+        self.screen = screen
+        self.screen_rect = screen.get_rect()
+        self.background = pygame.Surface(self.screen_rect.size)
+        self.full_redraw_ratio = full_redraw_ratio
+        self.max_rects = max_rects
+
+        self.previous_rects = []
+        self.rects = []
+        self.full_redraw = True
+
+    def invalidate(self):
+        """Force the next frame to redraw and present the whole screen"""
+        self.full_redraw = True
+
+    def begin_frame(self):
+        """Erase last frame's drawing by restoring the background underneath it"""
+        if self.full_redraw:
+            self.screen.blit(self.background, (0, 0))
+        else:
+            for rect in self.previous_rects:
+                self.screen.blit(self.background, rect, rect)
+
+    def add(self, rect):
+        rect = self.screen_rect.clip(rect)
+        if rect.width and rect.height:
+            self.rects.append(rect)
+
+    def add_rects(self, rects):
+        for rect in rects:
+            self.add(rect)
+
+    def add_circle(self, x, y, extent):
+        """Add the square around a circle of the given extent"""
+        extent = int(extent) + 1
+        self.add(pygame.Rect(int(x) - extent, int(y) - extent, extent * 2, extent * 2))
+
+    def present(self):
+        """Update the display with everything that changed since the last frame"""
+        update_rects = self.previous_rects + self.rects
+
+        # Old and new regions mostly overlap (objects move a few pixels per frame),
+        # so this frame's drawn area is a good estimate of the cost of the update
+        area = sum(rect.width * rect.height for rect in self.rects)
+        screen_area = self.screen_rect.width * self.screen_rect.height
+
+        if (self.full_redraw or len(update_rects) > self.max_rects
+                or area > screen_area * self.full_redraw_ratio):
+            pygame.display.flip()
+        else:
+            pygame.display.update(update_rects)
+
+        self.previous_rects = self.rects
+        self.rects = []
+        self.full_redraw = False
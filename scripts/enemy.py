@@ -2,9 +2,12 @@ import pygame
 import math
 import random
 from .asteroid import Asteroid
+from .shape_library import shape_library
+from .surface_cache import surface_cache
 
 class HomingMissile:
-    def __init__(self, x, y, target, wave):
+    def __init__(self, x, y, target, wave, rng=None):
+        rng = rng if rng is not None else random
         self.x = x
         self.y = y
         self.target = target  # The player object to track
@@ -12,7 +15,7 @@ class HomingMissile:
         self.speed = 2.0 + (wave * 0.1)  # Increases with wave number
         self.max_speed = 4.0 + (wave * 0.1)
         self.turn_rate = 0.03  # How quickly it can change direction
-        self.angle = random.uniform(0, 2 * math.pi)  # Initial random direction
+        self.angle = rng.uniform(0, 2 * math.pi)  # Initial random direction
         self.health = 1
         self.damage = 1
         self.fuel = 10.0  # Seconds of fuel before it self-destructs
@@ -82,9 +85,10 @@ class HomingMissile:
 
 
 class SpinningBlade(Asteroid):
-    def __init__(self, x, y, wave):
+    def __init__(self, x, y, wave, rng=None):
         # Initialize with medium asteroid properties
-        super().__init__(x, y, "medium", random.uniform(0, 2 * math.pi), wave)
+        rng = rng if rng is not None else random
+        super().__init__(x, y, "medium", rng.uniform(0, 2 * math.pi), wave, rng)
         
         # Override some properties
         self.type = "blade"
@@ -95,23 +99,7 @@ class SpinningBlade(Asteroid):
         self.rotation_speed = 0.1  # Faster rotation
         
         # Create blade shape
-        self.points = self.generate_blade_points()
-    
-    def generate_blade_points(self):
-        """Generate a blade-like shape"""
-        points = []
-        num_points = 8
-        angle_step = 2 * math.pi / num_points
-        
-        for i in range(num_points):
-            angle = i * angle_step
-            # Create alternating long and short points
-            r = self.radius * (1.5 if i % 2 == 0 else 0.7)
-            x = math.cos(angle) * r
-            y = math.sin(angle) * r
-            points.append((x, y))
-        
-        return points
+        self.shape_key, self.points = shape_library.pick_shape("blade", self.rng)
     
     def split(self, wave):
         """Split into smaller blades when destroyed"""
@@ -119,18 +107,20 @@ class SpinningBlade(Asteroid):
         for _ in range(3):
             # Create smaller blade fragments
             fragment = SpinningBladeFragment(
-                self.x + random.uniform(-10, 10),
-                self.y + random.uniform(-10, 10),
-                wave
+                self.x + self.rng.uniform(-10, 10),
+                self.y + self.rng.uniform(-10, 10),
+                wave,
+                self.rng
             )
             fragments.append(fragment)
         return fragments
 
 
 class SpinningBladeFragment(Asteroid):
-    def __init__(self, x, y, wave):
+    def __init__(self, x, y, wave, rng=None):
         # Initialize with small asteroid properties
-        super().__init__(x, y, "small", random.uniform(0, 2 * math.pi), wave)
+        rng = rng if rng is not None else random
+        super().__init__(x, y, "small", rng.uniform(0, 2 * math.pi), wave, rng)
         
         # Override some properties
         self.type = "blade_fragment"
@@ -141,29 +131,14 @@ class SpinningBladeFragment(Asteroid):
         self.rotation_speed = 0.2  # Even faster rotation
         
         # Create blade fragment shape
-        self.points = self.generate_blade_fragment_points()
-    
-    def generate_blade_fragment_points(self):
-        """Generate a blade fragment shape"""
-        points = []
-        num_points = 5
-        angle_step = 2 * math.pi / num_points
-        
-        for i in range(num_points):
-            angle = i * angle_step
-            # Create jagged shape
-            r = self.radius * (1.3 if i % 2 == 0 else 0.8)
-            x = math.cos(angle) * r
-            y = math.sin(angle) * r
-            points.append((x, y))
-        
-        return points
+        self.shape_key, self.points = shape_library.pick_shape("blade_fragment", self.rng)
 
 
 class CrystalAsteroid(Asteroid):
-    def __init__(self, x, y, wave):
+    def __init__(self, x, y, wave, rng=None):
         # Initialize with medium asteroid properties
-        super().__init__(x, y, "medium", random.uniform(0, 2 * math.pi), wave)
+        rng = rng if rng is not None else random
+        super().__init__(x, y, "medium", rng.uniform(0, 2 * math.pi), wave, rng)
         
         # Override some properties
         self.type = "crystal"
@@ -176,35 +151,24 @@ class CrystalAsteroid(Asteroid):
         self.rotation_speed = 0.01  # Slow rotation
         
         # Create crystal shape
-        self.points = self.generate_crystal_points()
+        self.shape_key, self.points = shape_library.pick_shape("crystal", self.rng)
         
         # Shimmer effect
         self.shimmer_time = 0
     
-    def generate_crystal_points(self):
-        """Generate a crystal-like shape"""
-        points = []
-        num_points = 6
-        angle_step = 2 * math.pi / num_points
-        
-        for i in range(num_points):
-            angle = i * angle_step
-            # Create crystal shape with some randomness
-            r = self.radius * (1.0 + random.uniform(-0.1, 0.3))
-            x = math.cos(angle) * r
-            y = math.sin(angle) * r
-            points.append((x, y))
-        
-        return points
-    
     def update(self, dt):
         # Call parent update method
         super().update(dt)
-        
+        self.update_effects(dt)
+    
+    def update_effects(self, dt):
         # Update shimmer effect
         self.shimmer_time += dt
         shimmer = (math.sin(self.shimmer_time * 5) + 1) / 2  # 0 to 1
         
+        # Quantise the shimmer so only a few color variants need cached sprites
+        shimmer = round(shimmer * 8) / 8
+        
         # Make the crystal shimmer by adjusting its color
         r = min(255, int(self.base_color[0] + shimmer * 50))
         g = min(255, int(self.base_color[1] + shimmer * 50))
@@ -214,14 +178,7 @@ class CrystalAsteroid(Asteroid):
     def draw(self, screen):
         # Draw the crystal with a glow effect
         glow_radius = self.radius * 1.2
-        glow_surface = pygame.Surface((int(glow_radius * 2), int(glow_radius * 2)), pygame.SRCALPHA)
-        
-        # Draw glow
-        for i in range(3):
-            alpha = 100 - i * 30
-            r = glow_radius - i * 2
-            pygame.draw.circle(glow_surface, (*self.color, alpha), 
-                              (int(glow_radius), int(glow_radius)), int(r))
+        glow_surface = surface_cache.get_glow(glow_radius, self.color)
         
         # Blit the glow
         screen.blit(glow_surface, (int(self.x - glow_radius), int(self.y - glow_radius)))
@@ -0,0 +1,280 @@
+import math
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, plain lists are used without it
+    np = None
+
+
+# Rows of an EntityStore's column table. The two velocity rows hold angle and
+# speed in "polar" stores and velocity_x and velocity_y in "cartesian" ones.
+X, Y, PREV_X, PREV_Y, VELOCITY_1, VELOCITY_2, RADIUS, LIFETIME, ROTATION, ROTATION_SPEED = range(10)
+ROW_COUNT = 10
+
+
+class Column:
+    """Entity attribute that lives in its EntityStore's column table while the entity is stored.
+
+    Reads and writes go straight to the entity's slot in the table, so the
+    store's batch update and code that moves a single entity (bounces,
+    black holes, wormholes) share one copy of the state. Outside a store
+    (before it is added, after it is removed, or without NumPy) the value
+    is kept in the instance slot "_<name>". Optional columns hold None as NaN.
+    """
+    def __init__(self, row, optional=False):
+        self.row = row
+        self.optional = optional
+
+    def __set_name__(self, owner, name):
+        self.name = name
+        self.local = owner.__dict__["_" + name]
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        store = obj.store
+        if store is None:
+            return self.local.__get__(obj, owner)
+        value = store.data.item(self.row, obj.store_index)
+        if self.optional and value != value:
+            return None
+        return value
+
+    def __set__(self, obj, value):
+        store = obj.store
+        if store is None:
+            self.local.__set__(obj, value)
+        else:
+            store.data[self.row, obj.store_index] = math.nan if value is None else value
+
+
+# class -> its Column descriptors
+class_columns = {}
+
+
+def get_columns(cls):
+    columns = class_columns.get(cls)
+    if columns is None:
+        columns = [value for klass in reversed(cls.__mro__) for value in vars(klass).values()
+                   if isinstance(value, Column)]
+        class_columns[cls] = columns
+    return columns
+
+
+class EntityStore:
+    """List-like container that keeps its entities' state in NumPy columns.
+
+    Position, previous position, velocity, radius, lifetime and rotation of
+    every entity are rows of one column table, and the table is the only
+    copy: the wrapper objects declare those attributes as Column
+    descriptors that read and write their entity's slot. update() moves,
+    spins, ages and culls every entity in a few vectorised operations
+    without touching the wrappers, which keep their type-specific behaviour.
+    Wrappers with an update_effects(dt) method (e.g. the crystal shimmer)
+    have it called after the batch move.
+
+    velocity selects what the velocity rows hold: "polar" stores angle and
+    speed, "cartesian" stores velocity_x and velocity_y. Stores created with
+    rotates=False don't advance rotation. Every entity knows its slot
+    (store_index), so membership tests and removal are O(1); removal moves
+    the last entity into the freed slot, so iteration order isn't stable.
+    """
+    def __init__(self, velocity="polar", cull_buffer=0, cull_radius=False, capacity=256, rotates=True):
+        self.velocity = velocity
+        self.rotates = rotates
+        self.cull_buffer = cull_buffer
+        self.cull_radius = cull_radius
+
+        self.objects = []
+        self.capacity = capacity
+        self.data = np.zeros((ROW_COUNT, capacity))
+
+        # Objects whose class adds per-tick behaviour on top of plain motion
+        self.effect_objects = []
+
+    # List interface used by the game code
+
+    def __len__(self):
+        return len(self.objects)
+
+    def __iter__(self):
+        return iter(self.objects)
+
+    def __getitem__(self, index):
+        return self.objects[index]
+
+    def __contains__(self, obj):
+        return getattr(obj, "store", None) is self
+
+    def __add__(self, other):
+        return self.objects + list(other)
+
+    def __radd__(self, other):
+        return list(other) + self.objects
+
+    def __bool__(self):
+        return bool(self.objects)
+
+    def append(self, obj):
+        index = len(self.objects)
+        if index == self.capacity:
+            self.grow()
+
+        # Move the entity's state from its own slots into the table
+        data = self.data
+        data[:, index] = 0.0
+        data[LIFETIME, index] = math.inf
+        for column in get_columns(type(obj)):
+            value = column.local.__get__(obj)
+            data[column.row, index] = math.nan if value is None else value
+
+        obj.store = self
+        obj.store_index = index
+        self.objects.append(obj)
+        if hasattr(obj, "update_effects"):
+            self.effect_objects.append(obj)
+
+    def extend(self, objects):
+        for obj in objects:
+            self.append(obj)
+
+    def detach(self, obj):
+        """Copy an entity's state back into its own slots"""
+        data = self.data
+        index = obj.store_index
+        for column in get_columns(type(obj)):
+            value = data.item(column.row, index)
+            if column.optional and value != value:
+                value = None
+            column.local.__set__(obj, value)
+        obj.store = None
+
+    def remove(self, obj):
+        index = obj.store_index
+        self.detach(obj)
+
+        # Fill the gap with the last entity
+        last = len(self.objects) - 1
+        if index != last:
+            moved = self.objects[last]
+            self.objects[index] = moved
+            self.data[:, index] = self.data[:, last]
+            moved.store_index = index
+        self.objects.pop()
+
+        if self.effect_objects and hasattr(obj, "update_effects"):
+            self.effect_objects.remove(obj)
+
+    def remove_all(self, objects):
+        """Remove every given entity; returns them as a list"""
+        removed = list(objects)
+        for obj in removed:
+            self.remove(obj)
+        return removed
+
+    def clear(self):
+        for obj in self.objects:
+            self.detach(obj)
+        self.objects.clear()
+        self.effect_objects.clear()
+
+    def grow(self):
+        grown = np.zeros((ROW_COUNT, self.capacity * 2))
+        grown[:, :self.capacity] = self.data
+        self.data = grown
+        self.capacity *= 2
+
+    def column(self, row):
+        """View of one row of the table, one value per stored entity"""
+        return self.data[row, :len(self.objects)]
+
+    def positions(self):
+        """Return (obj, x, y) for every entity, read from the table in one go"""
+        count = len(self.objects)
+        return zip(self.objects, self.data[X, :count].tolist(), self.data[Y, :count].tolist())
+
+    # Batch update
+
+    def store_previous_positions(self):
+        count = len(self.objects)
+        self.data[PREV_X:PREV_Y + 1, :count] = self.data[X:Y + 1, :count]
+
+    def update(self, dt, width, height):
+        """Move every entity, then drop the expired and off-screen ones; returns the culled objects"""
+        count = len(self.objects)
+        if not count:
+            return []
+
+        data = self.data
+        x = data[X, :count]
+        y = data[Y, :count]
+        steps = dt * 60
+        if self.velocity == "polar":
+            angle = data[VELOCITY_1, :count]
+            speed = data[VELOCITY_2, :count]
+            x += np.cos(angle) * speed * steps
+            y += np.sin(angle) * speed * steps
+        else:
+            x += data[VELOCITY_1, :count] * steps
+            y += data[VELOCITY_2, :count] * steps
+        if self.rotates:
+            data[ROTATION, :count] += data[ROTATION_SPEED, :count] * steps
+        lifetime = data[LIFETIME, :count]
+        lifetime -= dt
+
+        # Type-specific behaviour (e.g. crystal shimmer)
+        for obj in self.effect_objects:
+            obj.update_effects(dt)
+
+        # Cull expired and off-screen entities in one pass
+        margin = self.cull_buffer + (data[RADIUS, :count] if self.cull_radius else 0)
+        dead = ((lifetime <= 0) |
+                (x + margin < 0) | (x - margin > width) |
+                (y + margin < 0) | (y - margin > height))
+        if not dead.any():
+            return []
+
+        # Highest slots first, so every entity moved into a gap is a live one
+        culled = [self.objects[index] for index in np.flatnonzero(dead)[::-1].tolist()]
+        for obj in culled:
+            self.remove(obj)
+        return culled
+
+    def interpolate(self, alpha, max_jump_x, max_jump_y):
+        """Move every entity to its position alpha of the way through the last step.
+
+        Entities without a previous position or that jumped further than
+        max_jump (wrapped or teleported) stay where they are. Returns the
+        current positions for restore().
+        """
+        count = len(self.objects)
+        saved = self.data[X:Y + 1, :count].copy()
+        if count:
+            x, y = saved
+            prev_x = self.data[PREV_X, :count]
+            prev_y = self.data[PREV_Y, :count]
+            dx = x - prev_x
+            dy = y - prev_y
+            with np.errstate(invalid="ignore"):
+                smooth = (np.abs(dx) <= max_jump_x) & (np.abs(dy) <= max_jump_y)
+            self.data[X, :count] = np.where(smooth, prev_x + dx * alpha, x)
+            self.data[Y, :count] = np.where(smooth, prev_y + dy * alpha, y)
+        return saved
+
+    def restore(self, saved):
+        """Put the entities back where interpolate() found them"""
+        self.data[X:Y + 1, :saved.shape[1]] = saved
+
+
+def get_positions(entities):
+    """Return (obj, x, y) for every entity in an EntityStore or a plain list"""
+    if isinstance(entities, EntityStore):
+        return entities.positions()
+    return ((obj, obj.x, obj.y) for obj in entities)
+
+
+def create_entity_list(velocity="polar", cull_buffer=0, cull_radius=False, rotates=True):
+    """Return an EntityStore, or a plain list when NumPy isn't available"""
+    if np is not None:
+        return EntityStore(velocity, cull_buffer, cull_radius, rotates=rotates)
+    return []
@@ -0,0 +1,294 @@
+import math
+import multiprocessing
+import numpy as np
+from .hazard import BlackHole, Wormhole, SpaceStorm
+from .enemy import HomingMissile
+from .campaign import Campaign
+from .headless import AutoPilot, create_headless_game
+
+# Actions are INPUT_* bitmasks, so every combination of the five inputs is a valid action
+NUM_ACTIONS = 32
+
+# Observation layout
+MAX_OBJECTS = 16    # Nearest threats (asteroids, missiles, boss)
+OBJECT_FEATURES = 8  # dx, dy, vx, vy, radius, is_asteroid, is_missile, is_boss
+MAX_HAZARDS = 3     # Nearest black holes and wormhole entries
+HAZARD_FEATURES = 5  # dx, dy, radius, is_black_hole, is_wormhole
+PLAYER_FEATURES = 8  # x, y, sin(angle), cos(angle), vx, vy, health, invulnerable
+GLOBAL_FEATURES = 9  # wave, storm, 4 power-up timers, nearest power-up dx, dy, present
+OBSERVATION_SIZE = (PLAYER_FEATURES + GLOBAL_FEATURES +
+                    MAX_OBJECTS * OBJECT_FEATURES + MAX_HAZARDS * HAZARD_FEATURES)
+
+# Reward shaping
+SURVIVAL_REWARD = 0.01    # Per simulated tick
+SCORE_REWARD = 0.01       # Per point scored
+DAMAGE_PENALTY = 1.0      # Per health point lost
+GAME_OVER_PENALTY = 5.0
+
+
+def get_previous_position(obj):
+    """Return an object's position last tick (objects spawned this tick have none yet)"""
+    prev_x = getattr(obj, "prev_x", None)
+    prev_y = getattr(obj, "prev_y", None)
+    return (prev_x if prev_x is not None else obj.x,
+            prev_y if prev_y is not None else obj.y)
+
+
+class AsteroidDodgerEnv:
+    """Gym-style environment around the real Game logic, without rendering.
+
+    reset(seed) returns (observation, info) and step(action) returns
+    (observation, reward, terminated, truncated, info), following the
+    Gymnasium conventions. Actions are INPUT_* bitmasks (0-31). Observations
+    are float32 arrays of OBSERVATION_SIZE values, with positions relative to
+    the player and scaled by the screen size. Between waves the shop is
+    handled automatically (shop="auto" buys the cheapest upgrades, "skip"
+    buys nothing) so episodes run across waves.
+    """
+    def __init__(self, width=800, height=600, sector=None, frame_skip=1, max_steps=None, shop="auto"):
+        self.width = width
+        self.height = height
+        self.sector = sector  # Campaign sector index, or None for arcade mode
+        self.frame_skip = frame_skip
+        self.max_steps = max_steps
+        self.shop = shop
+
+        self.num_actions = NUM_ACTIONS
+        self.observation_size = OBSERVATION_SIZE
+
+        self.game = create_headless_game(width, height)
+        self.shop_pilot = AutoPilot()
+        self.steps = 0
+
+    def reset(self, seed=None):
+        game = self.game
+        game.reset(seed)
+        if self.sector is not None:
+            game.set_campaign_mission(Campaign.create_sectors()[self.sector])
+        self.steps = 0
+        return self.get_observation(), self.get_info()
+
+    def step(self, action):
+        game = self.game
+        reward = 0.0
+        terminated = False
+
+        for _ in range(self.frame_skip):
+            if game.shop_active:
+                if self.shop == "auto":
+                    self.shop_pilot.shop(game)
+                game.close_shop()
+
+            score = game.score
+            health = game.player.health
+
+            game.apply_input(int(action))
+            status = game.update()
+            game.end_frame()
+
+            reward += SURVIVAL_REWARD
+            reward += (game.score - score) * SCORE_REWARD
+            reward -= max(0, health - game.player.health) * DAMAGE_PENALTY
+
+            if status == "game_over":
+                reward -= GAME_OVER_PENALTY
+                terminated = True
+                break
+
+        self.steps += 1
+        truncated = not terminated and self.max_steps is not None and self.steps >= self.max_steps
+        return self.get_observation(), reward, terminated, truncated, self.get_info()
+
+    def get_info(self):
+        game = self.game
+        return {"score": game.score, "wave": game.wave, "health": game.player.health, "steps": self.steps}
+
+    def get_observation(self):
+        game = self.game
+        player = game.player
+        width = self.width
+        height = self.height
+        observation = np.zeros(OBSERVATION_SIZE, dtype=np.float32)
+
+        # Player state
+        observation[0:PLAYER_FEATURES] = (
+            player.x / width, player.y / height,
+            math.sin(player.angle), math.cos(player.angle),
+            player.velocity_x / player.max_speed, player.velocity_y / player.max_speed,
+            player.health / 3, float(player.invulnerable)
+        )
+
+        # Global state
+        offset = PLAYER_FEATURES
+        powerups = game.active_powerups
+        observation[offset:offset + 6] = (
+            game.wave / 10,
+            float(any(isinstance(hazard, SpaceStorm) for hazard in game.hazards)),
+            max(0.0, powerups["shield"]) / 10, max(0.0, powerups["rapid_fire"]) / 10,
+            max(0.0, powerups["slow_motion"]) / 10, max(0.0, powerups["size_shrink"]) / 10
+        )
+        if game.powerups:
+            nearest = min(game.powerups, key=lambda p: (p.x - player.x) ** 2 + (p.y - player.y) ** 2)
+            observation[offset + 6:offset + 9] = ((nearest.x - player.x) / width, (nearest.y - player.y) / height, 1.0)
+        offset += GLOBAL_FEATURES
+
+        # Nearest threats
+        threats = [(obj, 0) for obj in game.asteroids]
+        threats += [(obj, 1) for obj in game.enemies if isinstance(obj, HomingMissile)]
+        threats += [(obj, 0) for obj in game.enemies if not isinstance(obj, HomingMissile)]
+        if game.boss:
+            threats.append((game.boss, 2))
+            threats += [(missile, 1) for missile in game.boss.missiles]
+        self.fill_objects(observation, offset, threats, MAX_OBJECTS)
+        offset += MAX_OBJECTS * OBJECT_FEATURES
+
+        # Nearest hazards
+        hazards = []
+        for hazard in game.hazards:
+            if isinstance(hazard, BlackHole):
+                hazards.append((hazard.x, hazard.y, hazard.pull_radius, 1.0, 0.0))
+            elif isinstance(hazard, Wormhole):
+                hazards += [(x, y, hazard.radius, 0.0, 1.0) for x, y in hazard.portals]
+        hazards.sort(key=lambda h: (h[0] - player.x) ** 2 + (h[1] - player.y) ** 2)
+        for index, (x, y, radius, is_black_hole, is_wormhole) in enumerate(hazards[:MAX_HAZARDS]):
+            start = offset + index * HAZARD_FEATURES
+            observation[start:start + HAZARD_FEATURES] = (
+                (x - player.x) / width, (y - player.y) / height, radius / 100, is_black_hole, is_wormhole)
+
+        return observation
+
+    def fill_objects(self, observation, offset, objects, max_objects):
+        """Write the nearest objects (with their last-tick velocity) into the observation"""
+        if not objects:
+            return
+
+        player = self.game.player
+        count = len(objects)
+        x = np.fromiter((obj.x for obj, kind in objects), float, count)
+        y = np.fromiter((obj.y for obj, kind in objects), float, count)
+        previous = [get_previous_position(obj) for obj, kind in objects]
+        prev_x = np.fromiter((prev_x for prev_x, prev_y in previous), float, count)
+        prev_y = np.fromiter((prev_y for prev_x, prev_y in previous), float, count)
+        radius = np.fromiter((obj.radius for obj, kind in objects), float, count)
+        kinds = np.fromiter((kind for obj, kind in objects), int, count)
+
+        dx = x - player.x
+        dy = y - player.y
+        distance = dx * dx + dy * dy
+        nearest = np.argsort(distance)[:max_objects]
+        shown = len(nearest)
+
+        features = np.zeros((shown, OBJECT_FEATURES), dtype=np.float32)
+        features[:, 0] = dx[nearest] / self.width
+        features[:, 1] = dy[nearest] / self.height
+        features[:, 2] = (x - prev_x)[nearest] / 10
+        features[:, 3] = (y - prev_y)[nearest] / 10
+        features[:, 4] = radius[nearest] / 60
+        features[np.arange(shown), 5 + kinds[nearest]] = 1.0
+        observation[offset:offset + shown * OBJECT_FEATURES] = features.ravel()
+
+    def close(self):
+        pass
+
+
+def worker_loop(connection, env_kwargs, count):
+    """Run a chunk of environments in a worker process, driven by commands from the pipe"""
+    envs = [AsteroidDodgerEnv(**env_kwargs) for _ in range(count)]
+    while True:
+        command, data = connection.recv()
+        if command == "reset":
+            connection.send([env.reset(seed) for env, seed in zip(envs, data)])
+        elif command == "step":
+            connection.send([step_with_autoreset(env, action) for env, action in zip(envs, data)])
+        elif command == "close":
+            connection.close()
+            break
+
+
+def step_with_autoreset(env, action):
+    """Step an environment, resetting it when the episode ends (Gymnasium vector semantics)"""
+    observation, reward, terminated, truncated, info = env.step(action)
+    if terminated or truncated:
+        info["final_observation"] = observation
+        observation, reset_info = env.reset()
+        info["reset_info"] = reset_info
+    return observation, reward, terminated, truncated, info
+
+
+class VectorAsteroidDodgerEnv:
+    """Steps N independent games in lockstep, spread across worker processes.
+
+    reset() and step() take and return batched arrays: observations have
+    shape (num_envs, OBSERVATION_SIZE) and actions, rewards and the
+    terminated/truncated flags have shape (num_envs,). Finished episodes are
+    reset automatically; the last observation is in info["final_observation"].
+    num_workers=0 runs every environment in the calling process.
+    """
+    def __init__(self, num_envs, num_workers=None, **env_kwargs):
+        self.num_envs = num_envs
+        if num_workers is None:
+            num_workers = min(num_envs, multiprocessing.cpu_count())
+        self.num_workers = num_workers
+
+        self.envs = []
+        self.connections = []
+        self.processes = []
+        if num_workers == 0:
+            self.envs = [AsteroidDodgerEnv(**env_kwargs) for _ in range(num_envs)]
+            self.chunks = [num_envs]
+            return
+
+        # Split the environments as evenly as possible across the workers
+        self.chunks = [num_envs // num_workers + (1 if i < num_envs % num_workers else 0)
+                       for i in range(num_workers)]
+        for count in self.chunks:
+            parent, child = multiprocessing.Pipe()
+            process = multiprocessing.Process(target=worker_loop, args=(child, env_kwargs, count), daemon=True)
+            process.start()
+            child.close()
+            self.connections.append(parent)
+            self.processes.append(process)
+
+    def split(self, values):
+        chunks = []
+        start = 0
+        for count in self.chunks:
+            chunks.append(values[start:start + count])
+            start += count
+        return chunks
+
+    def run(self, command, values):
+        if not self.connections:
+            if command == "reset":
+                return [env.reset(seed) for env, seed in zip(self.envs, values)]
+            return [step_with_autoreset(env, action) for env, action in zip(self.envs, values)]
+
+        # Send to every worker first so they all work in parallel, then collect
+        for connection, chunk in zip(self.connections, self.split(values)):
+            connection.send((command, chunk))
+        results = []
+        for connection in self.connections:
+            results.extend(connection.recv())
+        return results
+
+    def reset(self, seed=None):
+        seeds = [None if seed is None else seed + i for i in range(self.num_envs)]
+        results = self.run("reset", seeds)
+        observations = np.stack([observation for observation, info in results])
+        return observations, [info for observation, info in results]
+
+    def step(self, actions):
+        results = self.run("step", [int(action) for action in actions])
+        observations = np.stack([result[0] for result in results])
+        rewards = np.array([result[1] for result in results], dtype=np.float32)
+        terminated = np.array([result[2] for result in results], dtype=bool)
+        truncated = np.array([result[3] for result in results], dtype=bool)
+        return observations, rewards, terminated, truncated, [result[4] for result in results]
+
+    def close(self):
+        for connection in self.connections:
+            connection.send(("close", None))
+        for process in self.processes:
+            process.join()
+        self.connections = []
+        self.processes = []
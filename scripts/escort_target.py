@@ -1,5 +1,6 @@
 import pygame
 import math
+from .text_cache import text_cache
 
 class EscortTarget:
     def __init__(self, x, y, dest_x, dest_y):
@@ -81,8 +82,7 @@ class EscortTarget:
                          bar_width * health_percent, bar_height))
         
         # Draw "ESCORT" text
-        font = pygame.font.SysFont(None, 20)
-        text = font.render("ESCORT", True, (255, 255, 255))
+        text = text_cache.render(text_cache.get_font(20), "ESCORT", (255, 255, 255))
         screen.blit(text, (self.x - text.get_width() // 2, self.y - self.radius - 30))
         
         # Transform points based on position and rotation
@@ -1,34 +1,90 @@
 import pygame
 import random
+import zlib
 import math
+from operator import attrgetter
 from .player import Player
 from .asteroid import Asteroid
 from .powerup import PowerUp
-from .particle import ParticleSystem
+from .particle import create_particle_system
 from .starfield import Starfield
 from .hud import HUD
-from .weapon import Weapon
-from .sound_manager import SoundManager
+from .weapon import Weapon, Projectile
+from .sound_manager import SoundManager, NullSoundManager
+from .collision import (hull_cache, find_sweep_hits, get_bounding_radius, get_world_hull,
+                        circle_hits_shape, polygon_hits_shape, path_hits_shape)
 from .enemy import HomingMissile, SpinningBlade, CrystalAsteroid
 from .boss import Boss
 from .hazard import BlackHole, SpaceStorm, Wormhole
 from .shop import Shop
+from .pool import ObjectPool
+from .spatial_hash import SpatialHash
+from .sort_and_sweep import SortAndSweep
+from .gravity import GravityField
+from .entity_store import EntityStore, X, Y, RADIUS, VELOCITY_1, VELOCITY_2, create_entity_list, get_positions
+from .text_cache import text_cache
+from .surface_cache import surface_cache
+from .profiler import FrameProfiler
+from .dirty_rect import DirtyRectRenderer
+
+# Per-tick input bits used by scripted pilots and replays
+INPUT_FORWARD = 1
+INPUT_BACKWARD = 2
+INPUT_LEFT = 4
+INPUT_RIGHT = 8
+INPUT_FIRE = 16
+
+# Extra broad-phase reach for projectile sweeps, covering how far an asteroid moves in a tick
+SWEEP_QUERY_MARGIN = 8
 
 class Game:
-    def __init__(self, screen, width, height):
+    def __init__(self, screen, width, height, headless=False, seed=None, lazy=False, asteroid_bounce=False):
         self.screen = screen
         self.width = width
         self.height = height
         
+        # Headless games never touch the display, keyboard or mixer
+        self.headless = headless
+        
+        # Length of one simulation step in seconds
+        self.fixed_dt = 1 / 60
+        
+        # Asteroids collide and bounce off each other (off by default, as in the original game)
+        self.asteroid_bounce = asteroid_bounce
+        
+        # Black hole pull on everything that moves
+        self.gravity_field = GravityField()
+        
+        # Per-phase timing (F3 toggles the overlay)
+        self.profiler = FrameProfiler()
+        
+        # Optional input recorder (see scripts/replay.py)
+        self.recorder = None
+        
+        # Optional dirty-rect renderer (see enable_dirty_rects)
+        self.dirty_renderer = None
+        
+        # Reusable plain asteroids and projectiles, kept across resets
+        # (special asteroid types are not pooled)
+        self.asteroid_pool = ObjectPool(Asteroid)
+        self.projectile_pool = ObjectPool(Projectile)
+        
         # Load game assets
         self.load_assets()
         
-        # Create game objects
-        self.reset()
+        # Create game objects. A lazy game only creates the starfield the menu
+        # draws behind it and builds everything else on its first reset().
+        if lazy:
+            self.starfield = Starfield(width, height, 100)
+        else:
+            self.reset(seed)
     
     def load_assets(self):
         # Initialize sound manager
-        self.sound_manager = SoundManager()
+        if self.headless:
+            self.sound_manager = NullSoundManager()
+        else:
+            self.sound_manager = SoundManager(self.width)
         
         # Load images and other assets here
         # This would typically load sprites for the player, asteroids, etc.
@@ -36,26 +92,47 @@ class Game:
         # Create shop system
         self.shop = Shop(self.width, self.height)
         
-    def reset(self):
+    def reset(self, seed=None):
+        # Seed every simulation random source from one value so runs can be reproduced
+        self.seed = seed if seed is not None else random.randrange(2 ** 32)
+        self.rng = random.Random(self.seed)
+        
         # Create the player
         self.player = Player(self.width // 2, self.height // 2, self.width, self.height)
         
         # Create the weapon system
-        self.weapon = Weapon(self.sound_manager)
+        self.weapon = Weapon(self.sound_manager, self.projectile_pool)
         
         # Create the starfield background
-        self.starfield = Starfield(self.width, self.height, 100)
+        self.starfield = Starfield(self.width, self.height, 100, rng=random.Random(self.seed + 1))
         
         # Create the particle system
-        self.particle_system = ParticleSystem()
+        self.particle_system = create_particle_system(seed=self.seed + 2)
+        
+        # The new starfield needs a new static background
+        if self.dirty_renderer:
+            self.refresh_background()
         
         # Create the HUD
         self.hud = HUD(self.width, self.height)
         
+        # Broad-phase grid for collision checks (rebuilt every tick)
+        self.spatial_hash = SpatialHash(cell_size=64)
+        
+        # Broad phase for asteroid-asteroid bounces (kept sorted between ticks)
+        self.asteroid_sweep = SortAndSweep()
+        
+        # Return the previous game's pooled objects
+        if hasattr(self, "asteroids"):
+            self.clear_asteroids()
+            self.projectile_pool.release_all(self.projectiles)
+            self.projectiles.clear()
+        
         # Game state variables
-        self.asteroids = []
+        # Asteroids and projectiles move in NumPy batches when NumPy is available
+        self.asteroids = create_entity_list("polar", cull_buffer=100, cull_radius=True)
         self.powerups = []
-        self.projectiles = []
+        self.projectiles = create_entity_list("cartesian", rotates=False)
         self.enemies = []  # New enemies list (homing missiles, etc.)
         self.hazards = []  # Environmental hazards
         self.boss = None   # Current boss (if any)
@@ -69,6 +146,7 @@ class Game:
         self.game_over = False
         self.paused = False
         self.shop_active = False
+        self.fire_pressed = False
         
         # Game mode
         self.game_mode = "arcade"  # "arcade" or "campaign"
@@ -117,24 +195,54 @@ class Game:
     def handle_event(self, event):
         # Handle shop events if shop is active
         if self.shop_active:
+            points = self.shop.points
             shop_action = self.shop.handle_event(event)
+            if self.recorder:
+                if self.shop.points != points:
+                    self.recorder.record_purchase(self.shop.selected_item)
+                if shop_action == "continue":
+                    self.recorder.record_continue()
             if shop_action == "continue":
-                self.shop_active = False
-                self.start_next_wave()
-                self.apply_upgrades()
+                self.close_shop()
             return None
             
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_ESCAPE:
                 return "pause"
             elif event.key == pygame.K_SPACE:
-                self.fire_weapon()
+                # Fire on the next simulation tick so the shot can be recorded with that tick's input
+                self.fire_pressed = True
+            elif event.key == pygame.K_F3:
+                self.profiler.toggle_overlay()
         
         # Let the player handle its own input
         self.player.handle_input(event)
         
         return None
     
+    def apply_input(self, input_bits):
+        """Drive the player from a bitmask of INPUT_* flags instead of events"""
+        self.player.moving_forward = bool(input_bits & INPUT_FORWARD)
+        self.player.moving_backward = bool(input_bits & INPUT_BACKWARD)
+        self.player.rotating_left = bool(input_bits & INPUT_LEFT)
+        self.player.rotating_right = bool(input_bits & INPUT_RIGHT)
+        self.fire_pressed = bool(input_bits & INPUT_FIRE)
+    
+    def get_input_bits(self):
+        """Return this tick's player input as a bitmask of INPUT_* flags"""
+        input_bits = 0
+        if self.player.moving_forward:
+            input_bits |= INPUT_FORWARD
+        if self.player.moving_backward:
+            input_bits |= INPUT_BACKWARD
+        if self.player.rotating_left:
+            input_bits |= INPUT_LEFT
+        if self.player.rotating_right:
+            input_bits |= INPUT_RIGHT
+        if self.fire_pressed:
+            input_bits |= INPUT_FIRE
+        return input_bits
+    
     def update(self):
         if self.game_over:
             return "game_over"
@@ -143,46 +251,82 @@ class Game:
         if self.shop_active:
             return None
         
-        # Calculate delta time (in seconds)
-        dt = 1 / 60  # Assuming 60 FPS
+        # The simulation always advances by one fixed step
+        dt = self.fixed_dt
+        
+        # Each sound effect plays at most once per tick
+        self.sound_manager.begin_frame(dt)
+        
+        # Objects released last tick can be reused from here on
+        self.asteroid_pool.recycle()
+        self.projectile_pool.recycle()
+        
+        # Record the input that drives this tick
+        if self.recorder:
+            self.recorder.record_tick(self.get_input_bits())
+        
+        # Fire if the fire input arrived since the last tick
+        if self.fire_pressed:
+            self.fire_pressed = False
+            self.fire_weapon()
+        
+        # Remember where everything was so rendering can interpolate
+        self.store_previous_positions()
         
         # Apply slow motion if active
         if self.active_powerups["slow_motion"] > 0:
             dt *= 0.5
             self.active_powerups["slow_motion"] -= dt
         
+        profiler = self.profiler
+        
         # Update timers
-        self.update_timers(dt)
+        with profiler.phase("timers"):
+            self.update_timers(dt)
         
         # Update player
-        self.player.update(dt)
+        with profiler.phase("player"):
+            self.player.update(dt)
         
         # Update weapon and projectiles
-        self.update_weapons(dt)
+        with profiler.phase("weapons"):
+            self.update_weapons(dt)
         
         # Spawn and update asteroids
-        self.update_asteroids(dt)
+        with profiler.phase("asteroids"):
+            self.update_asteroids(dt)
         
         # Spawn and update enemies
-        self.update_enemies(dt)
+        with profiler.phase("enemies"):
+            self.update_enemies(dt)
         
         # Update boss if present
-        self.update_boss(dt)
+        with profiler.phase("boss"):
+            self.update_boss(dt)
         
         # Spawn and update power-ups
-        self.update_powerups(dt)
+        with profiler.phase("powerups"):
+            self.update_powerups(dt)
+        
+        # Index everything that moved for the wormholes and the collision checks
+        with profiler.phase("spatial_hash"):
+            self.rebuild_spatial_hash()
         
         # Update environmental hazards
-        self.update_hazards(dt)
+        with profiler.phase("hazards"):
+            self.update_hazards(dt)
         
         # Update particle effects
-        self.particle_system.update(dt)
+        with profiler.phase("particles"):
+            self.particle_system.update(dt)
         
         # Update starfield
-        self.starfield.update(dt)
+        with profiler.phase("starfield"):
+            self.starfield.update(dt)
         
         # Check for collisions
-        self.check_collisions()
+        with profiler.phase("collisions"):
+            self.check_collisions()
         
         # Count remaining enemies
         enemies_remaining = len(self.asteroids) + len(self.enemies)
@@ -190,13 +334,13 @@ class Game:
             enemies_remaining += 1
         
         # Update HUD
-        self.hud.update(self.player.health, self.score, self.wave, self.active_powerups, enemies_remaining)
+        with profiler.phase("hud"):
+            self.hud.update(self.player.health, self.score, self.wave, self.active_powerups, enemies_remaining)
         
         # Debug: Force wave completion if F10 is pressed
-        keys = pygame.key.get_pressed()
-        if keys[pygame.K_F10]:
+        if not self.headless and pygame.key.get_pressed()[pygame.K_F10]:
             print("DEBUG: Force completing wave")
-            self.asteroids.clear()
+            self.clear_asteroids()
             self.enemies.clear()
             self.boss = None
             self.wave_completed = True
@@ -245,7 +389,7 @@ class Game:
                 self.sound_manager.play_sound("wave")
                 
                 # Clear any remaining asteroids and enemies
-                self.asteroids.clear()
+                self.clear_asteroids()
                 self.enemies.clear()
         
         # Update power-up timers
@@ -275,6 +419,13 @@ class Game:
         self.shop.set_points(self.score)
         self.shop.set_wave(self.wave)
     
+    def close_shop(self):
+        """Leave the shop and start the next wave"""
+        self.shop_active = False
+        self.shop.active = False
+        self.start_next_wave()
+        self.apply_upgrades()
+    
     def start_next_wave(self):
         """Start the next wave after shopping"""
         self.wave += 1
@@ -325,10 +476,14 @@ class Game:
         self.weapon.update(dt)
         
         # Update existing projectiles
-        for proj in list(self.projectiles):
-            proj.update(dt)
-            if proj.is_offscreen(self.width, self.height):
-                self.projectiles.remove(proj)
+        if isinstance(self.projectiles, EntityStore):
+            self.projectile_pool.release_all(self.projectiles.update(dt, self.width, self.height))
+        else:
+            for proj in list(self.projectiles):
+                proj.update(dt)
+                if proj.is_offscreen(self.width, self.height):
+                    self.projectiles.remove(proj)
+                    self.projectile_pool.release(proj)
     
     def update_asteroids(self, dt):
         # Don't spawn new asteroids if wave is completed
@@ -343,10 +498,18 @@ class Game:
             self.asteroid_spawn_timer = 0
         
         # Update existing asteroids
-        for asteroid in list(self.asteroids):
-            asteroid.update(dt)
-            if asteroid.is_offscreen(self.width, self.height, buffer=100):
-                self.asteroids.remove(asteroid)
+        if isinstance(self.asteroids, EntityStore):
+            self.asteroid_pool.release_all(self.asteroids.update(dt, self.width, self.height))
+        else:
+            for asteroid in list(self.asteroids):
+                asteroid.update(dt)
+                if asteroid.is_offscreen(self.width, self.height, buffer=100):
+                    self.asteroids.remove(asteroid)
+                    self.asteroid_pool.release(asteroid)
+        
+        # Bounce asteroids off each other
+        if self.asteroid_bounce:
+            self.bounce_asteroids()
         
         # Force wave completion after 60 seconds
         if self.wave_timer > 60 and not self.wave_completed:
@@ -355,6 +518,84 @@ class Game:
             self.wave_transition_timer = 3.0
             self.sound_manager.play_sound("wave")
     
+    def bounce_asteroids(self):
+        """Separate overlapping asteroids and bounce them apart (elastic, mass by area)"""
+        asteroids = self.asteroids
+        pairs = self.asteroid_sweep.find_pairs(asteroids)
+        if not pairs:
+            return
+        
+        # Work on plain lists of the asteroids' state (read straight from the
+        # columns when they live in an EntityStore) and write it back once
+        if isinstance(asteroids, EntityStore):
+            x, y, radius, angle, speed = (asteroids.column(row).tolist()
+                                          for row in (X, Y, RADIUS, VELOCITY_1, VELOCITY_2))
+            slot = attrgetter("store_index")
+            pairs = [(slot(a), slot(b)) for a, b in pairs]
+        else:
+            x = [asteroid.x for asteroid in asteroids]
+            y = [asteroid.y for asteroid in asteroids]
+            radius = [asteroid.radius for asteroid in asteroids]
+            angle = [asteroid.angle for asteroid in asteroids]
+            speed = [asteroid.speed for asteroid in asteroids]
+            slots = {id(asteroid): index for index, asteroid in enumerate(asteroids)}
+            pairs = [(slots[id(a)], slots[id(b)]) for a, b in pairs]
+        
+        for a, b in pairs:
+            dx = x[b] - x[a]
+            dy = y[b] - y[a]
+            min_distance = radius[a] + radius[b]
+            distance_sq = dx * dx + dy * dy
+            if distance_sq >= min_distance * min_distance:
+                continue
+            
+            distance = math.sqrt(distance_sq)
+            if distance > 0:
+                nx = dx / distance
+                ny = dy / distance
+            else:
+                nx, ny = 1.0, 0.0
+            
+            mass_a = radius[a] * radius[a]
+            mass_b = radius[b] * radius[b]
+            total_mass = mass_a + mass_b
+            
+            # Push them apart, the lighter one further
+            overlap = min_distance - distance
+            x[a] -= nx * overlap * mass_b / total_mass
+            y[a] -= ny * overlap * mass_b / total_mass
+            x[b] += nx * overlap * mass_a / total_mass
+            y[b] += ny * overlap * mass_a / total_mass
+            
+            # Exchange momentum along the contact normal if they are approaching
+            a_vx = math.cos(angle[a]) * speed[a]
+            a_vy = math.sin(angle[a]) * speed[a]
+            b_vx = math.cos(angle[b]) * speed[b]
+            b_vy = math.sin(angle[b]) * speed[b]
+            approach = (b_vx - a_vx) * nx + (b_vy - a_vy) * ny
+            if approach >= 0:
+                continue
+            
+            impulse = 2 * approach / total_mass
+            a_vx += impulse * mass_b * nx
+            a_vy += impulse * mass_b * ny
+            b_vx -= impulse * mass_a * nx
+            b_vy -= impulse * mass_a * ny
+            angle[a] = math.atan2(a_vy, a_vx)
+            speed[a] = math.hypot(a_vx, a_vy)
+            angle[b] = math.atan2(b_vy, b_vx)
+            speed[b] = math.hypot(b_vx, b_vy)
+        
+        if isinstance(asteroids, EntityStore):
+            for row, values in ((X, x), (Y, y), (VELOCITY_1, angle), (VELOCITY_2, speed)):
+                asteroids.column(row)[:] = values
+        else:
+            for index, asteroid in enumerate(asteroids):
+                asteroid.x = x[index]
+                asteroid.y = y[index]
+                asteroid.angle = angle[index]
+                asteroid.speed = speed[index]
+    
     def update_enemies(self, dt):
         """Update special enemies like homing missiles"""
         # Don't spawn new enemies if wave is completed
@@ -362,7 +603,7 @@ class Game:
             return
             
         # Spawn new enemies occasionally based on wave number
-        if random.random() < 0.005 * self.wave and len(self.enemies) < self.wave:
+        if self.rng.random() < 0.005 * self.wave and len(self.enemies) < self.wave:
             self.spawn_enemy()
         
         # Update existing enemies
@@ -391,12 +632,13 @@ class Game:
     def update_hazards(self, dt):
         """Update environmental hazards"""
         # Update existing hazards
+        black_holes = []
         for hazard in list(self.hazards):
             if isinstance(hazard, BlackHole):
-                # Black holes affect all objects
-                game_objects = self.asteroids + self.enemies + [self.player]
-                hazard.update(dt, game_objects)
-                if not hazard.active:
+                hazard.update(dt)
+                if hazard.active:
+                    black_holes.append(hazard)
+                else:
                     self.hazards.remove(hazard)
                     
             elif isinstance(hazard, SpaceStorm):
@@ -405,22 +647,30 @@ class Game:
                     self.hazards.remove(hazard)
                     
             elif isinstance(hazard, Wormhole):
-                hazard.update(dt, self.asteroids)
+                hazard.update(dt, self.spatial_hash)
                 if not hazard.active:
                     self.hazards.remove(hazard)
         
+        # Black holes pull every asteroid, enemy and the player in one pass
+        if black_holes:
+            bodies = self.asteroids + self.enemies
+            bodies.append(self.player)
+            for body in self.gravity_field.apply(black_holes, bodies, dt):
+                if hasattr(body, "take_damage"):
+                    body.take_damage()
+        
         # Spawn new hazards occasionally based on wave and sector
         if self.game_mode == "campaign" and self.current_sector:
             if self.current_sector.special_feature == "black_holes":
-                if random.random() < 0.001 * self.wave and len(self.hazards) < 2:
+                if self.rng.random() < 0.001 * self.wave and len(self.hazards) < 2:
                     self.spawn_black_hole()
                     
             elif self.current_sector.special_feature == "wormholes":
-                if random.random() < 0.001 * self.wave and len(self.hazards) < 2:
+                if self.rng.random() < 0.001 * self.wave and len(self.hazards) < 2:
                     self.spawn_wormhole()
                     
             elif self.current_sector.special_feature == "space_storm":
-                if not any(isinstance(h, SpaceStorm) for h in self.hazards) and random.random() < 0.0005 * self.wave:
+                if not any(isinstance(h, SpaceStorm) for h in self.hazards) and self.rng.random() < 0.0005 * self.wave:
                     self.spawn_space_storm()
     
     def update_powerups(self, dt):
@@ -454,7 +704,7 @@ class Game:
         total = sum(weights)
         weights = [w/total for w in weights]
         
-        asteroid_type = random.choices(asteroid_types, weights=weights)[0]
+        asteroid_type = self.rng.choices(asteroid_types, weights=weights)[0]
         
         # Check for boss wave
         if self.wave % self.boss_wave_interval == 0:
@@ -462,41 +712,41 @@ class Game:
             return
         
         # Determine spawn position (from outside the screen)
-        side = random.choice(["top", "right", "bottom", "left"])
+        side = self.rng.choice(["top", "right", "bottom", "left"])
         if side == "top":
-            x = random.randint(0, self.width)
+            x = self.rng.randint(0, self.width)
             y = -50
-            angle = random.uniform(math.pi / 4, 3 * math.pi / 4)
+            angle = self.rng.uniform(math.pi / 4, 3 * math.pi / 4)
         elif side == "right":
             x = self.width + 50
-            y = random.randint(0, self.height)
-            angle = random.uniform(3 * math.pi / 4, 5 * math.pi / 4)
+            y = self.rng.randint(0, self.height)
+            angle = self.rng.uniform(3 * math.pi / 4, 5 * math.pi / 4)
         elif side == "bottom":
-            x = random.randint(0, self.width)
+            x = self.rng.randint(0, self.width)
             y = self.height + 50
-            angle = random.uniform(5 * math.pi / 4, 7 * math.pi / 4)
+            angle = self.rng.uniform(5 * math.pi / 4, 7 * math.pi / 4)
         else:  # left
             x = -50
-            y = random.randint(0, self.height)
-            angle = random.uniform(7 * math.pi / 4, 9 * math.pi / 4)
+            y = self.rng.randint(0, self.height)
+            angle = self.rng.uniform(7 * math.pi / 4, 9 * math.pi / 4)
         
         # Create the asteroid
         if asteroid_type == "crystal":
-            asteroid = CrystalAsteroid(x, y, self.wave)
+            asteroid = CrystalAsteroid(x, y, self.wave, self.rng)
         elif asteroid_type == "blade":
-            asteroid = SpinningBlade(x, y, self.wave)
+            asteroid = SpinningBlade(x, y, self.wave, self.rng)
         else:
-            asteroid = Asteroid(x, y, asteroid_type, angle, self.wave)
+            asteroid = self.asteroid_pool.acquire(x, y, asteroid_type, angle, self.wave, self.rng)
             
         # Make sure the asteroid is moving toward the screen
         if side == "top" and asteroid.angle > math.pi:
-            asteroid.angle = random.uniform(math.pi / 4, 3 * math.pi / 4)
+            asteroid.angle = self.rng.uniform(math.pi / 4, 3 * math.pi / 4)
         elif side == "right" and (asteroid.angle < math.pi/2 or asteroid.angle > 3*math.pi/2):
-            asteroid.angle = random.uniform(3 * math.pi / 4, 5 * math.pi / 4)
+            asteroid.angle = self.rng.uniform(3 * math.pi / 4, 5 * math.pi / 4)
         elif side == "bottom" and asteroid.angle < math.pi:
-            asteroid.angle = random.uniform(5 * math.pi / 4, 7 * math.pi / 4)
+            asteroid.angle = self.rng.uniform(5 * math.pi / 4, 7 * math.pi / 4)
         elif side == "left" and (asteroid.angle > math.pi/2 and asteroid.angle < 3*math.pi/2):
-            asteroid.angle = random.uniform(7 * math.pi / 4, 9 * math.pi / 4)
+            asteroid.angle = self.rng.uniform(7 * math.pi / 4, 9 * math.pi / 4)
             
         self.asteroids.append(asteroid)
     
@@ -507,27 +757,27 @@ class Game:
             return
             
         # Create a homing missile targeting the player
-        side = random.choice(["top", "right", "bottom", "left"])
+        side = self.rng.choice(["top", "right", "bottom", "left"])
         if side == "top":
-            x = random.randint(0, self.width)
+            x = self.rng.randint(0, self.width)
             y = -50
         elif side == "right":
             x = self.width + 50
-            y = random.randint(0, self.height)
+            y = self.rng.randint(0, self.height)
         elif side == "bottom":
-            x = random.randint(0, self.width)
+            x = self.rng.randint(0, self.width)
             y = self.height + 50
         else:  # left
             x = -50
-            y = random.randint(0, self.height)
+            y = self.rng.randint(0, self.height)
             
-        missile = HomingMissile(x, y, self.player, self.wave)
+        missile = HomingMissile(x, y, self.player, self.wave, self.rng)
         self.enemies.append(missile)
     
     def spawn_boss(self):
         """Spawn a boss for the current wave"""
         # Create boss at the top of the screen
-        self.boss = Boss(self.width // 2, 100, self.wave, self.width, self.height)
+        self.boss = Boss(self.width // 2, 100, self.wave, self.width, self.height, self.rng)
         
         # Play boss music/sound
         self.sound_manager.play_sound("wave")
@@ -537,8 +787,8 @@ class Game:
         # Spawn away from the player
         min_distance = 200
         while True:
-            x = random.randint(100, self.width - 100)
-            y = random.randint(100, self.height - 100)
+            x = self.rng.randint(100, self.width - 100)
+            y = self.rng.randint(100, self.height - 100)
             
             # Check distance from player
             dx = x - self.player.x
@@ -548,43 +798,36 @@ class Game:
             if distance > min_distance:
                 break
                 
-        black_hole = BlackHole(x, y)
+        black_hole = BlackHole(x, y, rng=self.rng)
         self.hazards.append(black_hole)
     
     def spawn_wormhole(self):
-        """Spawn a pair of connected wormholes"""
-        # Spawn entry point
-        x1 = random.randint(100, self.width - 100)
-        y1 = random.randint(100, self.height - 100)
-        
-        # Spawn exit point away from entry
-        while True:
-            x2 = random.randint(100, self.width - 100)
-            y2 = random.randint(100, self.height - 100)
+        """Spawn a network of two to four linked wormholes"""
+        portals = []
+        count = self.rng.randint(2, 4)
+        while len(portals) < count:
+            x = self.rng.randint(100, self.width - 100)
+            y = self.rng.randint(100, self.height - 100)
             
-            # Check distance between points
-            dx = x2 - x1
-            dy = y2 - y1
-            distance = math.sqrt(dx*dx + dy*dy)
-            
-            if distance > 200:
-                break
-                
-        wormhole = Wormhole(x1, y1, x2, y2)
+            # Keep every portal away from the others
+            if all(math.hypot(x - other_x, y - other_y) > 200 for other_x, other_y in portals):
+                portals.append((x, y))
+        
+        wormhole = Wormhole(portals, rng=self.rng)
         self.hazards.append(wormhole)
     
     def spawn_space_storm(self):
         """Spawn a space storm that covers the screen"""
-        storm = SpaceStorm(self.width, self.height)
+        storm = SpaceStorm(self.width, self.height, rng=self.rng)
         self.hazards.append(storm)
     
     def spawn_powerup(self):
         # Determine power-up type
-        powerup_type = random.choice(["shield", "rapid_fire", "slow_motion", "size_shrink"])
+        powerup_type = self.rng.choice(["shield", "rapid_fire", "slow_motion", "size_shrink"])
         
         # Determine spawn position (random on screen)
-        x = random.randint(50, self.width - 50)
-        y = random.randint(50, self.height - 50)
+        x = self.rng.randint(50, self.width - 50)
+        y = self.rng.randint(50, self.height - 50)
         
         # Create the power-up
         powerup = PowerUp(x, y, powerup_type)
@@ -598,71 +841,181 @@ class Game:
         
         self.projectiles.extend(projectiles)
     
+    def rebuild_spatial_hash(self):
+        """Insert all collidable objects into the broad-phase grid"""
+        spatial_hash = self.spatial_hash
+        spatial_hash.clear()
+        
+        for asteroid, x, y in get_positions(self.asteroids):
+            spatial_hash.insert_at(asteroid, "asteroids", x, y, get_bounding_radius(asteroid))
+        for powerup in self.powerups:
+            spatial_hash.insert(powerup, "powerups")
+        
+        # Only wormholes look up projectiles, enemies and the player
+        if any(isinstance(hazard, Wormhole) for hazard in self.hazards):
+            for proj in self.projectiles:
+                spatial_hash.insert(proj, "projectiles")
+            for enemy in self.enemies:
+                spatial_hash.insert(enemy, "enemies")
+            if self.boss:
+                for missile in self.boss.missiles:
+                    spatial_hash.insert(missile, "enemies")
+            spatial_hash.insert(self.player, "player", self.player.get_collision_radius())
+    
     def check_collisions(self):
+        """Resolve this tick's collisions (the spatial hash is rebuilt before the hazards run)"""
         # Player-Asteroid collisions
         player_radius = self.player.get_collision_radius()
         if self.active_powerups["size_shrink"] > 0:
             player_radius *= 0.5
         
-        for asteroid in list(self.asteroids):
+        shield_active = self.active_powerups["shield"] > 0
+        shield_radius = player_radius * 1.5
+        
+        # The ship's outline, for the polygon test after the bounding circles overlap
+        ship_scale = 0.5 if self.active_powerups["size_shrink"] > 0 else 1.0
+        ship_hull = get_world_hull(self.player.ship_points, self.player.x, self.player.y,
+                                   self.player.angle, ship_scale)
+        ship_radius = hull_cache.get(self.player.ship_points).radius * ship_scale
+        query_radius = max(shield_radius if shield_active else 0, ship_radius)
+        
+        for asteroid in self.spatial_hash.query(self.player.x, self.player.y, query_radius, "asteroids"):
+            asteroid_radius = get_bounding_radius(asteroid)
+            
             # Check if player has shield
-            if self.active_powerups["shield"] > 0:
-                shield_radius = player_radius * 1.5
+            if shield_active:
                 if self.check_circle_collision(self.player.x, self.player.y, shield_radius,
-                                             asteroid.x, asteroid.y, asteroid.radius):
+                                             asteroid.x, asteroid.y, asteroid_radius) and \
+                        circle_hits_shape(self.player.x, self.player.y, shield_radius, asteroid):
                     # Shield blocks asteroid
                     self.destroy_asteroid(asteroid)
                     continue
             
             # Check player collision
             if not self.player.invulnerable and self.check_circle_collision(
-                    self.player.x, self.player.y, player_radius,
-                    asteroid.x, asteroid.y, asteroid.radius):
+                    self.player.x, self.player.y, ship_radius,
+                    asteroid.x, asteroid.y, asteroid_radius) and polygon_hits_shape(ship_hull, asteroid):
                 self.player.take_damage()
                 self.combo = 0
-                self.sound_manager.play_sound("player_hit")
+                self.sound_manager.play_sound("player_hit", self.player.x)
                 
                 # Create explosion particles
                 self.particle_system.create_explosion(self.player.x, self.player.y, (255, 200, 0))
                 
                 # Remove the asteroid
-                self.asteroids.remove(asteroid)
+                self.remove_asteroid(asteroid)
         
         # Projectile-Asteroid collisions
-        for proj in list(self.projectiles):
-            for asteroid in list(self.asteroids):
-                if self.check_circle_collision(proj.x, proj.y, proj.radius,
-                                             asteroid.x, asteroid.y, asteroid.radius):
-                    # Hit asteroid
-                    self.destroy_asteroid(asteroid)
-                    if proj in self.projectiles:
-                        self.projectiles.remove(proj)
-                    break
+        spent_projectiles = {}  # id -> projectile
+        for proj, asteroid in self.find_projectile_hits():
+            self.destroy_asteroid(asteroid)
+            spent_projectiles[id(proj)] = proj
+        
+        if spent_projectiles:
+            if isinstance(self.projectiles, EntityStore):
+                self.projectile_pool.release_all(self.projectiles.remove_all(spent_projectiles.values()))
+            else:
+                self.projectile_pool.release_all(proj for proj in self.projectiles if id(proj) in spent_projectiles)
+                self.projectiles = [proj for proj in self.projectiles if id(proj) not in spent_projectiles]
         
         # Player-PowerUp collisions
-        for powerup in list(self.powerups):
+        for powerup in self.spatial_hash.query(self.player.x, self.player.y, player_radius, "powerups"):
             if self.check_circle_collision(self.player.x, self.player.y, player_radius,
                                          powerup.x, powerup.y, powerup.radius):
                 # Activate power-up
                 self.activate_powerup(powerup.type)
                 self.powerups.remove(powerup)
-                self.sound_manager.play_sound("powerup")
+                self.spatial_hash.remove(powerup)
+                self.sound_manager.play_sound("powerup", self.player.x)
+    
+    def find_projectile_hits(self):
+        """Return the (projectile, asteroid) pairs that collided during this tick.
+        
+        Each projectile's path over the tick is swept against each nearby
+        asteroid's path (relative to the asteroid), so fast shots can't skip
+        over small asteroids between two ticks. All candidate pairs are
+        tested in one batch against the asteroids' bounding circles, and pairs
+        that touch are confirmed against the asteroid's outline. A projectile
+        hits the asteroid it reaches first, unless an earlier projectile in
+        the list already destroyed it.
+        """
+        # Broad phase: asteroids near each projectile's path
+        start_x, start_y, move_x, move_y, radius, pairs, owners = [], [], [], [], [], [], []
+        for proj_index, proj in enumerate(self.projectiles):
+            prev_x = proj.prev_x if proj.prev_x is not None else proj.x
+            prev_y = proj.prev_y if proj.prev_y is not None else proj.y
+            path_x = proj.x - prev_x
+            path_y = proj.y - prev_y
+            reach = math.hypot(path_x, path_y) / 2 + proj.radius + SWEEP_QUERY_MARGIN
+            
+            for asteroid in self.spatial_hash.query(prev_x + path_x / 2, prev_y + path_y / 2, reach, "asteroids"):
+                asteroid_prev_x = getattr(asteroid, "prev_x", None)
+                if asteroid_prev_x is None:
+                    asteroid_prev_x, asteroid_prev_y = asteroid.x, asteroid.y
+                else:
+                    asteroid_prev_y = asteroid.prev_y
+                
+                start_x.append(prev_x - asteroid_prev_x)
+                start_y.append(prev_y - asteroid_prev_y)
+                move_x.append(path_x - (asteroid.x - asteroid_prev_x))
+                move_y.append(path_y - (asteroid.y - asteroid_prev_y))
+                radius.append(proj.radius + get_bounding_radius(asteroid))
+                pairs.append((proj, asteroid, start_x[-1] + asteroid.x, start_y[-1] + asteroid.y))
+                owners.append(proj_index)
+        
+        if not pairs:
+            return []
+        
+        # Narrow phase: earliest contact of every pair, in projectile order then time
+        hits = find_sweep_hits(start_x, start_y, move_x, move_y, radius)
+        hits.sort(key=lambda hit: (owners[hit[1]], hit[0]))
+        
+        result = []
+        spent = set()
+        destroyed = set()
+        for _, index in hits:
+            proj, asteroid, path_x, path_y = pairs[index]
+            if id(proj) in spent or id(asteroid) in destroyed:
+                continue
+            
+            # Polygon test of the projectile's path relative to the asteroid
+            if not path_hits_shape(path_x, path_y, proj.x, proj.y, proj.radius, asteroid):
+                continue
+            spent.add(id(proj))
+            destroyed.add(id(asteroid))
+            result.append((proj, asteroid))
+        return result
     
     def check_circle_collision(self, x1, y1, r1, x2, y2, r2):
         # Check if two circles are colliding
         distance = math.sqrt((x2 - x1) ** 2 + (y2 - y1) ** 2)
         return distance < (r1 + r2)
     
-    def destroy_asteroid(self, asteroid):
-        # Remove the asteroid
+    def remove_asteroid(self, asteroid):
+        """Remove an asteroid from the game and the collision grid"""
         if asteroid in self.asteroids:
             self.asteroids.remove(asteroid)
+            self.asteroid_pool.release(asteroid)
+        self.spatial_hash.remove(asteroid)
+    
+    def clear_asteroids(self):
+        self.asteroid_pool.release_all(self.asteroids)
+        self.asteroids.clear()
+    
+    def add_asteroid(self, asteroid):
+        """Add an asteroid, keeping the collision grid in sync mid-tick"""
+        self.asteroids.append(asteroid)
+        self.spatial_hash.insert(asteroid, "asteroids", get_bounding_radius(asteroid))
+    
+    def destroy_asteroid(self, asteroid):
+        # Remove the asteroid
+        self.remove_asteroid(asteroid)
         
         # Create explosion particles
         self.particle_system.create_explosion(asteroid.x, asteroid.y, asteroid.color)
         
         # Play sound
-        self.sound_manager.play_sound("explosion")
+        self.sound_manager.play_sound("explosion", asteroid.x)
         
         # Add score based on asteroid type
         points = {
@@ -685,24 +1038,26 @@ class Game:
         # Spawn smaller asteroids if it was a large or medium one
         if asteroid.type == "large":
             for _ in range(2):
-                new_asteroid = Asteroid(
-                    asteroid.x + random.uniform(-20, 20),
-                    asteroid.y + random.uniform(-20, 20),
+                new_asteroid = self.asteroid_pool.acquire(
+                    asteroid.x + self.rng.uniform(-20, 20),
+                    asteroid.y + self.rng.uniform(-20, 20),
                     "medium",
-                    random.uniform(0, 2 * math.pi),
-                    self.wave
+                    self.rng.uniform(0, 2 * math.pi),
+                    self.wave,
+                    self.rng
                 )
-                self.asteroids.append(new_asteroid)
+                self.add_asteroid(new_asteroid)
         elif asteroid.type == "medium":
             for _ in range(2):
-                new_asteroid = Asteroid(
-                    asteroid.x + random.uniform(-10, 10),
-                    asteroid.y + random.uniform(-10, 10),
+                new_asteroid = self.asteroid_pool.acquire(
+                    asteroid.x + self.rng.uniform(-10, 10),
+                    asteroid.y + self.rng.uniform(-10, 10),
                     "small",
-                    random.uniform(0, 2 * math.pi),
-                    self.wave
+                    self.rng.uniform(0, 2 * math.pi),
+                    self.wave,
+                    self.rng
                 )
-                self.asteroids.append(new_asteroid)
+                self.add_asteroid(new_asteroid)
     
     def activate_powerup(self, powerup_type):
         # Set duration based on power-up type
@@ -769,6 +1124,8 @@ class Game:
         # Set background colors based on sector
         bg_colors = sector.get_background_colors()
         self.starfield.set_colors(bg_colors["stars"], bg_colors["dust"])
+        if self.dirty_renderer:
+            self.refresh_background()
     
     def setup_escort_mission(self):
         """Set up an escort mission with a target to protect"""
@@ -780,95 +1137,277 @@ class Game:
         # Reset mission timer
         self.mission_timer = 0
     
-    def draw(self):
-        # Clear the screen
-        self.screen.fill((0, 0, 0))
+    def get_entity_stores(self):
+        """Return the entity containers that keep positions in NumPy columns"""
+        return [entities for entities in (self.asteroids, self.projectiles) if isinstance(entities, EntityStore)]
+    
+    def get_interpolated_objects(self):
+        """Return every moving object that is drawn at an interpolated position, except those in entity stores"""
+        objects = [self.player]
+        for entities in (self.asteroids, self.projectiles):
+            if not isinstance(entities, EntityStore):
+                objects.extend(entities)
+        objects.extend(self.enemies)
+        objects.extend(self.powerups)
+        if self.boss:
+            objects.append(self.boss)
+            objects.extend(self.boss.missiles)
+        if self.mission_target:
+            objects.append(self.mission_target)
+        return objects
+    
+    def store_previous_positions(self):
+        for entities in self.get_entity_stores():
+            entities.store_previous_positions()
+        for obj in self.get_interpolated_objects():
+            obj.prev_x = obj.x
+            obj.prev_y = obj.y
+    
+    def enable_dirty_rects(self):
+        """Only redraw and present the screen regions that change each frame"""
+        self.dirty_renderer = DirtyRectRenderer(self.screen)
+        self.refresh_background()
+    
+    def refresh_background(self):
+        """Bake the dust clouds into the dirty-rect renderer's static background"""
+        self.starfield.draw_dust(self.dirty_renderer.background)
+        self.dirty_renderer.invalidate()
+    
+    def draw(self, alpha=1.0):
+        """Draw the game, blending positions between the last two steps by alpha.
+        
+        Returns False if nothing needed redrawing (the shop is open and unchanged).
+        """
+        if self.shop_active and not self.shop.needs_redraw:
+            return False
         
-        # Draw the starfield background
-        self.starfield.draw(self.screen)
+        if alpha >= 1.0:
+            self.draw_scene()
+            return True
+        
+        # Temporarily move objects to their interpolated positions
+        max_jump_x = self.width / 2
+        max_jump_y = self.height / 2
+        stores = self.get_entity_stores()
+        saved_columns = [entities.interpolate(alpha, max_jump_x, max_jump_y) for entities in stores]
+        saved = []
+        for obj in self.get_interpolated_objects():
+            prev_x = getattr(obj, "prev_x", None)
+            if prev_x is None:
+                continue
+            
+            x, y = obj.x, obj.y
+            dx = x - prev_x
+            dy = y - obj.prev_y
+            
+            # Don't smear objects across the screen when they wrap or teleport
+            if abs(dx) > max_jump_x or abs(dy) > max_jump_y:
+                continue
+            
+            saved.append((obj, x, y))
+            obj.x = prev_x + dx * alpha
+            obj.y = obj.prev_y + dy * alpha
+        
+        try:
+            self.draw_scene()
+        finally:
+            for entities, columns in zip(stores, saved_columns):
+                entities.restore(columns)
+            for obj, x, y in saved:
+                obj.x = x
+                obj.y = y
+        return True
+    
+    def draw_scene(self):
+        profiler = self.profiler
+        
+        # Clear the screen and draw the starfield background
+        with profiler.phase("draw_background"):
+            if self.dirty_renderer:
+                # Dust clouds are part of the static background, only the stars are redrawn
+                self.dirty_renderer.begin_frame()
+                self.starfield.draw_star_points(self.screen)
+            else:
+                # The starfield's dust layer is opaque, so it also clears the screen
+                self.starfield.draw(self.screen)
         
         # Draw environmental hazards
-        for hazard in self.hazards:
-            hazard.draw(self.screen)
+        with profiler.phase("draw_hazards"):
+            for hazard in self.hazards:
+                hazard.draw(self.screen)
         
         # Draw particles
-        self.particle_system.draw(self.screen)
+        with profiler.phase("draw_particles"):
+            self.particle_system.draw(self.screen)
         
         # Draw projectiles
-        for proj in self.projectiles:
-            proj.draw(self.screen)
+        with profiler.phase("draw_projectiles"):
+            for proj in self.projectiles:
+                proj.draw(self.screen)
         
         # Draw asteroids
-        for asteroid in self.asteroids:
-            asteroid.draw(self.screen)
+        with profiler.phase("draw_asteroids"):
+            for asteroid in self.asteroids:
+                asteroid.draw(self.screen)
         
         # Draw enemies
-        for enemy in self.enemies:
-            enemy.draw(self.screen)
+        with profiler.phase("draw_enemies"):
+            for enemy in self.enemies:
+                enemy.draw(self.screen)
         
         # Draw boss if present
-        if self.boss:
-            self.boss.draw(self.screen)
+        with profiler.phase("draw_boss"):
+            if self.boss:
+                self.boss.draw(self.screen)
         
         # Draw power-ups
-        for powerup in self.powerups:
-            powerup.draw(self.screen)
+        with profiler.phase("draw_powerups"):
+            for powerup in self.powerups:
+                powerup.draw(self.screen)
         
         # Draw mission target if in escort mission
         if self.mission_type == "escort" and self.mission_target:
             self.mission_target.draw(self.screen)
         
         # Draw player
-        self.player.draw(self.screen, self.active_powerups)
+        with profiler.phase("draw_player"):
+            self.player.draw(self.screen, self.active_powerups)
+        
+        # Draw HUD and mission info for campaign mode
+        with profiler.phase("draw_hud"):
+            self.hud.draw(self.screen)
+            if self.game_mode == "campaign":
+                self.draw_mission_info()
+        
+        with profiler.phase("draw_overlays"):
+            # Draw wave completion message
+            if self.wave_completed:
+                self.draw_wave_complete()
+            
+            # Draw shop if active
+            if self.shop_active:
+                self.shop.draw(self.screen)
+        
+        # Draw the profiler graph last so it sits on top
+        overlay_rect = profiler.draw_overlay(self.screen)
+        
+        if self.dirty_renderer:
+            with profiler.phase("dirty_rects"):
+                self.add_dirty_rects()
+                if overlay_rect:
+                    self.dirty_renderer.add(overlay_rect)
+    
+    def add_dirty_rects(self):
+        """Tell the dirty-rect renderer which screen regions this frame drew into"""
+        renderer = self.dirty_renderer
+        renderer.add_rects(self.starfield.get_star_rects())
+        renderer.add_rects(self.particle_system.get_dirty_rects())
+        
+        # Margins cover outlines, glows and health bars drawn around each object
+        for obj in self.projectiles + self.asteroids + self.enemies + self.powerups:
+            renderer.add_circle(obj.x, obj.y, obj.radius * 1.5 + 12)
+        if self.boss:
+            renderer.add_circle(self.boss.x, self.boss.y, self.boss.radius * 2 + 10)
+            for missile in self.boss.missiles:
+                renderer.add_circle(missile.x, missile.y, missile.radius * 1.5 + 12)
+        if self.mission_type == "escort" and self.mission_target:
+            target = self.mission_target
+            renderer.add_circle(target.x, target.y, target.radius * 2 + 10)
         
-        # Draw HUD
-        self.hud.draw(self.screen)
+        # Ship, shield and thruster flame
+        renderer.add_circle(self.player.x, self.player.y, 40)
         
-        # Draw mission info for campaign mode
-        if self.game_mode == "campaign":
-            self.draw_mission_info()
+        for hazard in self.hazards:
+            if isinstance(hazard, BlackHole):
+                renderer.add_circle(hazard.x, hazard.y, hazard.pull_radius + 2)
+            elif isinstance(hazard, Wormhole):
+                for index, (x, y) in enumerate(hazard.portals):
+                    exit_x, exit_y = hazard.get_exit(index)
+                    renderer.add_circle(x, y, hazard.radius + 2)
+                    renderer.add(pygame.Rect(min(x, exit_x), min(y, exit_y),
+                                             abs(exit_x - x) + 1, abs(exit_y - y) + 1))
+            else:
+                # Storms tint the whole screen
+                renderer.add(renderer.screen_rect)
         
-        # Draw wave completion message
+        renderer.add_rects(self.hud.get_dirty_rects())
+        if self.game_mode == "campaign":
+            renderer.add(pygame.Rect(0, 55, 320, 85))
         if self.wave_completed:
-            self.draw_wave_complete()
-        
-        # Draw shop if active
+            renderer.add(pygame.Rect(0, self.height // 2 - 50, self.width, 100))
         if self.shop_active:
-            self.shop.draw(self.screen)
+            renderer.add(renderer.screen_rect)
+    
+    def present(self):
+        """Show the drawn frame, updating only the changed regions in dirty-rect mode"""
+        if self.dirty_renderer:
+            self.dirty_renderer.present()
+        else:
+            pygame.display.flip()
+    
+    def get_state_hash(self):
+        """Return a CRC32 of the simulation state, used to verify replays"""
+        player = self.player
+        state = [self.score, self.wave, self.game_over, player.health,
+                 round(player.x, 3), round(player.y, 3), round(player.angle, 5)]
+        for obj in self.asteroids + self.enemies + self.projectiles + ([self.boss] if self.boss else []):
+            state.append((type(obj).__name__, round(obj.x, 3), round(obj.y, 3)))
+        return zlib.crc32(repr(state).encode())
+    
+    def get_entity_counts(self):
+        """Return the number of live objects of each kind"""
+        return {
+            "asteroids": len(self.asteroids),
+            "enemies": len(self.enemies) + (len(self.boss.missiles) if self.boss else 0),
+            "projectiles": len(self.projectiles),
+            "powerups": len(self.powerups),
+            "hazards": len(self.hazards),
+            "particles": len(self.particle_system)
+        }
+    
+    def get_pool_stats(self):
+        """Return the statistics of this game's object pools, keyed by pool name"""
+        pools = [self.asteroid_pool, self.projectile_pool]
+        particle_pool = getattr(self.particle_system, "pool", None)
+        if particle_pool is not None:
+            pools.append(particle_pool)
+        return {pool.name: pool.get_stats() for pool in pools}
+    
+    def end_frame(self):
+        """Close the profiler frame; call once per rendered (or simulated) frame"""
+        self.profiler.end_frame(self.get_entity_counts())
     
     def draw_mission_info(self):
         """Draw mission information for campaign mode"""
-        font = pygame.font.SysFont(None, 24)
+        font = text_cache.get_font(24)
         
         # Draw sector name
         if self.current_sector:
-            sector_text = font.render(f"Sector: {self.current_sector.name}", True, (200, 200, 255))
+            sector_text = text_cache.render(font, f"Sector: {self.current_sector.name}", (200, 200, 255))
             self.screen.blit(sector_text, (20, 60))
         
         # Draw mission type
         mission_name = self.mission_type.capitalize()
-        mission_text = font.render(f"Mission: {mission_name}", True, (200, 200, 255))
+        mission_text = text_cache.render(font, f"Mission: {mission_name}", (200, 200, 255))
         self.screen.blit(mission_text, (20, 85))
         
         # Draw mission-specific info
         if self.mission_type == "survival":
             time_left = max(0, 60 - self.mission_timer)
-            time_text = font.render(f"Survive: {time_left:.1f}s", True, (255, 200, 100))
-            self.screen.blit(time_text, (20, 110))
+            text_cache.draw_composed(self.screen, font, "Survive: ", f"{time_left:.1f}s",
+                                     (255, 200, 100), 20, 110)
     
     def draw_wave_complete(self):
         """Draw wave completion message"""
         # Create semi-transparent overlay
-        overlay = pygame.Surface((self.width, 100), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 150))
+        overlay = surface_cache.get_filled((self.width, 100), (0, 0, 0, 150))
         self.screen.blit(overlay, (0, self.height // 2 - 50))
         
         # Draw wave complete text
-        font_large = pygame.font.SysFont(None, 48)
-        text = font_large.render("WAVE COMPLETE!", True, (255, 255, 0))
+        text = text_cache.render(text_cache.get_font(48), "WAVE COMPLETE!", (255, 255, 0))
         self.screen.blit(text, (self.width // 2 - text.get_width() // 2, self.height // 2 - 25))
         
         # Draw "Shop opening..." text
-        font_medium = pygame.font.SysFont(None, 32)
-        text2 = font_medium.render(f"Shop opening in {self.wave_transition_timer:.1f}s", True, (255, 255, 255))
-        self.screen.blit(text2, (self.width // 2 - text2.get_width() // 2, self.height // 2 + 15))
+        text_cache.draw_composed(self.screen, text_cache.get_font(32), "Shop opening in ",
+                                 f"{self.wave_transition_timer:.1f}s", (255, 255, 255),
+                                 self.width // 2, self.height // 2 + 15, align="center")
@@ -0,0 +1,94 @@
+import math
+from operator import attrgetter
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, the pull is summed per body without it
+    np = None
+
+
+class GravityField:
+    """Pull of every active black hole on every movable body, summed in one pass.
+
+    Bodies either move by velocity_x and velocity_y (the player) or by
+    angle and speed (asteroids, missiles); the pull is added to their
+    velocity in whichever form they use. With NumPy the distances from all
+    bodies to all black holes are computed as one matrix, so the cost grows
+    with bodies x holes in vectorised code rather than per-object Python.
+    apply() returns the bodies inside a black hole's core.
+    """
+    def apply(self, black_holes, bodies, dt):
+        if not black_holes or not bodies:
+            return []
+        if np is None:
+            return self.apply_each(black_holes, bodies, dt)
+
+        steps = dt * 60
+        count = len(bodies)
+        x = np.fromiter(map(attrgetter("x"), bodies), float, count)
+        y = np.fromiter(map(attrgetter("y"), bodies), float, count)
+
+        hole_x = np.array([hole.x for hole in black_holes])
+        hole_y = np.array([hole.y for hole in black_holes])
+        pull_radius = np.array([hole.pull_radius for hole in black_holes])
+        strength = np.array([hole.pull_strength for hole in black_holes])
+        core = np.array([hole.radius * 1.2 for hole in black_holes])
+
+        # Body-to-hole offsets as (bodies, holes) matrices
+        dx = hole_x[None, :] - x[:, None]
+        dy = hole_y[None, :] - y[:, None]
+        distance = np.sqrt(dx * dx + dy * dy)
+
+        # Pull strength decreases linearly to zero at the edge of the pull radius
+        in_range = (distance < pull_radius) & (distance > 0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            factor = np.where(in_range, (1 - distance / pull_radius) * strength / distance, 0.0)
+        pull_x = (dx * factor).sum(axis=1) * steps
+        pull_y = (dy * factor).sum(axis=1) * steps
+
+        # Only the pulled bodies are written back
+        pulled = np.flatnonzero(in_range.any(axis=1))
+        for index, body_pull_x, body_pull_y in zip(pulled.tolist(), pull_x[pulled].tolist(),
+                                                   pull_y[pulled].tolist()):
+            self.add_velocity(bodies[index], body_pull_x, body_pull_y)
+
+        swallowed = np.flatnonzero(((distance < core) & in_range).any(axis=1))
+        return [bodies[index] for index in swallowed.tolist()]
+
+    def apply_each(self, black_holes, bodies, dt):
+        """Plain Python version of apply()"""
+        steps = dt * 60
+        swallowed = []
+        for body in bodies:
+            pull_x = 0.0
+            pull_y = 0.0
+            in_core = False
+            pulled = False
+            for hole in black_holes:
+                dx = hole.x - body.x
+                dy = hole.y - body.y
+                distance = math.sqrt(dx * dx + dy * dy)
+                if 0 < distance < hole.pull_radius:
+                    factor = (1 - distance / hole.pull_radius) * hole.pull_strength / distance
+                    pull_x += dx * factor * steps
+                    pull_y += dy * factor * steps
+                    pulled = True
+                    if distance < hole.radius * 1.2:
+                        in_core = True
+
+            if pulled:
+                self.add_velocity(body, pull_x, pull_y)
+            if in_core:
+                swallowed.append(body)
+        return swallowed
+
+    @staticmethod
+    def add_velocity(body, pull_x, pull_y):
+        if hasattr(body, "velocity_x"):
+            body.velocity_x += pull_x
+            body.velocity_y += pull_y
+        else:
+            velocity_x = math.cos(body.angle) * body.speed + pull_x
+            velocity_y = math.sin(body.angle) * body.speed + pull_y
+            body.angle = math.atan2(velocity_y, velocity_x)
+            body.speed = math.hypot(velocity_x, velocity_y)
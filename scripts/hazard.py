@@ -1,9 +1,12 @@
 import pygame
 import math
 import random
+from .text_cache import text_cache
+from .surface_cache import surface_cache
 
 class BlackHole:
-    def __init__(self, x, y, radius=30):
+    def __init__(self, x, y, radius=30, rng=None):
+        rng = rng if rng is not None else random
         self.x = x
         self.y = y
         self.radius = radius
@@ -12,7 +15,7 @@ class BlackHole:
         self.rotation = 0
         self.rotation_speed = 0.02
         self.active = True
-        self.lifetime = random.uniform(15, 30)  # Black holes exist for limited time
+        self.lifetime = rng.uniform(15, 30)  # Black holes exist for limited time
         
         # Visual properties
         self.color = (20, 20, 40)
@@ -22,7 +25,8 @@ class BlackHole:
             (20, 20, 40)     # Almost black
         ]
     
-    def update(self, dt, game_objects):
+    def update(self, dt):
+        """Spin and age the black hole; its pull is applied by the game's GravityField"""
         # Update rotation
         self.rotation += self.rotation_speed * dt * 60
         
@@ -30,29 +34,6 @@ class BlackHole:
         self.lifetime -= dt
         if self.lifetime <= 0:
             self.active = False
-        
-        # Apply gravitational pull to nearby objects
-        for obj in game_objects:
-            if hasattr(obj, 'x') and hasattr(obj, 'y'):
-                # Calculate distance
-                dx = self.x - obj.x
-                dy = self.y - obj.y
-                distance = math.sqrt(dx*dx + dy*dy)
-                
-                # Apply pull if within range
-                if distance < self.pull_radius and distance > 0:
-                    # Pull strength decreases with distance
-                    pull_factor = (1 - distance / self.pull_radius) * self.pull_strength
-                    
-                    # Apply pull
-                    if hasattr(obj, 'velocity_x') and hasattr(obj, 'velocity_y'):
-                        obj.velocity_x += dx / distance * pull_factor * dt * 60
-                        obj.velocity_y += dy / distance * pull_factor * dt * 60
-                    
-                    # If object is very close, damage it
-                    if distance < self.radius * 1.2:
-                        if hasattr(obj, 'take_damage'):
-                            obj.take_damage(1)
     
     def draw(self, screen):
         # Draw outer rings
@@ -78,7 +59,8 @@ class BlackHole:
 
 
 class SpaceStorm:
-    def __init__(self, width, height, duration=15):
+    def __init__(self, width, height, duration=15, rng=None):
+        self.rng = rng if rng is not None else random
         self.width = width
         self.height = height
         self.duration = duration
@@ -88,18 +70,18 @@ class SpaceStorm:
         # Storm properties
         self.particles = []
         self.lightning_timer = 0
-        self.lightning_interval = random.uniform(1, 3)
+        self.lightning_interval = self.rng.uniform(1, 3)
         self.lightning_duration = 0
         self.lightning_points = []
         
         # Create initial particles
         for _ in range(200):
             self.particles.append({
-                'x': random.randint(0, width),
-                'y': random.randint(0, height),
-                'size': random.randint(1, 3),
-                'speed': random.uniform(3, 8),
-                'angle': random.uniform(0, 2 * math.pi)
+                'x': self.rng.randint(0, width),
+                'y': self.rng.randint(0, height),
+                'size': self.rng.randint(1, 3),
+                'speed': self.rng.uniform(3, 8),
+                'angle': self.rng.uniform(0, 2 * math.pi)
             })
     
     def update(self, dt):
@@ -129,7 +111,7 @@ class SpaceStorm:
         self.lightning_timer += dt
         if self.lightning_timer >= self.lightning_interval:
             self.lightning_timer = 0
-            self.lightning_interval = random.uniform(1, 3)
+            self.lightning_interval = self.rng.uniform(1, 3)
             self.lightning_duration = 0.2  # Lightning lasts for 0.2 seconds
             
             # Create new lightning bolt
@@ -143,22 +125,21 @@ class SpaceStorm:
         points = []
         
         # Start from a random position at the top
-        x = random.randint(0, self.width)
+        x = self.rng.randint(0, self.width)
         y = 0
         points.append((x, y))
         
         # Create a jagged path downward
         while y < self.height:
-            x += random.randint(-50, 50)
-            y += random.randint(20, 50)
+            x += self.rng.randint(-50, 50)
+            y += self.rng.randint(20, 50)
             points.append((x, y))
         
         return points
     
     def draw(self, screen):
         # Create a semi-transparent overlay for the storm
-        overlay = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-        overlay.fill((0, 0, 50, 100))  # Blue tint with transparency
+        overlay = surface_cache.get_filled((self.width, self.height), (0, 0, 50, 100))  # Blue tint with transparency
         screen.blit(overlay, (0, 0))
         
         # Draw storm particles
@@ -176,6 +157,7 @@ class SpaceStorm:
             
             # Draw some branches
             for i in range(1, len(self.lightning_points) - 1):
+                # Branches are purely cosmetic, so they use the global random module
                 if random.random() < 0.3:  # 30% chance for each point to have a branch
                     start = self.lightning_points[i]
                     end = (start[0] + random.randint(-100, 100), 
@@ -184,77 +166,90 @@ class SpaceStorm:
         
         # Draw timer if storm is about to end
         if self.time_left < 5.0:
-            font = pygame.font.SysFont(None, 36)
-            text = font.render(f"Storm: {self.time_left:.1f}s", True, (255, 255, 255))
-            screen.blit(text, (self.width // 2 - text.get_width() // 2, 50))
+            text_cache.draw_composed(screen, text_cache.get_font(36), "Storm: ", f"{self.time_left:.1f}s",
+                                     (255, 255, 255), self.width // 2, 50, align="center")
 
 
 class Wormhole:
-    def __init__(self, x1, y1, x2, y2, radius=25):
-        # Entry point
-        self.entry_x = x1
-        self.entry_y = y1
-        
-        # Exit point
-        self.exit_x = x2
-        self.exit_y = y2
+    """A network of linked portals; anything entering a portal comes out of the next one.
+
+    The portals are linked in a ring, so a pair works both ways. Candidates
+    come from region queries on the game's spatial hash around each portal,
+    so a portal only looks at the objects near it, and every object inside
+    a portal is teleported in the same tick. An object can't travel again
+    until its own cooldown runs out, so it doesn't bounce straight back.
+    """
+    # Spatial hash layers whose objects travel through wormholes
+    LAYERS = ("asteroids", "enemies", "projectiles", "player")
+    
+    def __init__(self, portals, radius=25, rng=None):
+        rng = rng if rng is not None else random
+
+        # Portal centres, each linked to the next
+        self.portals = [tuple(portal) for portal in portals]
         
         self.radius = radius
         self.active = True
-        self.cooldown = 0
-        self.cooldown_time = 1.0  # Time before wormhole can teleport again
-        self.lifetime = random.uniform(20, 30)
+        self.cooldown_time = 1.0  # Time before an object can teleport again
+        self.cooldowns = {}  # id(obj) -> [obj, time left]
+        self.lifetime = rng.uniform(20, 30)
         
         # Visual properties
-        self.rotation1 = 0
-        self.rotation2 = math.pi  # Start at opposite rotation
+        self.rotations = [index * math.pi for index in range(len(self.portals))]  # Neighbours spin out of phase
         self.rotation_speed = 0.03
-        self.color1 = (100, 200, 255)  # Blue
-        self.color2 = (255, 100, 200)  # Pink
+        self.colors = [(100, 200, 255), (255, 100, 200)]  # Blue, pink
+    
+    def get_exit(self, index):
+        return self.portals[(index + 1) % len(self.portals)]
     
-    def update(self, dt, asteroids):
+    def update(self, dt, spatial_hash):
         # Update rotation
-        self.rotation1 += self.rotation_speed * dt * 60
-        self.rotation2 += self.rotation_speed * dt * 60
+        for index in range(len(self.rotations)):
+            self.rotations[index] += self.rotation_speed * dt * 60
         
         # Update lifetime
         self.lifetime -= dt
         if self.lifetime <= 0:
             self.active = False
         
-        # Update cooldown
-        if self.cooldown > 0:
-            self.cooldown -= dt
+        # Update the per-object cooldowns
+        for key, entry in list(self.cooldowns.items()):
+            entry[1] -= dt
+            if entry[1] <= 0:
+                del self.cooldowns[key]
         
-        # Check for asteroids to teleport
-        if self.cooldown <= 0:
-            for asteroid in asteroids:
-                # Calculate distance to entry point
-                dx = self.entry_x - asteroid.x
-                dy = self.entry_y - asteroid.y
-                distance = math.sqrt(dx*dx + dy*dy)
-                
-                # Teleport if close enough
-                if distance < self.radius:
-                    # Teleport the asteroid
-                    asteroid.x = self.exit_x
-                    asteroid.y = self.exit_y
+        # Teleport everything inside a portal
+        radius_sq = self.radius * self.radius
+        for index, (x, y) in enumerate(self.portals):
+            exit_x, exit_y = self.get_exit(index)
+            for layer in self.LAYERS:
+                for obj in spatial_hash.query(x, y, self.radius, layer):
+                    entry = self.cooldowns.get(id(obj))
+                    if entry is not None and entry[0] is obj:
+                        continue
                     
-                    # Reset cooldown
-                    self.cooldown = self.cooldown_time
-                    break
+                    dx = x - obj.x
+                    dy = y - obj.y
+                    if dx * dx + dy * dy >= radius_sq:
+                        continue
+                    
+                    obj.x = exit_x
+                    obj.y = exit_y
+                    # Don't interpolate (or sweep collisions) across the jump
+                    obj.prev_x = exit_x
+                    obj.prev_y = exit_y
+                    spatial_hash.update(obj)
+                    self.cooldowns[id(obj)] = [obj, self.cooldown_time]
     
     def draw(self, screen):
-        # Draw entry wormhole
-        self.draw_wormhole(screen, self.entry_x, self.entry_y, self.rotation1, self.color1)
-        
-        # Draw exit wormhole
-        self.draw_wormhole(screen, self.exit_x, self.exit_y, self.rotation2, self.color2)
+        # Draw the links (faint)
+        for index, (x, y) in enumerate(self.portals):
+            if len(self.portals) > 2 or index == 0:
+                pygame.draw.line(screen, (150, 150, 150, 100), (x, y), self.get_exit(index), 1)
         
-        # Draw connecting line (faint)
-        pygame.draw.line(screen, (150, 150, 150, 100), 
-                        (self.entry_x, self.entry_y), 
-                        (self.exit_x, self.exit_y), 1)
+        # Draw the portals
+        for index, (x, y) in enumerate(self.portals):
+            self.draw_wormhole(screen, x, y, self.rotations[index], self.colors[index % len(self.colors)])
     
     def draw_wormhole(self, screen, x, y, rotation, color):
         # Draw outer ring
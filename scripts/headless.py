@@ -0,0 +1,190 @@
+import argparse
+import math
+import os
+import time
+import pygame
+from .game import Game, INPUT_FORWARD, INPUT_BACKWARD, INPUT_LEFT, INPUT_RIGHT, INPUT_FIRE
+
+
+class ScriptedPilot:
+    """Pilot that replays a fixed sequence of input bitmasks in a loop"""
+    def __init__(self, inputs):
+        self.inputs = list(inputs) or [0]
+        self.tick = 0
+
+    def get_input(self, game):
+        input_bits = self.inputs[self.tick % len(self.inputs)]
+        self.tick += 1
+        return input_bits
+
+    def shop(self, game):
+        """Called while the shop is open; scripted pilots buy nothing"""
+        pass
+
+
+class AutoPilot:
+    """Simple AI pilot: aims at the nearest threat, fires and backs off when it gets close"""
+    def __init__(self, danger_distance=120):
+        self.danger_distance = danger_distance
+
+    def get_input(self, game):
+        player = game.player
+
+        # Find the nearest threat
+        target = None
+        best_distance = float("inf")
+        for obj in game.asteroids + game.enemies + ([game.boss] if game.boss else []):
+            distance = math.hypot(obj.x - player.x, obj.y - player.y) - obj.radius
+            if distance < best_distance:
+                best_distance = distance
+                target = obj
+
+        if target is None:
+            return 0
+
+        # Player angle 0 points up, so the heading to the target is atan2(dx, -dy)
+        desired = math.atan2(target.x - player.x, -(target.y - player.y))
+        diff = (desired - player.angle + math.pi) % (2 * math.pi) - math.pi
+
+        input_bits = INPUT_FIRE
+        if diff < -player.rotation_speed:
+            input_bits |= INPUT_LEFT
+        elif diff > player.rotation_speed:
+            input_bits |= INPUT_RIGHT
+
+        if best_distance < self.danger_distance:
+            input_bits |= INPUT_BACKWARD
+        elif best_distance > self.danger_distance * 2:
+            input_bits |= INPUT_FORWARD
+
+        return input_bits
+
+    def shop(self, game):
+        """Buy the cheapest affordable upgrade until nothing else fits"""
+        shop = game.shop
+        while True:
+            affordable = [i for i, item in enumerate(shop.items) if item.can_upgrade(shop.points)]
+            if not affordable:
+                break
+            shop.purchase_item(min(affordable, key=lambda i: shop.items[i].get_cost()))
+
+
+class HeadlessRunner:
+    """Drives Game.update() as fast as possible without drawing or sound"""
+    def __init__(self, game, pilot, restart_on_game_over=True):
+        self.game = game
+        self.pilot = pilot
+        self.restart_on_game_over = restart_on_game_over
+
+        # Statistics
+        self.ticks = 0
+        self.game_overs = 0
+        self.waves_completed = 0
+        self.best_score = 0
+        self.elapsed = 0.0
+
+    def step(self):
+        """Advance the simulation by one tick; returns the game status"""
+        game = self.game
+
+        if game.shop_active:
+            self.pilot.shop(game)
+            game.close_shop()
+            self.waves_completed += 1
+
+        game.apply_input(self.pilot.get_input(game))
+        status = game.update()
+        game.end_frame()
+        self.ticks += 1
+        self.best_score = max(self.best_score, game.score)
+
+        if status == "game_over":
+            self.game_overs += 1
+            if self.restart_on_game_over:
+                game.reset()
+
+        return status
+
+    def run(self, ticks=None, waves=None):
+        """Run until the tick or completed-wave budget is used up"""
+        start = time.perf_counter()
+        target_ticks = self.ticks + ticks if ticks is not None else None
+        target_waves = self.waves_completed + waves if waves is not None else None
+
+        while True:
+            if target_ticks is not None and self.ticks >= target_ticks:
+                break
+            if target_waves is not None and self.waves_completed >= target_waves:
+                break
+
+            status = self.step()
+            if status == "game_over" and not self.restart_on_game_over:
+                break
+
+        self.elapsed += time.perf_counter() - start
+        return self.get_stats()
+
+    def get_stats(self):
+        ticks_per_sec = self.ticks / self.elapsed if self.elapsed > 0 else 0.0
+        return {
+            "ticks": self.ticks,
+            "seconds": self.elapsed,
+            "ticks_per_sec": ticks_per_sec,
+            # Game time runs at 60 ticks per second
+            "simulated_seconds": self.ticks / 60,
+            "speedup": ticks_per_sec / 60,
+            "waves_completed": self.waves_completed,
+            "game_overs": self.game_overs,
+            "best_score": self.best_score
+        }
+
+
+def create_headless_game(width=800, height=600):
+    """Create a Game that needs neither a display nor an audio device"""
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+    # Fonts are still created by the HUD and shop, which needs only the font module
+    pygame.font.init()
+    return Game(None, width, height, headless=True)
+
+
+PILOTS = ["auto", "idle", "spin"]
+
+
+def create_pilot(name):
+    """Create a pilot by name: "auto", "spin" (turn and fire) or "idle" (no input)"""
+    if name == "auto":
+        return AutoPilot()
+    if name == "spin":
+        return ScriptedPilot([INPUT_LEFT | INPUT_FIRE])
+    return ScriptedPilot([0])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run Asteroid Dodger without a display")
+    parser.add_argument("--ticks", type=int, default=36000, help="number of ticks to simulate")
+    parser.add_argument("--waves", type=int, default=None, help="stop after this many completed waves")
+    parser.add_argument("--pilot", choices=PILOTS, default="auto")
+    parser.add_argument("--profile-out", metavar="PATH", help="write per-phase tick timings to PATH (.json or .csv)")
+    args = parser.parse_args(argv)
+
+    runner = HeadlessRunner(create_headless_game(), create_pilot(args.pilot))
+    stats = runner.run(ticks=None if args.waves else args.ticks, waves=args.waves)
+
+    print(f"Simulated {stats['ticks']} ticks ({stats['simulated_seconds']:.0f}s of game time) "
+          f"in {stats['seconds']:.2f}s")
+    print(f"{stats['ticks_per_sec']:.0f} ticks/sec ({stats['speedup']:.1f}x real time)")
+    print(f"Waves completed: {stats['waves_completed']}, game overs: {stats['game_overs']}, "
+          f"best score: {stats['best_score']}")
+    for name, pool in runner.game.get_pool_stats().items():
+        print(f"{name} pool: {pool['created']} created, {pool['reused']} reused "
+              f"({pool['reuse_rate']:.0%}), high-water mark {pool['high_water']}")
+
+    if args.profile_out:
+        runner.game.profiler.dump(args.profile_out)
+        print(f"Wrote tick profile to {args.profile_out}")
+
+
+if __name__ == "__main__":
+    main()
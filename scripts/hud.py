@@ -1,15 +1,16 @@
 import pygame
+from .text_cache import text_cache, SharedFont
 
 class HUD:
+    # Fonts (loaded on first use)
+    font_large = SharedFont(48)
+    font_medium = SharedFont(32)
+    font_small = SharedFont(24)
+    
     def __init__(self, width, height):
         self.width = width
         self.height = height
         
-        # Load fonts
-        self.font_large = pygame.font.SysFont(None, 48)
-        self.font_medium = pygame.font.SysFont(None, 32)
-        self.font_small = pygame.font.SysFont(None, 24)
-        
         # HUD elements
         self.health = 3
         self.score = 0
@@ -56,6 +57,13 @@ class HUD:
         # Draw active power-ups
         self.draw_powerups(screen)
     
+    def get_dirty_rects(self):
+        """Return the screen regions the HUD draws into"""
+        return [
+            pygame.Rect(0, 0, self.width, 75),  # Health, score, wave and enemies remaining
+            pygame.Rect(0, self.height - 55, 20 + 40 * len(self.powerup_icons), 55)  # Power-up timers
+        ]
+    
     def draw_health(self, screen):
         # Draw health as hearts
         heart_width = 30
@@ -82,18 +90,18 @@ class HUD:
     
     def draw_score(self, screen):
         # Draw score in the top right
-        score_text = self.font_medium.render(f"Score: {self.score}", True, (255, 255, 255))
-        screen.blit(score_text, (self.width - score_text.get_width() - 20, 20))
+        text_cache.draw_composed(screen, self.font_medium, "Score: ", str(self.score),
+                                 (255, 255, 255), self.width - 20, 20, align="right")
     
     def draw_wave(self, screen):
         # Draw wave in the top center
-        wave_text = self.font_medium.render(f"Wave {self.wave}", True, (255, 255, 255))
-        screen.blit(wave_text, (self.width // 2 - wave_text.get_width() // 2, 20))
+        text_cache.draw_composed(screen, self.font_medium, "Wave ", str(self.wave),
+                                 (255, 255, 255), self.width // 2, 20, align="center")
     
     def draw_enemies_remaining(self, screen):
         # Draw enemies remaining count below the wave number
-        enemies_text = self.font_small.render(f"Enemies Remaining: {self.enemies_remaining}", True, (255, 200, 100))
-        screen.blit(enemies_text, (self.width // 2 - enemies_text.get_width() // 2, 50))
+        text_cache.draw_composed(screen, self.font_small, "Enemies Remaining: ", str(self.enemies_remaining),
+                                 (255, 200, 100), self.width // 2, 50, align="center")
     
     def draw_powerups(self, screen):
         # Draw active power-ups in the bottom left
@@ -117,13 +125,13 @@ class HUD:
                                   powerup_size // 2)
                 
                 # Draw icon
-                icon_text = self.font_small.render(icon, True, (255, 255, 255))
+                icon_text = text_cache.render(self.font_small, icon, (255, 255, 255))
                 screen.blit(icon_text, (powerup_x + powerup_size // 2 - icon_text.get_width() // 2, 
                                        start_y + powerup_size // 2 - icon_text.get_height() // 2))
                 
                 # Draw time left
-                time_text = self.font_small.render(f"{time_left:.1f}s", True, (255, 255, 255))
-                screen.blit(time_text, (powerup_x + powerup_size // 2 - time_text.get_width() // 2, 
-                                       start_y + powerup_size + 5))
+                text_cache.draw_composed(screen, self.font_small, "", f"{time_left:.1f}s", (255, 255, 255),
+                                         powerup_x + powerup_size // 2, start_y + powerup_size + 5,
+                                         align="center")
                 
                 i += 1
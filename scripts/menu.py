@@ -1,6 +1,8 @@
 import pygame
 import os
 import json
+from .text_cache import text_cache, SharedFont
+from .surface_cache import surface_cache
 
 class Button:
     def __init__(self, x, y, width, height, text, font, action=None):
@@ -22,7 +24,7 @@ class Button:
         pygame.draw.rect(screen, (200, 200, 200), self.rect, 2)  # Border
         
         # Draw text
-        text_surf = self.font.render(self.text, True, self.text_color)
+        text_surf = text_cache.render(self.font, self.text, self.text_color)
         text_rect = text_surf.get_rect(center=self.rect.center)
         screen.blit(text_surf, text_rect)
     
@@ -37,18 +39,18 @@ class Button:
 
 
 class Menu:
+    # Fonts (loaded on first use)
+    font_title = SharedFont(72)
+    font_large = SharedFont(48)
+    font_medium = SharedFont(32)
+    font_small = SharedFont(24)
+    
     def __init__(self, screen, width, height, game):
         self.screen = screen
         self.width = width
         self.height = height
         self.game = game
         
-        # Load fonts
-        self.font_title = pygame.font.SysFont(None, 72)
-        self.font_large = pygame.font.SysFont(None, 48)
-        self.font_medium = pygame.font.SysFont(None, 32)
-        self.font_small = pygame.font.SysFont(None, 24)
-        
         # Create buttons
         button_width = 200
         button_height = 50
@@ -84,6 +86,21 @@ class Menu:
         self.high_scores = self.load_high_scores()
         self.final_score = 0
         self.show_high_scores = False
+        
+        # Menu screens are static, so they're only redrawn after something changes
+        self.needs_redraw = True
+        self.backdrop = None  # Darkened copy of the last game frame behind the pause and game over screens
+    
+    def invalidate(self):
+        """Force a full redraw, e.g. after switching screens"""
+        self.needs_redraw = True
+        self.backdrop = None
+    
+    def update_hover(self, buttons, pos):
+        for button in buttons:
+            was_hovered = button.hover
+            if button.check_hover(pos) != was_hovered:
+                self.needs_redraw = True
     
     def load_high_scores(self):
         try:
@@ -112,10 +129,13 @@ class Menu:
         self.add_high_score(score)
     
     def handle_event(self, event):
+        # The high score screen polls the mouse while drawing
+        if self.show_high_scores and event.type in (pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP):
+            self.needs_redraw = True
+        
         if event.type == pygame.MOUSEMOTION:
             # Check button hover
-            for button in self.main_menu_buttons:
-                button.check_hover(event.pos)
+            self.update_hover(self.main_menu_buttons, event.pos)
         
         elif event.type == pygame.MOUSEBUTTONDOWN:
             # Check button clicks
@@ -124,6 +144,7 @@ class Menu:
                 if action:
                     if action == "high_scores":
                         self.show_high_scores = not self.show_high_scores
+                        self.needs_redraw = True
                     else:
                         return action
         
@@ -132,8 +153,7 @@ class Menu:
     def handle_game_over_event(self, event):
         if event.type == pygame.MOUSEMOTION:
             # Check button hover
-            for button in self.game_over_buttons:
-                button.check_hover(event.pos)
+            self.update_hover(self.game_over_buttons, event.pos)
         
         elif event.type == pygame.MOUSEBUTTONDOWN:
             # Check button clicks
@@ -147,8 +167,7 @@ class Menu:
     def handle_pause_event(self, event):
         if event.type == pygame.MOUSEMOTION:
             # Check button hover
-            for button in self.pause_buttons:
-                button.check_hover(event.pos)
+            self.update_hover(self.pause_buttons, event.pos)
         
         elif event.type == pygame.MOUSEBUTTONDOWN:
             # Check button clicks
@@ -172,6 +191,11 @@ class Menu:
         pass
     
     def draw(self):
+        """Draw the main menu if it changed; returns True if anything was drawn"""
+        if not self.needs_redraw:
+            return False
+        self.needs_redraw = False
+        
         # Clear the screen
         self.screen.fill((0, 0, 0))
         
@@ -180,7 +204,7 @@ class Menu:
             self.game.starfield.draw(self.screen)
         
         # Draw title
-        title_text = self.font_title.render("ASTEROID DODGER", True, (255, 255, 255))
+        title_text = text_cache.render(self.font_title, "ASTEROID DODGER", (255, 255, 255))
         self.screen.blit(title_text, (self.width // 2 - title_text.get_width() // 2, 100))
         
         if self.show_high_scores:
@@ -190,53 +214,70 @@ class Menu:
             # Draw buttons
             for button in self.main_menu_buttons:
                 button.draw(self.screen)
+        return True
+    
+    def draw_backdrop(self):
+        """Darken the frame on screen once, then reuse it for every later redraw"""
+        if self.backdrop is None:
+            # Draw semi-transparent overlay
+            overlay = surface_cache.get_filled((self.width, self.height), (0, 0, 0, 180))
+            self.screen.blit(overlay, (0, 0))
+            self.backdrop = self.screen.copy()
+        else:
+            self.screen.blit(self.backdrop, (0, 0))
     
     def draw_game_over(self):
-        # Draw semi-transparent overlay
-        overlay = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))
-        self.screen.blit(overlay, (0, 0))
+        """Draw the game over screen if it changed; returns True if anything was drawn"""
+        if not self.needs_redraw:
+            return False
+        self.needs_redraw = False
+        
+        self.draw_backdrop()
         
         # Draw game over text
-        game_over_text = self.font_title.render("GAME OVER", True, (255, 50, 50))
+        game_over_text = text_cache.render(self.font_title, "GAME OVER", (255, 50, 50))
         self.screen.blit(game_over_text, (self.width // 2 - game_over_text.get_width() // 2, 100))
         
         # Draw final score
-        score_text = self.font_large.render(f"Score: {self.final_score}", True, (255, 255, 255))
+        score_text = text_cache.render(self.font_large, f"Score: {self.final_score}", (255, 255, 255))
         self.screen.blit(score_text, (self.width // 2 - score_text.get_width() // 2, 180))
         
         # Draw buttons
         for button in self.game_over_buttons:
             button.draw(self.screen)
+        return True
     
     def draw_pause(self):
-        # Draw semi-transparent overlay
-        overlay = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))
-        self.screen.blit(overlay, (0, 0))
+        """Draw the pause screen if it changed; returns True if anything was drawn"""
+        if not self.needs_redraw:
+            return False
+        self.needs_redraw = False
+        
+        self.draw_backdrop()
         
         # Draw pause text
-        pause_text = self.font_title.render("PAUSED", True, (255, 255, 255))
+        pause_text = text_cache.render(self.font_title, "PAUSED", (255, 255, 255))
         self.screen.blit(pause_text, (self.width // 2 - pause_text.get_width() // 2, 100))
         
         # Draw buttons
         for button in self.pause_buttons:
             button.draw(self.screen)
+        return True
     
     def draw_high_scores(self):
         # Draw high scores title
-        title_text = self.font_large.render("HIGH SCORES", True, (255, 255, 255))
+        title_text = text_cache.render(self.font_large, "HIGH SCORES", (255, 255, 255))
         self.screen.blit(title_text, (self.width // 2 - title_text.get_width() // 2, 200))
         
         # Draw scores
         y = 250
         for i, score in enumerate(self.high_scores[:10]):
-            score_text = self.font_medium.render(f"{i+1}. {score}", True, (255, 255, 255))
+            score_text = text_cache.render(self.font_medium, f"{i+1}. {score}", (255, 255, 255))
             self.screen.blit(score_text, (self.width // 2 - score_text.get_width() // 2, y))
             y += 30
         
         # Draw back button
-        back_text = self.font_medium.render("Back to Menu", True, (255, 255, 255))
+        back_text = text_cache.render(self.font_medium, "Back to Menu", (255, 255, 255))
         back_rect = back_text.get_rect(center=(self.width // 2, y + 40))
         
         # Highlight if mouse is over
@@ -247,6 +288,7 @@ class Menu:
             # Check for click
             if pygame.mouse.get_pressed()[0]:
                 self.show_high_scores = False
+                self.needs_redraw = True
         
         # Draw the text
         self.screen.blit(back_text, back_rect)
@@ -1,9 +1,21 @@
 import pygame
 import random
 import math
+from .pool import ObjectPool
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, the list-based system is used without it
+    np = None
 
 class Particle:
+    __slots__ = ("x", "y", "velocity_x", "velocity_y", "color", "size", "lifetime", "max_lifetime")
+    
     def __init__(self, x, y, velocity_x, velocity_y, color, size, lifetime):
+        self.reset(x, y, velocity_x, velocity_y, color, size, lifetime)
+    
+    def reset(self, x, y, velocity_x, velocity_y, color, size, lifetime):
+        """(Re)initialise the particle; pooled particles are reused through this"""
         self.x = x
         self.y = y
         self.velocity_x = velocity_x
@@ -52,36 +64,50 @@ class Particle:
 
 
 class ParticleSystem:
-    def __init__(self):
+    def __init__(self, rng=None):
+        self.rng = rng if rng is not None else random
         self.particles = []
+        
+        # Dead particles are reused (the NumPy system keeps free slots instead)
+        self.pool = ObjectPool(Particle)
+    
+    def __len__(self):
+        return len(self.particles)
     
     def update(self, dt):
-        # Update all particles
-        for particle in list(self.particles):
+        # Particles that died last update can be reused from here on
+        self.pool.recycle()
+        
+        # Update all particles, returning the dead ones to the pool
+        alive = []
+        for particle in self.particles:
             particle.update(dt)
             if particle.is_dead():
-                self.particles.remove(particle)
+                self.pool.release(particle)
+            else:
+                alive.append(particle)
+        self.particles = alive
     
     def create_explosion(self, x, y, color, num_particles=20):
         """Create an explosion of particles at the given position"""
         for _ in range(num_particles):
             # Random velocity in all directions
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(1, 5)
+            angle = self.rng.uniform(0, 2 * math.pi)
+            speed = self.rng.uniform(1, 5)
             velocity_x = math.cos(angle) * speed
             velocity_y = math.sin(angle) * speed
             
             # Random size and lifetime
-            size = random.uniform(2, 5)
-            lifetime = random.uniform(0.5, 1.5)
+            size = self.rng.uniform(2, 5)
+            lifetime = self.rng.uniform(0.5, 1.5)
             
             # Vary the color slightly
-            r = min(255, color[0] + random.randint(-20, 20))
-            g = min(255, color[1] + random.randint(-20, 20))
-            b = min(255, color[2] + random.randint(-20, 20))
+            r = min(255, color[0] + self.rng.randint(-20, 20))
+            g = min(255, color[1] + self.rng.randint(-20, 20))
+            b = min(255, color[2] + self.rng.randint(-20, 20))
             
             # Create the particle
-            particle = Particle(x, y, velocity_x, velocity_y, (r, g, b), size, lifetime)
+            particle = self.pool.acquire(x, y, velocity_x, velocity_y, (r, g, b), size, lifetime)
             self.particles.append(particle)
     
     def create_thruster(self, x, y, angle, color=(255, 150, 0)):
@@ -91,103 +117,292 @@ class ParticleSystem:
         
         for _ in range(num_particles):
             # Velocity in the opposite direction of the ship's angle
-            base_angle = angle + math.pi + random.uniform(-0.2, 0.2)
-            speed = random.uniform(1, 3)
+            base_angle = angle + math.pi + self.rng.uniform(-0.2, 0.2)
+            speed = self.rng.uniform(1, 3)
             velocity_x = math.cos(base_angle) * speed
             velocity_y = math.sin(base_angle) * speed
             
             # Random size and lifetime
-            size = random.uniform(1, 3)
-            lifetime = random.uniform(0.2, 0.5)
+            size = self.rng.uniform(1, 3)
+            lifetime = self.rng.uniform(0.2, 0.5)
             
             # Vary the color slightly
-            r = min(255, color[0] + random.randint(-20, 20))
-            g = min(255, color[1] + random.randint(-20, 20))
-            b = min(255, color[2] + random.randint(-20, 20))
+            r = min(255, color[0] + self.rng.randint(-20, 20))
+            g = min(255, color[1] + self.rng.randint(-20, 20))
+            b = min(255, color[2] + self.rng.randint(-20, 20))
             
             # Create the particle
-            particle = Particle(x, y, velocity_x, velocity_y, (r, g, b), size, lifetime)
+            particle = self.pool.acquire(x, y, velocity_x, velocity_y, (r, g, b), size, lifetime)
             self.particles.append(particle)
     
     def create_healing_particle(self, x, y):
         """Create healing particles (green sparkles)"""
         # Random velocity upward with some spread
-        angle = -math.pi/2 + random.uniform(-0.5, 0.5)  # Mostly upward
-        speed = random.uniform(1, 3)
+        angle = -math.pi/2 + self.rng.uniform(-0.5, 0.5)  # Mostly upward
+        speed = self.rng.uniform(1, 3)
         velocity_x = math.cos(angle) * speed
         velocity_y = math.sin(angle) * speed
         
         # Green color with some variation
-        r = random.randint(50, 150)
-        g = random.randint(200, 255)
-        b = random.randint(50, 150)
+        r = self.rng.randint(50, 150)
+        g = self.rng.randint(200, 255)
+        b = self.rng.randint(50, 150)
         
         # Create the particle
-        size = random.uniform(1, 3)
-        lifetime = random.uniform(0.5, 1.0)
-        particle = Particle(x, y, velocity_x, velocity_y, (r, g, b), size, lifetime)
+        size = self.rng.uniform(1, 3)
+        lifetime = self.rng.uniform(0.5, 1.0)
+        particle = self.pool.acquire(x, y, velocity_x, velocity_y, (r, g, b), size, lifetime)
         self.particles.append(particle)
     
     def create_ambient_particle(self, x, y, color):
         """Create ambient background particles for visual effect"""
         # Slow random movement
-        velocity_x = random.uniform(-0.5, 0.5)
-        velocity_y = random.uniform(-0.5, 0.5)
+        velocity_x = self.rng.uniform(-0.5, 0.5)
+        velocity_y = self.rng.uniform(-0.5, 0.5)
         
         # Vary the color slightly
-        r = min(255, color[0] + random.randint(-20, 20))
-        g = min(255, color[1] + random.randint(-20, 20))
-        b = min(255, color[2] + random.randint(-20, 20))
+        r = min(255, color[0] + self.rng.randint(-20, 20))
+        g = min(255, color[1] + self.rng.randint(-20, 20))
+        b = min(255, color[2] + self.rng.randint(-20, 20))
         
         # Create the particle with longer lifetime
-        size = random.uniform(1, 2)
-        lifetime = random.uniform(2.0, 5.0)
-        particle = Particle(x, y, velocity_x, velocity_y, (r, g, b), size, lifetime)
+        size = self.rng.uniform(1, 2)
+        lifetime = self.rng.uniform(2.0, 5.0)
+        particle = self.pool.acquire(x, y, velocity_x, velocity_y, (r, g, b), size, lifetime)
         self.particles.append(particle)
     
     def create_shield_particles(self, x, y, radius):
         """Create particles around a shield perimeter"""
         # Create particles at random positions on the shield perimeter
-        angle = random.uniform(0, 2 * math.pi)
+        angle = self.rng.uniform(0, 2 * math.pi)
         shield_x = x + math.cos(angle) * radius
         shield_y = y + math.sin(angle) * radius
         
         # Velocity slightly outward
-        velocity_x = math.cos(angle) * random.uniform(0.5, 1.5)
-        velocity_y = math.sin(angle) * random.uniform(0.5, 1.5)
+        velocity_x = math.cos(angle) * self.rng.uniform(0.5, 1.5)
+        velocity_y = math.sin(angle) * self.rng.uniform(0.5, 1.5)
         
         # Blue-white color
-        r = random.randint(100, 200)
-        g = random.randint(150, 250)
+        r = self.rng.randint(100, 200)
+        g = self.rng.randint(150, 250)
         b = 255
         
         # Create the particle
-        size = random.uniform(1, 2)
-        lifetime = random.uniform(0.3, 0.8)
-        particle = Particle(shield_x, shield_y, velocity_x, velocity_y, (r, g, b), size, lifetime)
+        size = self.rng.uniform(1, 2)
+        lifetime = self.rng.uniform(0.3, 0.8)
+        particle = self.pool.acquire(shield_x, shield_y, velocity_x, velocity_y, (r, g, b), size, lifetime)
         self.particles.append(particle)
     
     def create_warp_effect(self, x, y, angle, count=20):
         """Create a warp/teleport effect"""
         for _ in range(count):
             # Particles emanate in all directions
-            particle_angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(3, 8)
+            particle_angle = self.rng.uniform(0, 2 * math.pi)
+            speed = self.rng.uniform(3, 8)
             velocity_x = math.cos(particle_angle) * speed
             velocity_y = math.sin(particle_angle) * speed
             
             # Cyan/blue color
-            r = random.randint(0, 100)
-            g = random.randint(150, 255)
-            b = random.randint(200, 255)
+            r = self.rng.randint(0, 100)
+            g = self.rng.randint(150, 255)
+            b = self.rng.randint(200, 255)
             
             # Create the particle
-            size = random.uniform(2, 4)
-            lifetime = random.uniform(0.5, 1.0)
-            particle = Particle(x, y, velocity_x, velocity_y, (r, g, b), size, lifetime)
+            size = self.rng.uniform(2, 4)
+            lifetime = self.rng.uniform(0.5, 1.0)
+            particle = self.pool.acquire(x, y, velocity_x, velocity_y, (r, g, b), size, lifetime)
             self.particles.append(particle)
     
     def draw(self, screen):
         # Draw all particles
         for particle in self.particles:
             particle.draw(screen)
+    
+    def get_dirty_rects(self, tile_size=32):
+        """Return the grid tiles that contain particles, for dirty-rect rendering"""
+        tiles = set()
+        for particle in self.particles:
+            size = max(1, int(particle.size))
+            for tx in range(int(particle.x - size) // tile_size, int(particle.x + size) // tile_size + 1):
+                for ty in range(int(particle.y - size) // tile_size, int(particle.y + size) // tile_size + 1):
+                    tiles.add((tx, ty))
+        return [pygame.Rect(tx * tile_size, ty * tile_size, tile_size, tile_size) for tx, ty in tiles]
+
+
+class ArrayParticleSystem:
+    """Particle system backed by preallocated NumPy arrays.
+
+    Particles live in fixed-capacity columns (structure of arrays). Free slots
+    are kept on a stack so spawning and culling never allocate, and all
+    per-frame updates run as vectorized batches. When the pool is full, new
+    particles are dropped. The create_* API matches ParticleSystem.
+    """
+    def __init__(self, capacity=8192, seed=None):
+        self.capacity = capacity
+        
+        # Particle state columns
+        self.x = np.zeros(capacity)
+        self.y = np.zeros(capacity)
+        self.velocity_x = np.zeros(capacity)
+        self.velocity_y = np.zeros(capacity)
+        self.color = np.zeros((capacity, 3))
+        self.size = np.zeros(capacity)
+        self.lifetime = np.zeros(capacity)
+        self.max_lifetime = np.ones(capacity)
+        self.alive = np.zeros(capacity, dtype=bool)
+        
+        # Stack of free slot indices; the top of the stack is free[free_count - 1]
+        self.free = np.arange(capacity - 1, -1, -1)
+        self.free_count = capacity
+        
+        self.rng = np.random.default_rng(seed)
+    
+    def __len__(self):
+        return self.capacity - self.free_count
+    
+    def clear(self):
+        """Remove all particles"""
+        self.alive[:] = False
+        self.free[:] = np.arange(self.capacity - 1, -1, -1)
+        self.free_count = self.capacity
+    
+    def spawn(self, x, y, velocity_x, velocity_y, color, size, lifetime):
+        """Add a batch of particles; every argument is a scalar or an array"""
+        count = len(velocity_x)
+        count = min(count, self.free_count)
+        if count <= 0:
+            return
+        
+        slots = self.free[self.free_count - count:self.free_count].copy()
+        self.free_count -= count
+        
+        self.x[slots] = x if np.isscalar(x) else x[:count]
+        self.y[slots] = y if np.isscalar(y) else y[:count]
+        self.velocity_x[slots] = velocity_x[:count]
+        self.velocity_y[slots] = velocity_y[:count]
+        self.color[slots] = color[:count]
+        self.size[slots] = size[:count]
+        self.lifetime[slots] = lifetime[:count]
+        self.max_lifetime[slots] = lifetime[:count]
+        self.alive[slots] = True
+    
+    def update(self, dt):
+        # Integrate every slot at once; dead slots are ignored when drawing
+        self.x += self.velocity_x * dt * 60
+        self.y += self.velocity_y * dt * 60
+        self.lifetime -= dt
+        
+        # Shrink particles as they age
+        np.maximum(self.size * (self.lifetime / self.max_lifetime), 0, out=self.size)
+        
+        # Return dead particles to the free stack
+        dead = np.flatnonzero(self.alive & ((self.lifetime <= 0) | (self.size <= 0.5)))
+        if len(dead):
+            self.alive[dead] = False
+            self.free[self.free_count:self.free_count + len(dead)] = dead
+            self.free_count += len(dead)
+    
+    def vary_color(self, color, count, variation=20):
+        """Return count copies of color with a random per-channel variation"""
+        base = np.array(color[:3], dtype=float)
+        offsets = self.rng.integers(-variation, variation + 1, size=(count, 3))
+        return np.clip(base + offsets, 0, 255)
+    
+    def create_explosion(self, x, y, color, num_particles=20):
+        """Create an explosion of particles at the given position"""
+        rng = self.rng
+        angle = rng.uniform(0, 2 * math.pi, num_particles)
+        speed = rng.uniform(1, 5, num_particles)
+        self.spawn(x, y, np.cos(angle) * speed, np.sin(angle) * speed,
+                   self.vary_color(color, num_particles),
+                   rng.uniform(2, 5, num_particles),
+                   rng.uniform(0.5, 1.5, num_particles))
+    
+    def create_thruster(self, x, y, angle, color=(255, 150, 0)):
+        """Create thruster particles behind a ship"""
+        rng = self.rng
+        num_particles = 3
+        base_angle = angle + math.pi + rng.uniform(-0.2, 0.2, num_particles)
+        speed = rng.uniform(1, 3, num_particles)
+        self.spawn(x, y, np.cos(base_angle) * speed, np.sin(base_angle) * speed,
+                   self.vary_color(color, num_particles),
+                   rng.uniform(1, 3, num_particles),
+                   rng.uniform(0.2, 0.5, num_particles))
+    
+    def create_healing_particle(self, x, y):
+        """Create healing particles (green sparkles)"""
+        rng = self.rng
+        angle = -math.pi / 2 + rng.uniform(-0.5, 0.5, 1)
+        speed = rng.uniform(1, 3, 1)
+        color = np.column_stack((rng.integers(50, 151, 1), rng.integers(200, 256, 1), rng.integers(50, 151, 1)))
+        self.spawn(x, y, np.cos(angle) * speed, np.sin(angle) * speed, color,
+                   rng.uniform(1, 3, 1), rng.uniform(0.5, 1.0, 1))
+    
+    def create_ambient_particle(self, x, y, color):
+        """Create ambient background particles for visual effect"""
+        rng = self.rng
+        self.spawn(x, y, rng.uniform(-0.5, 0.5, 1), rng.uniform(-0.5, 0.5, 1),
+                   self.vary_color(color, 1),
+                   rng.uniform(1, 2, 1), rng.uniform(2.0, 5.0, 1))
+    
+    def create_shield_particles(self, x, y, radius):
+        """Create particles around a shield perimeter"""
+        rng = self.rng
+        angle = rng.uniform(0, 2 * math.pi, 1)
+        color = np.column_stack((rng.integers(100, 201, 1), rng.integers(150, 251, 1), np.full(1, 255)))
+        self.spawn(x + np.cos(angle) * radius, y + np.sin(angle) * radius,
+                   np.cos(angle) * rng.uniform(0.5, 1.5, 1),
+                   np.sin(angle) * rng.uniform(0.5, 1.5, 1),
+                   color, rng.uniform(1, 2, 1), rng.uniform(0.3, 0.8, 1))
+    
+    def create_warp_effect(self, x, y, angle, count=20):
+        """Create a warp/teleport effect"""
+        rng = self.rng
+        particle_angle = rng.uniform(0, 2 * math.pi, count)
+        speed = rng.uniform(3, 8, count)
+        color = np.column_stack((rng.integers(0, 101, count), rng.integers(150, 256, count),
+                                 rng.integers(200, 256, count)))
+        self.spawn(x, y, np.cos(particle_angle) * speed, np.sin(particle_angle) * speed, color,
+                   rng.uniform(2, 4, count), rng.uniform(0.5, 1.0, count))
+    
+    def draw(self, screen):
+        live = np.flatnonzero(self.alive)
+        if not len(live):
+            return
+        
+        # Fade colors with remaining lifetime and convert everything in one pass
+        brightness = np.clip(self.lifetime[live] / self.max_lifetime[live], 0, 1)
+        colors = (self.color[live] * brightness[:, None]).astype(int).tolist()
+        xs = self.x[live].astype(int).tolist()
+        ys = self.y[live].astype(int).tolist()
+        sizes = np.maximum(1, self.size[live].astype(int)).tolist()
+        
+        draw_circle = pygame.draw.circle
+        for color, x, y, size in zip(colors, xs, ys, sizes):
+            draw_circle(screen, color, (x, y), size)
+    
+    def get_dirty_rects(self, tile_size=32):
+        """Return the grid tiles that contain particles, for dirty-rect rendering"""
+        live = np.flatnonzero(self.alive)
+        if not len(live):
+            return []
+        
+        # Particles are small, so marking the tiles of both bounding box corners is enough
+        size = np.maximum(1, self.size[live])
+        x = self.x[live]
+        y = self.y[live]
+        tiles = np.concatenate([
+            np.stack([(x - size) // tile_size, (y - size) // tile_size], axis=1),
+            np.stack([(x + size) // tile_size, (y + size) // tile_size], axis=1),
+            np.stack([(x - size) // tile_size, (y + size) // tile_size], axis=1),
+            np.stack([(x + size) // tile_size, (y - size) // tile_size], axis=1)
+        ]).astype(int)
+        tiles = np.unique(tiles, axis=0).tolist()
+        return [pygame.Rect(tx * tile_size, ty * tile_size, tile_size, tile_size) for tx, ty in tiles]
+
+
+def create_particle_system(capacity=8192, seed=None):
+    """Return the NumPy-backed particle system, or the list-based one without NumPy"""
+    if np is not None:
+        return ArrayParticleSystem(capacity, seed)
+    return ParticleSystem(random.Random(seed))
@@ -1,5 +1,6 @@
 import pygame
 import math
+from .surface_cache import surface_cache
 
 class Player:
     def __init__(self, x, y, screen_width, screen_height):
@@ -153,9 +154,8 @@ class Player:
             shield_radius = self.get_collision_radius() * 1.5
             shield_color = (100, 150, 255, 128)  # Light blue with transparency
             
-            # Create a surface for the shield with transparency
-            shield_surface = pygame.Surface((shield_radius * 2, shield_radius * 2), pygame.SRCALPHA)
-            pygame.draw.circle(shield_surface, shield_color, (shield_radius, shield_radius), shield_radius)
+            # Get the shared translucent shield surface
+            shield_surface = surface_cache.get_circle(shield_radius, shield_color)
             
             # Draw the shield centered on the player
             screen.blit(shield_surface, (self.x - shield_radius, self.y - shield_radius))
@@ -0,0 +1,83 @@
+class ObjectPool:
+    """Free list of reusable instances of one class.
+
+    acquire(*args) returns a released instance re-initialised with
+    obj.reset(*args), or a new cls(*args) when the free list is empty, so
+    pooled classes implement reset() with the same arguments as __init__.
+    Released objects only become reusable after the next recycle(): code
+    that still holds a reference during the current tick (e.g. splitting a
+    destroyed asteroid at its position) keeps seeing valid data.
+    Subclass instances are never pooled, only exact instances of cls, and
+    releasing an object that is already in the pool does nothing, so it
+    can't be handed out twice.
+    """
+    def __init__(self, cls, name=None, max_free=1024):
+        self.cls = cls
+        self.name = name or cls.__name__
+        self.max_free = max_free
+        self.free = []
+        self.pending = []
+
+        # ids of the objects in free and pending (the lists keep them alive)
+        self.pooled = set()
+
+        # Statistics
+        self.created = 0
+        self.reused = 0
+        self.released = 0
+        self.in_use = 0
+        self.high_water = 0
+
+    def acquire(self, *args, **kwargs):
+        if self.free:
+            obj = self.free.pop()
+            self.pooled.discard(id(obj))
+            obj.reset(*args, **kwargs)
+            self.reused += 1
+        else:
+            obj = self.cls(*args, **kwargs)
+            self.created += 1
+
+        self.in_use += 1
+        if self.in_use > self.high_water:
+            self.high_water = self.in_use
+        return obj
+
+    def release(self, obj):
+        """Return an object to the pool; it is reused after the next recycle()"""
+        if type(obj) is not self.cls or id(obj) in self.pooled:
+            return
+        self.pooled.add(id(obj))
+        self.pending.append(obj)
+        self.released += 1
+        self.in_use = max(0, self.in_use - 1)
+
+    def release_all(self, objects):
+        for obj in objects:
+            self.release(obj)
+
+    def recycle(self):
+        """Make the objects released since the last call available to acquire()"""
+        if self.pending:
+            room = self.max_free - len(self.free)
+            self.free.extend(self.pending[:room])
+            for obj in self.pending[room:]:
+                self.pooled.discard(id(obj))
+            self.pending.clear()
+
+    def clear(self):
+        self.free.clear()
+        self.pending.clear()
+        self.pooled.clear()
+
+    def get_stats(self):
+        acquired = self.created + self.reused
+        return {
+            "created": self.created,
+            "reused": self.reused,
+            "released": self.released,
+            "in_use": self.in_use,
+            "free": len(self.free),
+            "high_water": self.high_water,
+            "reuse_rate": self.reused / acquired if acquired else 0.0
+        }
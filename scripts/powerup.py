@@ -1,5 +1,7 @@
 import pygame
 import math
+from .text_cache import text_cache
+from .surface_cache import surface_cache
 
 class PowerUp:
     def __init__(self, x, y, powerup_type):
@@ -64,10 +66,8 @@ class PowerUp:
         # Draw outer glow
         for i in range(3):
             alpha = 100 - i * 30
-            glow_radius = pulse_radius + i * 2
-            glow_surface = pygame.Surface((glow_radius * 2, glow_radius * 2), pygame.SRCALPHA)
-            pygame.draw.circle(glow_surface, (*self.color, alpha), 
-                              (glow_radius, glow_radius), glow_radius)
+            glow_radius = int(pulse_radius + i * 2)
+            glow_surface = surface_cache.get_circle(glow_radius, (*self.color, alpha))
             screen.blit(glow_surface, (self.x - glow_radius, self.y - glow_radius))
         
         # Draw main circle
@@ -77,8 +77,7 @@ class PowerUp:
         pygame.draw.circle(screen, (255, 255, 255), (int(self.x), int(self.y)), int(pulse_radius), 2)
         
         # Draw symbol
-        font = pygame.font.SysFont(None, 24)
-        text = font.render(self.symbol, True, (255, 255, 255))
+        text = text_cache.render(text_cache.get_font(24), self.symbol, (255, 255, 255))
         text_rect = text.get_rect(center=(self.x, self.y))
         screen.blit(text, text_rect)
         
@@ -0,0 +1,209 @@
+import pygame
+import time
+import json
+import csv
+from collections import deque
+from .text_cache import text_cache
+from .surface_cache import surface_cache
+
+# Colors used for the phases in the overlay graph
+PHASE_COLORS = [
+    (255, 99, 71), (255, 165, 0), (255, 215, 0), (154, 205, 50), (60, 179, 113),
+    (72, 209, 204), (100, 149, 237), (123, 104, 238), (218, 112, 214), (255, 105, 180),
+    (188, 143, 143), (210, 180, 140), (169, 169, 169), (240, 240, 240)
+]
+
+
+class PhaseTimer:
+    """Context manager that adds the elapsed wall time to a profiler phase"""
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        elapsed_ms = (time.perf_counter() - self.start) * 1000
+        current = self.profiler.current
+        current[self.name] = current.get(self.name, 0.0) + elapsed_ms
+        return False
+
+
+class NullTimer:
+    """Stand-in returned while profiling is disabled"""
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+
+NULL_TIMER = NullTimer()
+
+
+class FrameProfiler:
+    """Per-phase frame timing with a ring buffer history and an optional overlay.
+
+    Wrap each phase in `with profiler.phase("name"):`. Times from several
+    simulation steps in one frame are summed, and end_frame() pushes the
+    frame's totals (and entity counts) into fixed-size ring buffers.
+    """
+    def __init__(self, history=3600, enabled=True, budget_ms=1000 / 60):
+        self.history = history
+        self.enabled = enabled
+        self.budget_ms = budget_ms
+        self.overlay_visible = False
+
+        self.timers = {}
+        self.current = {}
+        self.samples = {}  # phase name -> deque of per-frame milliseconds
+        self.frame_totals = deque(maxlen=history)
+        self.entity_counts = {}  # entity name -> deque of per-frame counts
+        self.frames = 0
+
+    def phase(self, name):
+        if not self.enabled:
+            return NULL_TIMER
+        timer = self.timers.get(name)
+        if timer is None:
+            timer = self.timers[name] = PhaseTimer(self, name)
+        return timer
+
+    def toggle_overlay(self):
+        self.overlay_visible = not self.overlay_visible
+
+    def end_frame(self, entity_counts=None):
+        """Store this frame's phase times and entity counts in the ring buffers"""
+        if not self.enabled:
+            return
+
+        total = 0.0
+        for name, elapsed in self.current.items():
+            samples = self.samples.get(name)
+            if samples is None:
+                # Pad new phases so every buffer stays aligned with frame_totals
+                samples = self.samples[name] = deque([0.0] * len(self.frame_totals), maxlen=self.history)
+            samples.append(elapsed)
+            total += elapsed
+
+        # Phases that didn't run this frame record zero
+        for name, samples in self.samples.items():
+            if name not in self.current:
+                samples.append(0.0)
+
+        self.frame_totals.append(total)
+        self.current = {}
+        self.frames += 1
+
+        if entity_counts:
+            for name, count in entity_counts.items():
+                counts = self.entity_counts.get(name)
+                if counts is None:
+                    counts = self.entity_counts[name] = deque(maxlen=self.history)
+                counts.append(count)
+
+    @staticmethod
+    def percentile(sorted_values, fraction):
+        if not sorted_values:
+            return 0.0
+        index = min(len(sorted_values) - 1, int(fraction * len(sorted_values)))
+        return sorted_values[index]
+
+    @staticmethod
+    def summarize(values):
+        ordered = sorted(values)
+        count = len(ordered)
+        return {
+            "mean": sum(ordered) / count if count else 0.0,
+            "p50": FrameProfiler.percentile(ordered, 0.50),
+            "p95": FrameProfiler.percentile(ordered, 0.95),
+            "p99": FrameProfiler.percentile(ordered, 0.99),
+            "max": ordered[-1] if ordered else 0.0
+        }
+
+    def get_report(self):
+        """Return percentile statistics for every phase and entity count"""
+        return {
+            "frames": len(self.frame_totals),
+            "budget_ms": self.budget_ms,
+            "over_budget_frames": sum(1 for total in self.frame_totals if total > self.budget_ms),
+            "frame_total_ms": self.summarize(self.frame_totals),
+            "phases_ms": {name: self.summarize(samples) for name, samples in self.samples.items()},
+            "entity_counts": {name: self.summarize(counts) for name, counts in self.entity_counts.items()}
+        }
+
+    def dump(self, path):
+        """Write the report as CSV if path ends in .csv, otherwise as JSON"""
+        report = self.get_report()
+
+        if path.lower().endswith(".csv"):
+            with open(path, "w", newline="") as f:
+                writer = csv.writer(f)
+                writer.writerow(["kind", "name", "mean", "p50", "p95", "p99", "max"])
+                rows = [("frame", "total", report["frame_total_ms"])]
+                rows += [("phase_ms", name, stats) for name, stats in report["phases_ms"].items()]
+                rows += [("entities", name, stats) for name, stats in report["entity_counts"].items()]
+                for kind, name, stats in rows:
+                    writer.writerow([kind, name] + [round(stats[key], 4) for key in ("mean", "p50", "p95", "p99", "max")])
+        else:
+            with open(path, "w") as f:
+                json.dump(report, f, indent=2)
+
+    def draw_overlay(self, screen, frames_shown=200, graph_height=100):
+        """Draw a stacked per-phase frame time graph with a legend; returns the panel rect"""
+        if not self.overlay_visible or not self.frame_totals:
+            return None
+
+        names = list(self.samples.keys())
+        width = frames_shown + 190
+        height = graph_height + 30
+        left = screen.get_width() - width - 10
+        top = screen.get_height() - height - 10
+
+        panel = surface_cache.get_filled((width, height), (0, 0, 0, 170))
+        screen.blit(panel, (left, top))
+
+        # Scale so the frame budget sits at half the graph height
+        scale = graph_height / (self.budget_ms * 2)
+        base_y = top + height - 10
+        shown = min(frames_shown, len(self.frame_totals))
+        start = len(self.frame_totals) - shown
+
+        for column in range(shown):
+            frame = start + column
+            y = base_y
+            for index, name in enumerate(names):
+                bar = self.samples[name][frame] * scale
+                if bar < 0.5:
+                    continue
+                bar = min(bar, y - top)
+                color = PHASE_COLORS[index % len(PHASE_COLORS)]
+                pygame.draw.line(screen, color, (left + 5 + column, y), (left + 5 + column, y - bar))
+                y -= bar
+
+        # Budget line
+        budget_y = base_y - self.budget_ms * scale
+        pygame.draw.line(screen, (255, 255, 255), (left + 5, budget_y), (left + 5 + frames_shown, budget_y))
+
+        # Legend with the mean over the visible frames
+        font = text_cache.get_font(16)
+        legend_x = left + frames_shown + 15
+        legend_y = top + 5
+        recent_total = sum(list(self.frame_totals)[start:]) / shown
+        text_cache.draw_composed(screen, font, "frame ", f"{recent_total:.2f}ms", (255, 255, 255), legend_x, legend_y)
+        for index, name in enumerate(names):
+            legend_y += 12
+            if legend_y > top + height - 12:
+                break
+            recent = sum(list(self.samples[name])[start:]) / shown
+            color = PHASE_COLORS[index % len(PHASE_COLORS)]
+            text_cache.draw_composed(screen, font, f"{name} ", f"{recent:.2f}", color, legend_x, legend_y)
+        
+        return pygame.Rect(left, top, width, height)
@@ -0,0 +1,184 @@
+import argparse
+import struct
+import zlib
+from .campaign import Campaign
+
+# File layout: fixed header followed by a zlib-compressed record stream
+MAGIC = b"ADRP"
+HEADER = struct.Struct("<4sHIHHhII?")  # magic, version, seed, width, height, sector, ticks, state hash, bounce
+
+# Replays only play back under the simulation rules they were recorded with,
+# so VERSION goes up with every change to the simulation:
+#   2: asteroid shapes come from the shape library
+#   3: swept projectile collisions
+#   4: polygon collisions
+#   5: asteroid bounces
+#   6: black holes pull every body
+#   7: wormhole networks
+#   8: asteroids no longer hit the escort target
+#   9: stored entities are removed by swapping in the last one
+#  10: campaign missions restart every wave
+#  11: bosses can no longer be shot or rammed
+#  12: missions no longer restart every wave and shop purchases are ignored again, as before 10
+#  13: asteroid bounces are optional (off by default) and recorded in the header
+VERSION = 13
+
+# Record types. Input masks are below 0x20 and are followed by a varint run length.
+RECORD_PURCHASE = 0x40  # low bits hold the shop item index
+RECORD_CONTINUE = 0x80
+
+
+def write_varint(out, value):
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def read_varint(data, pos):
+    value = 0
+    shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+
+
+class ReplayRecorder:
+    """Records a game's seed, per-tick input masks and shop actions.
+
+    Identical consecutive input masks are stored as one run, so a whole game
+    usually compresses to a few kilobytes.
+    """
+    def __init__(self, game, sector_index=-1):
+        self.game = game
+        self.seed = game.seed
+        self.width = game.width
+        self.height = game.height
+        self.sector_index = sector_index
+        self.asteroid_bounce = game.asteroid_bounce
+
+        self.records = []  # [mask, run length] lists and ("purchase", index) / ("continue",) tuples
+        self.ticks = 0
+
+    def record_tick(self, input_bits):
+        self.ticks += 1
+        if self.records and isinstance(self.records[-1], list) and self.records[-1][0] == input_bits:
+            self.records[-1][1] += 1
+        else:
+            self.records.append([input_bits, 1])
+
+    def record_purchase(self, item_index):
+        self.records.append(("purchase", item_index))
+
+    def record_continue(self):
+        self.records.append(("continue",))
+
+    def encode(self):
+        body = bytearray()
+        for record in self.records:
+            if isinstance(record, list):
+                body.append(record[0])
+                write_varint(body, record[1])
+            elif record[0] == "purchase":
+                body.append(RECORD_PURCHASE | record[1])
+            else:
+                body.append(RECORD_CONTINUE)
+
+        header = HEADER.pack(MAGIC, VERSION, self.seed, self.width, self.height,
+                             self.sector_index, self.ticks, self.game.get_state_hash(), self.asteroid_bounce)
+        return header + zlib.compress(bytes(body), 9)
+
+    def save(self, path):
+        with open(path, "wb") as f:
+            f.write(self.encode())
+
+
+class Replay:
+    """A decoded replay file"""
+    def __init__(self, seed, width, height, sector_index, ticks, state_hash, records, asteroid_bounce=False):
+        self.seed = seed
+        self.width = width
+        self.height = height
+        self.sector_index = sector_index
+        self.ticks = ticks
+        self.state_hash = state_hash
+        self.records = records
+        self.asteroid_bounce = asteroid_bounce
+
+
+def load_replay(path):
+    with open(path, "rb") as f:
+        data = f.read()
+
+    magic, version, seed, width, height, sector_index, ticks, state_hash, asteroid_bounce = HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError(f"{path} is not an Asteroid Dodger replay")
+    if version != VERSION:
+        raise ValueError(f"Unsupported replay version {version}")
+
+    body = zlib.decompress(data[HEADER.size:])
+    records = []
+    pos = 0
+    while pos < len(body):
+        kind = body[pos]
+        pos += 1
+        if kind & RECORD_CONTINUE:
+            records.append(("continue",))
+        elif kind & RECORD_PURCHASE:
+            records.append(("purchase", kind & ~RECORD_PURCHASE))
+        else:
+            count, pos = read_varint(body, pos)
+            records.append([kind, count])
+
+    return Replay(seed, width, height, sector_index, ticks, state_hash, records, asteroid_bounce)
+
+
+def play_replay(replay, game=None):
+    """Re-simulate a replay headlessly; returns (game, matches) where matches
+    tells whether the final state hash equals the recorded one"""
+    if game is None:
+        from .headless import create_headless_game
+        game = create_headless_game(replay.width, replay.height)
+
+    game.asteroid_bounce = replay.asteroid_bounce
+    game.reset(replay.seed)
+    if replay.sector_index >= 0:
+        game.set_campaign_mission(Campaign.create_sectors()[replay.sector_index])
+
+    for record in replay.records:
+        if isinstance(record, list):
+            input_bits, count = record
+            for _ in range(count):
+                game.apply_input(input_bits)
+                game.update()
+                game.end_frame()
+        elif record[0] == "purchase":
+            game.shop.purchase_item(record[1])
+        else:
+            game.close_shop()
+
+    return game, game.get_state_hash() == replay.state_hash
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Verify an Asteroid Dodger replay by re-simulating it")
+    parser.add_argument("replay", help="replay file written with main.py --record")
+    args = parser.parse_args(argv)
+
+    replay = load_replay(args.replay)
+    game, matches = play_replay(replay)
+
+    print(f"Seed {replay.seed}, {replay.ticks} ticks, final score {game.score}, wave {game.wave}")
+    if matches:
+        print("Replay verified: final state matches the recording")
+    else:
+        print("Replay DESYNC: final state differs from the recording")
+    return 0 if matches else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,179 @@
+import json
+import math
+import random
+
+# Bump when the shape generation changes, so stale cache files are rebuilt
+LIBRARY_VERSION = 1
+
+# Irregular shapes: type -> (radius, vertices, irregularity)
+IRREGULAR_SHAPES = {
+    "small": (10, 5, 0.3),
+    "medium": (20, 8, 0.4),
+    "large": (30, 10, 0.5),
+    "boss": (50, 12, 0.2)
+}
+
+# Crystals: (radius, vertices, min and max radius jitter)
+CRYSTAL_SHAPE = (20, 6, -0.1, 0.3)
+
+# Star-like shapes with alternating long and short points: type -> (radius, vertices, long, short)
+STAR_SHAPES = {
+    "blade": (25, 8, 1.5, 0.7),
+    "blade_fragment": (10, 5, 1.3, 0.8)
+}
+
+
+def generate_irregular_points(radius, num_points, irregularity, rng):
+    """Generate an irregular polygon with the given radius and number of points"""
+    points = []
+    angle_step = 2 * math.pi / num_points
+
+    for i in range(num_points):
+        angle = i * angle_step
+        # Add some irregularity to the radius
+        r = radius * (1 + rng.uniform(-irregularity, irregularity))
+        points.append((math.cos(angle) * r, math.sin(angle) * r))
+
+    return tuple(points)
+
+
+def generate_crystal_points(radius, num_points, min_jitter, max_jitter, rng):
+    """Generate a crystal-like polygon"""
+    points = []
+    angle_step = 2 * math.pi / num_points
+
+    for i in range(num_points):
+        angle = i * angle_step
+        r = radius * (1.0 + rng.uniform(min_jitter, max_jitter))
+        points.append((math.cos(angle) * r, math.sin(angle) * r))
+
+    return tuple(points)
+
+
+def generate_star_points(radius, num_points, long_scale, short_scale):
+    """Generate a polygon with alternating long and short points"""
+    points = []
+    angle_step = 2 * math.pi / num_points
+
+    for i in range(num_points):
+        angle = i * angle_step
+        r = radius * (long_scale if i % 2 == 0 else short_scale)
+        points.append((math.cos(angle) * r, math.sin(angle) * r))
+
+    return tuple(points)
+
+
+class ShapeLibrary:
+    """Pre-generated polygon shapes for every asteroid type.
+
+    Each irregular type gets a fixed set of variants generated once from the
+    library's own seed (or loaded from a cache file); deterministic shapes
+    such as blades have a single variant. Spawning picks a variant by index,
+    so asteroids of a type share the same immutable vertex tuples and
+    therefore the same baked rotation sprites in the sprite cache.
+    The shapes are built on first use, from cache_path when it is set.
+    """
+    def __init__(self, variants=16, seed=0, cache_path=None):
+        self.variants = variants
+        self.seed = seed
+        self.cache_path = cache_path
+        self.shapes = None
+
+    def generate(self):
+        rng = random.Random(self.seed)
+        shapes = {}
+        for shape_type, (radius, num_points, irregularity) in IRREGULAR_SHAPES.items():
+            shapes[shape_type] = [generate_irregular_points(radius, num_points, irregularity, rng)
+                                  for _ in range(self.variants)]
+
+        radius, num_points, min_jitter, max_jitter = CRYSTAL_SHAPE
+        shapes["crystal"] = [generate_crystal_points(radius, num_points, min_jitter, max_jitter, rng)
+                             for _ in range(self.variants)]
+
+        for shape_type, (radius, num_points, long_scale, short_scale) in STAR_SHAPES.items():
+            shapes[shape_type] = [generate_star_points(radius, num_points, long_scale, short_scale)]
+
+        self.shapes = shapes
+
+    def get_variant_counts(self):
+        """Return the number of variants generate() makes for every shape type"""
+        counts = dict.fromkeys(IRREGULAR_SHAPES, self.variants)
+        counts["crystal"] = self.variants
+        counts.update(dict.fromkeys(STAR_SHAPES, 1))
+        return counts
+
+    def load(self, path):
+        """Load shapes from a cache file; returns False if it is missing, stale or incomplete"""
+        try:
+            with open(path, "r") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return False
+
+        if (data.get("version") != LIBRARY_VERSION or data.get("variants") != self.variants
+                or data.get("seed") != self.seed):
+            return False
+
+        # Every shape type needs all of its variants, or pick_shape would fail later
+        shapes = data.get("shapes")
+        if not isinstance(shapes, dict):
+            return False
+        for shape_type, count in self.get_variant_counts().items():
+            variants = shapes.get(shape_type)
+            if not isinstance(variants, list) or len(variants) != count:
+                return False
+
+        try:
+            self.shapes = {shape_type: [tuple((float(x), float(y)) for x, y in variant) for variant in variants]
+                           for shape_type, variants in shapes.items()}
+        except (TypeError, ValueError):
+            return False
+        return True
+
+    def save(self, path):
+        data = {
+            "version": LIBRARY_VERSION,
+            "variants": self.variants,
+            "seed": self.seed,
+            "shapes": self.get_shapes()
+        }
+        with open(path, "w") as f:
+            json.dump(data, f)
+
+    def load_or_generate(self, path):
+        """Load the shapes from path, or generate them and write the cache file"""
+        if self.load(path):
+            return
+        self.generate()
+        try:
+            self.save(path)
+        except OSError:
+            pass  # The cache is only an optimisation
+
+    def get_shapes(self):
+        if self.shapes is None:
+            if self.cache_path:
+                self.load_or_generate(self.cache_path)
+            else:
+                self.generate()
+        return self.shapes
+
+    def pick_shape(self, shape_type, rng=None):
+        """Return (key, vertices) of a random variant of a shape type.
+
+        The key, (shape_type, variant index), identifies the vertices for
+        the sprite cache.
+        """
+        variants = self.get_shapes()[shape_type]
+        if len(variants) == 1:
+            return (shape_type, 0), variants[0]
+        rng = rng if rng is not None else random
+        index = rng.randrange(len(variants))
+        return (shape_type, index), variants[index]
+
+
+# Cache file written next to the high scores
+SHAPE_CACHE_PATH = "shape_cache.json"
+
+# Shared instance used by all asteroid types
+shape_library = ShapeLibrary()
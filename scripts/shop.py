@@ -1,5 +1,7 @@
 import pygame
 import math
+from .text_cache import text_cache, SharedFont
+from .surface_cache import surface_cache
 
 class ShopItem:
     def __init__(self, name, description, cost, max_level, current_level=0):
@@ -28,6 +30,12 @@ class ShopItem:
 
 
 class Shop:
+    # Fonts (loaded on first use)
+    font_title = SharedFont(48)
+    font_large = SharedFont(36)
+    font_medium = SharedFont(28)
+    font_small = SharedFont(20)
+    
     def __init__(self, width, height):
         self.width = width
         self.height = height
@@ -37,12 +45,7 @@ class Shop:
         self.selected_item = 0
         self.points = 0
         self.wave = 1
-        
-        # Load fonts
-        self.font_title = pygame.font.SysFont(None, 48)
-        self.font_large = pygame.font.SysFont(None, 36)
-        self.font_medium = pygame.font.SysFont(None, 28)
-        self.font_small = pygame.font.SysFont(None, 20)
+        self.needs_redraw = True  # The shop is static, so it's only redrawn after a change
         
         # Create shop items
         self.items = [
@@ -69,11 +72,13 @@ class Shop:
     def set_points(self, points):
         """Set available points for shopping"""
         self.points = points
+        self.needs_redraw = True
     
     def set_wave(self, wave):
         """Set the current wave number"""
         self.wave = wave
         self.continue_button['text'] = f"Continue to Wave {wave + 1}"
+        self.needs_redraw = True
     
     def handle_event(self, event):
         if not self.active:
@@ -96,6 +101,7 @@ class Shop:
             item_clicked = self.get_clicked_item(mouse_pos)
             if item_clicked is not None:
                 self.selected_item = item_clicked
+                self.needs_redraw = True
                 
                 # Check for purchase (right side of item)
                 if self.is_buy_button_clicked(mouse_pos, item_clicked):
@@ -104,8 +110,10 @@ class Shop:
         elif event.type == pygame.KEYDOWN:
             if event.key == pygame.K_UP:
                 self.selected_item = (self.selected_item - 1) % len(self.items)
+                self.needs_redraw = True
             elif event.key == pygame.K_DOWN:
                 self.selected_item = (self.selected_item + 1) % len(self.items)
+                self.needs_redraw = True
             elif event.key == pygame.K_SPACE or event.key == pygame.K_RETURN:
                 self.purchase_item(self.selected_item)
             elif event.key == pygame.K_ESCAPE:
@@ -120,7 +128,10 @@ class Shop:
     def check_hover(self, mouse_pos):
         """Check if mouse is hovering over items or buttons"""
         # Check continue button
-        self.continue_button['hover'] = self.continue_button['rect'].collidepoint(mouse_pos)
+        hover = self.continue_button['rect'].collidepoint(mouse_pos)
+        if hover != self.continue_button['hover']:
+            self.continue_button['hover'] = hover
+            self.needs_redraw = True
     
     def get_clicked_item(self, mouse_pos):
         """Return the index of the clicked item, or None"""
@@ -152,6 +163,7 @@ class Shop:
         if item.can_upgrade(self.points):
             cost = item.upgrade()
             self.points -= cost
+            self.needs_redraw = True
             return True
         
         return False
@@ -170,16 +182,15 @@ class Shop:
         print("Drawing shop screen")
         
         # Draw semi-transparent background
-        overlay = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 200))
+        overlay = surface_cache.get_filled((self.width, self.height), (0, 0, 0, 200))
         screen.blit(overlay, (0, 0))
         
         # Draw shop title
-        title_text = self.font_title.render("UPGRADE SHOP", True, (255, 255, 255))
+        title_text = text_cache.render(self.font_title, "UPGRADE SHOP", (255, 255, 255))
         screen.blit(title_text, (self.width // 2 - title_text.get_width() // 2, 50))
         
         # Draw available points
-        points_text = self.font_large.render(f"Available Points: {self.points}", True, (255, 255, 0))
+        points_text = text_cache.render(self.font_large, f"Available Points: {self.points}", (255, 255, 0))
         screen.blit(points_text, (self.width // 2 - points_text.get_width() // 2, 100))
         
         # Draw items
@@ -187,6 +198,8 @@ class Shop:
         
         # Draw continue button
         self.draw_continue_button(screen)
+        
+        self.needs_redraw = False
     
     def draw_items(self, screen):
         item_height = 60
@@ -208,23 +221,23 @@ class Shop:
                                 (100, item_y, self.width - 200, item_height), 1)
             
             # Draw item name
-            name_text = self.font_medium.render(item.name, True, (255, 255, 255))
+            name_text = text_cache.render(self.font_medium, item.name, (255, 255, 255))
             screen.blit(name_text, (120, item_y + 10))
             
             # Draw item level
-            level_text = self.font_small.render(f"Level: {item.current_level}/{item.max_level}", 
-                                              True, (200, 200, 200))
+            level_text = text_cache.render(self.font_small, f"Level: {item.current_level}/{item.max_level}", 
+                                              (200, 200, 200))
             screen.blit(level_text, (120, item_y + 35))
             
             # Draw item description
-            desc_text = self.font_small.render(item.description, True, (200, 200, 200))
+            desc_text = text_cache.render(self.font_small, item.description, (200, 200, 200))
             screen.blit(desc_text, (300, item_y + 20))
             
             # Draw buy button
             buy_color = (0, 200, 0) if item.can_upgrade(self.points) else (100, 100, 100)
             pygame.draw.rect(screen, buy_color, (self.width - 150, item_y + 15, 100, 30))
             
-            cost_text = self.font_small.render(f"Buy: {item.get_cost()}", True, (255, 255, 255))
+            cost_text = text_cache.render(self.font_small, f"Buy: {item.get_cost()}", (255, 255, 255))
             screen.blit(cost_text, (self.width - 140, item_y + 20))
     
     def draw_continue_button(self, screen):
@@ -234,6 +247,6 @@ class Shop:
         pygame.draw.rect(screen, (100, 200, 255), self.continue_button['rect'], 2)
         
         # Draw text
-        text = self.font_medium.render(self.continue_button['text'], True, (255, 255, 255))
+        text = text_cache.render(self.font_medium, self.continue_button['text'], (255, 255, 255))
         text_rect = text.get_rect(center=self.continue_button['rect'].center)
         screen.blit(text, text_rect)
@@ -0,0 +1,102 @@
+from operator import attrgetter
+from .entity_store import EntityStore, X, Y, RADIUS
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, the sweep runs in plain Python without it
+    np = None
+
+# Below this many objects the plain Python sweep is faster than NumPy's per-call overhead
+MIN_BATCH_SIZE = 64
+
+
+class SortAndSweep:
+    """Sort-and-sweep broad phase that keeps its sort order between ticks.
+
+    Objects (with x, y and radius) are kept in a list sorted by the left
+    edge of their bounding box. Objects move little from one tick to the
+    next, so last tick's list is already almost sorted and re-sorting it
+    (Python's sort is adaptive and only has to fix the few swapped
+    neighbours) costs close to linear time. The sweep then only compares
+    each object with the following ones whose x intervals overlap it; with
+    NumPy, large sets are sorted (with NumPy's equally adaptive stable sort)
+    and have those candidates generated and tested in one batch, reading
+    the bounds straight from an EntityStore's columns.
+    """
+    def __init__(self):
+        self.order = []
+        self.members = set()  # id() of every object in order
+
+    def sync(self, objects):
+        """Drop removed objects and add new ones (the sweep restores the sort order)"""
+        ids = set(map(id, objects))
+        if ids != self.members:
+            order = [obj for obj in self.order if id(obj) in ids]
+            order.extend(obj for obj in objects if id(obj) not in self.members)
+            self.order = order
+            self.members = ids
+
+    def find_pairs(self, objects):
+        """Return the pairs of objects whose bounding boxes overlap"""
+        self.sync(objects)
+        # Stored entities are swept in NumPy at any size: their columns are
+        # cheaper to read than every bound through the wrappers
+        if isinstance(objects, EntityStore) or (np is not None and len(self.order) >= MIN_BATCH_SIZE):
+            return self.find_pairs_batched(objects)
+
+        self.order.sort(key=lambda obj: obj.x - obj.radius)
+        order = self.order
+        lefts = [obj.x - obj.radius for obj in order]
+        count = len(order)
+
+        pairs = []
+        for i, a in enumerate(order):
+            right = a.x + a.radius
+            for j in range(i + 1, count):
+                if lefts[j] > right:
+                    break
+                b = order[j]
+                if abs(a.y - b.y) <= a.radius + b.radius:
+                    pairs.append((a, b))
+        return pairs
+
+    def find_pairs_batched(self, objects):
+        """The same sweep, with every candidate pair generated and tested in NumPy"""
+        order = self.order
+        count = len(order)
+        if isinstance(objects, EntityStore):
+            slots = np.fromiter(map(attrgetter("store_index"), order), int, count)
+            x = objects.column(X)[slots]
+            y = objects.column(Y)[slots]
+            radius = objects.column(RADIUS)[slots]
+        else:
+            x = np.fromiter(map(attrgetter("x"), order), float, count)
+            y = np.fromiter(map(attrgetter("y"), order), float, count)
+            radius = np.fromiter(map(attrgetter("radius"), order), float, count)
+
+        # Restore the sort order (last tick's order is almost sorted already)
+        lefts = x - radius
+        ranks = np.argsort(lefts, kind="stable")
+        order = self.order = [order[i] for i in ranks.tolist()]
+        x = x[ranks]
+        y = y[ranks]
+        radius = radius[ranks]
+        lefts = lefts[ranks]
+
+        # Each object's candidates are the following ones that start before it ends
+        ends = np.searchsorted(lefts, x + radius, side="right")
+        counts = np.maximum(ends - np.arange(count) - 1, 0)
+        total = int(counts.sum())
+        if not total:
+            return []
+
+        first = np.repeat(np.arange(count), counts)
+        offsets = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+        second = first + 1 + offsets
+
+        overlap = np.abs(y[first] - y[second]) <= radius[first] + radius[second]
+        return [(order[i], order[j]) for i, j in zip(first[overlap].tolist(), second[overlap].tolist())]
+
+    def clear(self):
+        self.order.clear()
+        self.members.clear()
@@ -1,84 +1,180 @@
 import pygame
 import os
 import math
+from .sound_synth import get_sound_pcm
 
-class SoundManager:
-    def __init__(self):
-        # Initialize pygame mixer if not already initialized
-        if not pygame.mixer.get_init():
-            pygame.mixer.init()
+# Sound files, used instead of the synthesised placeholders when they exist
+SOUND_FILES = {
+    "laser": "assets/sounds/laser.wav",
+    "explosion": "assets/sounds/explosion.wav",
+    "player_hit": "assets/sounds/player_hit.wav",
+    "powerup": "assets/sounds/powerup.wav",
+    "wave": "assets/sounds/wave.wav",
+    "game_over": "assets/sounds/game_over.wav",
+    "menu_select": "assets/sounds/menu_select.wav"
+}
+
+# Mixer channels reserved for each category of sound
+CATEGORY_CHANNELS = {
+    "weapons": 3,
+    "explosions": 4,
+    "player": 1,
+    "events": 1,
+    "ui": 1
+}
+
+# name -> (category, priority, cooldown in seconds of game time). Higher priorities steal voices from lower ones.
+SOUND_SETTINGS = {
+    "laser": ("weapons", 0, 0.05),
+    "explosion": ("explosions", 1, 0.04),
+    "player_hit": ("player", 3, 0.1),
+    "powerup": ("events", 2, 0.0),
+    "wave": ("events", 2, 0.5),
+    "game_over": ("events", 3, 0.0),
+    "menu_select": ("ui", 1, 0.05)
+}
+
+# Slack for the summed step lengths, so a cooldown that lasts a whole number of steps isn't lost to rounding
+COOLDOWN_EPSILON = 1e-9
+
+
+class ChannelManager:
+    """Plays sounds on a fixed set of mixer channels, reserved per category.
+
+    Each category owns its own channels, so a burst of one kind of sound
+    can't starve the others. When all of a category's channels are busy the
+    lowest-priority (then oldest) voice is stolen if the new sound's
+    priority is at least as high; otherwise the new sound is dropped. The
+    number of simultaneous voices is therefore bounded by the channel count.
+    """
+    def __init__(self, categories=CATEGORY_CHANNELS):
+        total = sum(categories.values())
+        if pygame.mixer.get_num_channels() < total:
+            pygame.mixer.set_num_channels(total)
+        # Keep Sound.play() from picking the managed channels
+        pygame.mixer.set_reserved(total)
         
-        # Sound effects dictionary
-        self.sounds = {}
+        # category -> list of voices, each [channel, priority, start sequence]
+        self.voices = {}
+        index = 0
+        for category, count in categories.items():
+            self.voices[category] = [[pygame.mixer.Channel(index + i), 0, 0] for i in range(count)]
+            index += count
+        self.sequence = 0
+    
+    def play(self, sound, category, priority=0, pan=None):
+        """Play a sound in a category; pan (0 = left, 1 = right) sets stereo volume. Returns the channel or None."""
+        voices = self.voices[category]
+        voice = None
+        for candidate in voices:
+            if not candidate[0].get_busy():
+                voice = candidate
+                break
+        
+        if voice is None:
+            # Steal the lowest-priority, oldest voice
+            voice = min(voices, key=lambda v: (v[1], v[2]))
+            if voice[1] > priority:
+                return None
+            voice[0].stop()
+        
+        channel = voice[0]
+        channel.play(sound)
+        if pan is None:
+            channel.set_volume(1.0)
+        else:
+            # Equal-power panning
+            pan = max(0.0, min(1.0, pan))
+            channel.set_volume(math.cos(pan * math.pi / 2), math.sin(pan * math.pi / 2))
         
-        # Load sound effects
-        self.load_sounds()
+        voice[1] = priority
+        voice[2] = self.sequence
+        self.sequence += 1
+        return channel
+
+
+class SoundManager:
+    """Plays sound effects, loading each one the first time it is played.
+
+    Sounds come from SOUND_FILES when the file exists, otherwise from the
+    synthesiser (cached on disk), so creating the manager costs nothing
+    until a sound is actually needed.
+    """
+    def __init__(self, width=None):
+        # Loaded sound effects (filled lazily by get_sound)
+        self.sounds = {}
         
         # Set volume
         self.volume = 0.7
-        self.update_volume()
+        
+        # Screen width used to pan sounds by their x position (None disables panning)
+        self.width = width
+        
+        # Voice limiting (the channel manager is created with the first sound)
+        self.channels = None
+        self.time = 0.0  # game time, advanced by begin_frame()
+        self.last_played = {}  # name -> game time the sound last started
+        self.frame_sounds = set()  # names played since begin_frame()
     
-    def load_sounds(self):
-        """Load all sound effects"""
-        # Define sound file paths
-        sound_files = {
-            "laser": "assets/sounds/laser.wav",
-            "explosion": "assets/sounds/explosion.wav",
-            "player_hit": "assets/sounds/player_hit.wav",
-            "powerup": "assets/sounds/powerup.wav",
-            "wave": "assets/sounds/wave.wav",
-            "game_over": "assets/sounds/game_over.wav",
-            "menu_select": "assets/sounds/menu_select.wav"
-        }
+    def get_sound(self, name):
+        """Return the named sound, loading or synthesising it on first use"""
+        sound = self.sounds.get(name)
+        if sound is None:
+            sound = self.load_sound(name)
+            sound.set_volume(self.volume)
+            self.sounds[name] = sound
+        return sound
+    
+    def load_sound(self, name):
+        # Initialize pygame mixer if not already initialized
+        if not pygame.mixer.get_init():
+            pygame.mixer.init()
         
-        # Create placeholder sounds if files don't exist
-        for name, path in sound_files.items():
-            try:
-                if os.path.exists(path):
-                    self.sounds[name] = pygame.mixer.Sound(path)
-                else:
-                    # Create a placeholder sound (a short beep)
-                    self.sounds[name] = self.create_placeholder_sound(name)
-            except Exception as e:
-                print(f"Error loading sound {name}: {e}")
-                # Create a very simple sound as fallback
-                self.sounds[name] = pygame.mixer.Sound(buffer=bytearray(1000))
+        path = SOUND_FILES.get(name)
+        try:
+            if path and os.path.exists(path):
+                return pygame.mixer.Sound(path)
+            return self.create_placeholder_sound(name)
+        except Exception as e:
+            print(f"Error loading sound {name}: {e}")
+            # Create a very simple sound as fallback
+            return pygame.mixer.Sound(buffer=bytearray(1000))
+    
+    def load_sounds(self):
+        """Load every sound effect up front (sounds otherwise load on first play)"""
+        for name in SOUND_FILES:
+            self.get_sound(name)
     
     def create_placeholder_sound(self, name):
-        """Create a placeholder sound with different tones based on the name"""
-        # Create a short sound buffer
-        sample_rate = 22050
-        buffer_size = 4410  # 0.2 seconds at 22050Hz
-        
-        # Different frequencies for different sound types
-        frequencies = {
-            "laser": 440,      # A4 note
-            "explosion": 100,   # Low rumble
-            "player_hit": 220,  # A3 note
-            "powerup": 880,     # A5 note
-            "wave": 660,        # E5 note
-            "game_over": 165,   # E3 note
-            "menu_select": 330  # E4 note
-        }
-        
-        frequency = frequencies.get(name, 440)
+        """Create a synthesised placeholder sound in the mixer's sample format"""
+        sample_rate, audio_format, channels = pygame.mixer.get_init()
+        return pygame.mixer.Sound(buffer=get_sound_pcm(name, sample_rate, audio_format, channels))
+    
+    def begin_frame(self, dt):
+        """Start a new simulation step dt seconds long; each sound plays at most once per step"""
+        self.time += dt
+        self.frame_sounds.clear()
+    
+    def play_sound(self, name, x=None):
+        """Play a sound effect by name, panned by the x position of its source if given"""
+        if name not in SOUND_FILES:
+            return
+        category, priority, cooldown = SOUND_SETTINGS[name]
         
-        # Create a simple sine wave
-        buffer = bytearray(buffer_size)
-        for i in range(buffer_size):
-            # Simple fade out
-            amplitude = 127 * (1 - i / buffer_size)
-            buffer[i] = 128 + int(amplitude * math.sin(2 * 3.14159 * frequency * i / sample_rate))
+        # Drop duplicates within a step and repeats inside the sound's cooldown.
+        # Cooldowns run on game time, so they don't depend on the frame rate.
+        now = self.time
+        if name in self.frame_sounds or now - self.last_played.get(name, -cooldown) < cooldown - COOLDOWN_EPSILON:
+            return
         
-        # Create a sound object from the buffer
-        sound = pygame.mixer.Sound(buffer=buffer)
+        sound = self.get_sound(name)
+        if self.channels is None:
+            self.channels = ChannelManager()
         
-        return sound
-    
-    def play_sound(self, name):
-        """Play a sound effect by name"""
-        if name in self.sounds:
-            self.sounds[name].play()
+        pan = x / self.width if x is not None and self.width else None
+        if self.channels.play(sound, category, priority, pan):
+            self.frame_sounds.add(name)
+            self.last_played[name] = now
     
     def set_volume(self, volume):
         """Set the volume for all sounds (0.0 to 1.0)"""
@@ -86,6 +182,25 @@ class SoundManager:
         self.update_volume()
     
     def update_volume(self):
-        """Update the volume of all sounds"""
+        """Update the volume of all loaded sounds"""
         for sound in self.sounds.values():
             sound.set_volume(self.volume)
+
+
+class NullSoundManager:
+    """Silent stand-in for SoundManager used by headless simulations"""
+    def __init__(self):
+        self.sounds = {}
+        self.volume = 0.0
+    
+    def begin_frame(self, dt):
+        pass
+    
+    def play_sound(self, name, x=None):
+        pass
+    
+    def set_volume(self, volume):
+        pass
+    
+    def update_volume(self):
+        pass
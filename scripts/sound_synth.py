@@ -0,0 +1,148 @@
+import hashlib
+import json
+import math
+import os
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, the simple per-sample tone is used without it
+    np = None
+
+# Bump when the synthesis changes, so cached PCM is rebuilt
+SYNTH_VERSION = 1
+
+# Directory holding synthesised PCM, keyed by the sound parameters
+SOUND_CACHE_DIR = "sound_cache"
+
+# Placeholder sounds used when no sound file exists.
+# wave: sine, square, saw or noise; frequency sweeps linearly to end_frequency;
+# noise mixes in a low-passed noise burst (0-1); attack and decay shape the
+# envelope (linear attack, exponential decay with the given time constant).
+SOUND_SPECS = {
+    "laser": {"wave": "square", "frequency": 1400, "end_frequency": 300, "duration": 0.15,
+              "attack": 0.002, "decay": 0.06, "noise": 0.0, "volume": 0.35},
+    "explosion": {"wave": "sine", "frequency": 90, "end_frequency": 30, "duration": 0.7,
+                  "attack": 0.003, "decay": 0.18, "noise": 0.8, "noise_smoothing": 12, "volume": 0.8},
+    "player_hit": {"wave": "saw", "frequency": 240, "end_frequency": 90, "duration": 0.3,
+                   "attack": 0.002, "decay": 0.1, "noise": 0.3, "noise_smoothing": 4, "volume": 0.6},
+    "powerup": {"wave": "sine", "frequency": 440, "end_frequency": 1320, "duration": 0.3,
+                "attack": 0.01, "decay": 0.25, "noise": 0.0, "volume": 0.5},
+    "wave": {"wave": "square", "frequency": 520, "end_frequency": 880, "duration": 0.5,
+             "attack": 0.02, "decay": 0.3, "noise": 0.0, "volume": 0.3},
+    "game_over": {"wave": "saw", "frequency": 330, "end_frequency": 80, "duration": 1.2,
+                  "attack": 0.01, "decay": 0.6, "noise": 0.1, "noise_smoothing": 8, "volume": 0.5},
+    "menu_select": {"wave": "sine", "frequency": 660, "end_frequency": 660, "duration": 0.06,
+                    "attack": 0.002, "decay": 0.03, "noise": 0.0, "volume": 0.4}
+}
+
+# Fade-out at the end of every sound to avoid a click
+RELEASE_TIME = 0.01
+
+
+def synthesize(spec, sample_rate, seed=0):
+    """Return a mono float32 waveform in [-1, 1] for a sound spec"""
+    count = max(1, int(spec["duration"] * sample_rate))
+    t = np.arange(count) / sample_rate
+
+    # Integrate the (linearly sweeping) frequency to get the phase
+    frequency = np.linspace(spec["frequency"], spec.get("end_frequency", spec["frequency"]), count)
+    phase = np.cumsum(frequency) / sample_rate
+    cycle = phase % 1.0
+
+    wave = spec["wave"]
+    if wave == "square":
+        samples = np.where(cycle < 0.5, 1.0, -1.0)
+    elif wave == "saw":
+        samples = 2.0 * cycle - 1.0
+    elif wave == "noise":
+        samples = np.zeros(count)
+    else:
+        samples = np.sin(2 * np.pi * phase)
+
+    # Mix in a noise burst, smoothed with a moving average for a low rumble
+    noise_level = 1.0 if wave == "noise" else spec.get("noise", 0.0)
+    if noise_level > 0:
+        noise = np.random.default_rng(seed).uniform(-1.0, 1.0, count)
+        smoothing = spec.get("noise_smoothing", 1)
+        if smoothing > 1:
+            noise = np.convolve(noise, np.ones(smoothing) / smoothing, mode="same")
+            noise /= max(1e-6, np.abs(noise).max())
+        samples = samples * (1 - noise_level) + noise * noise_level
+
+    # Attack, exponential decay and a short release
+    envelope = np.minimum(1.0, t / max(spec["attack"], 1e-6)) * np.exp(-t / spec["decay"])
+    envelope *= np.clip((spec["duration"] - t) / RELEASE_TIME, 0.0, 1.0)
+
+    return (samples * envelope * spec.get("volume", 1.0)).astype(np.float32)
+
+
+def to_pcm(samples, audio_format, channels):
+    """Convert a float waveform to raw PCM bytes in the mixer's format"""
+    bits = abs(audio_format) & 0xFF
+    signed = audio_format < 0
+
+    if bits == 8:
+        if signed:
+            data = (samples * 127).astype(np.int8)
+        else:
+            data = (samples * 127 + 128).astype(np.uint8)
+    elif bits == 32:
+        data = samples.astype(np.float32)
+    else:
+        if signed:
+            data = (samples * 32767).astype(np.int16)
+        else:
+            data = (samples * 32767 + 32768).astype(np.uint16)
+
+    # Interleave identical channels
+    if channels > 1:
+        data = np.repeat(data, channels)
+    return data.tobytes()
+
+
+def create_tone_pcm(frequency, sample_rate, audio_format, channels, duration=0.2):
+    """Fallback without NumPy: a fading sine tone built sample by sample"""
+    count = int(duration * sample_rate)
+    bits = abs(audio_format) & 0xFF
+    signed = audio_format < 0
+    buffer = bytearray()
+    for i in range(count):
+        value = (1 - i / count) * math.sin(2 * math.pi * frequency * i / sample_rate)
+        if bits == 8:
+            sample = (int(value * 127) & 0xFF) if signed else 128 + int(value * 127)
+            frame = bytes([sample])
+        else:
+            sample = int(value * 32767) if signed else 32768 + int(value * 32767)
+            frame = sample.to_bytes(2, "little", signed=signed)
+        buffer += frame * channels
+    return bytes(buffer)
+
+
+def get_cache_path(name, spec, sample_rate, audio_format, channels, cache_dir=SOUND_CACHE_DIR):
+    """Return the cache file for a sound; the file name is keyed by every synthesis parameter"""
+    key = json.dumps([SYNTH_VERSION, spec, sample_rate, audio_format, channels], sort_keys=True)
+    digest = hashlib.sha1(key.encode()).hexdigest()[:16]
+    return os.path.join(cache_dir, f"{name}-{digest}.pcm")
+
+
+def get_sound_pcm(name, sample_rate, audio_format, channels, cache_dir=SOUND_CACHE_DIR):
+    """Return the PCM bytes for a placeholder sound, from the cache or freshly synthesised"""
+    spec = SOUND_SPECS.get(name, SOUND_SPECS["menu_select"])
+    if np is None:
+        return create_tone_pcm(spec["frequency"], sample_rate, audio_format, channels)
+
+    path = get_cache_path(name, spec, sample_rate, audio_format, channels, cache_dir)
+    try:
+        with open(path, "rb") as f:
+            return f.read()
+    except OSError:
+        pass
+
+    pcm = to_pcm(synthesize(spec, sample_rate), audio_format, channels)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(pcm)
+    except OSError:
+        pass  # The cache is only an optimisation
+    return pcm
@@ -0,0 +1,98 @@
+import math
+
+class SpatialHash:
+    """Uniform grid used as a collision broad phase.
+
+    Objects are stored in named layers ("asteroids", "projectiles", ...) so a
+    query only returns candidates of the kind the caller is interested in.
+    Every object is inserted into all cells its bounding box overlaps.
+    """
+    def __init__(self, cell_size=64):
+        self.cell_size = cell_size
+        self.cells = {}
+        self.object_cells = {}  # id(obj) -> list of cell keys the object occupies
+        self.radii = {}  # id(obj) -> radius the object was inserted with
+
+    def clear(self):
+        """Remove every object from the grid"""
+        self.cells.clear()
+        self.object_cells.clear()
+        self.radii.clear()
+
+    def cell_range(self, x, y, radius):
+        """Return the inclusive cell index range covered by a circle"""
+        size = self.cell_size
+        return (int(math.floor((x - radius) / size)), int(math.floor((x + radius) / size)),
+                int(math.floor((y - radius) / size)), int(math.floor((y + radius) / size)))
+
+    def insert(self, obj, layer, radius=None):
+        """Insert an object with x, y and radius attributes into a layer"""
+        if radius is None:
+            radius = obj.radius
+        self.insert_at(obj, layer, obj.x, obj.y, radius)
+
+    def insert_at(self, obj, layer, x, y, radius):
+        """Insert an object at a position the caller already has (e.g. from an EntityStore's columns)"""
+        min_cx, max_cx, min_cy, max_cy = self.cell_range(x, y, radius)
+        keys = []
+        for cx in range(min_cx, max_cx + 1):
+            for cy in range(min_cy, max_cy + 1):
+                key = (layer, cx, cy)
+                bucket = self.cells.get(key)
+                if bucket is None:
+                    bucket = self.cells[key] = []
+                bucket.append(obj)
+                keys.append(key)
+
+        self.object_cells[id(obj)] = keys
+        self.radii[id(obj)] = radius
+
+    def remove(self, obj):
+        """Remove an object from the grid (no-op if it isn't there)"""
+        keys = self.object_cells.pop(id(obj), None)
+        self.radii.pop(id(obj), None)
+        if not keys:
+            return
+
+        for key in keys:
+            bucket = self.cells[key]
+            bucket.remove(obj)
+            if not bucket:
+                del self.cells[key]
+
+    def update(self, obj, radius=None):
+        """Re-insert an object after it has moved (with the radius it was inserted with unless given)"""
+        keys = self.object_cells.get(id(obj))
+        if not keys:
+            return
+
+        layer = keys[0][0]
+        if radius is None:
+            radius = self.radii[id(obj)]
+        self.remove(obj)
+        self.insert(obj, layer, radius)
+
+    def contains(self, obj):
+        return id(obj) in self.object_cells
+
+    def query(self, x, y, radius, layer):
+        """Return the objects in a layer whose cells overlap the given circle"""
+        min_cx, max_cx, min_cy, max_cy = self.cell_range(x, y, radius)
+
+        # Small queries hit a single cell, so skip the de-duplication
+        if min_cx == max_cx and min_cy == max_cy:
+            return list(self.cells.get((layer, min_cx, min_cy), ()))
+
+        found = []
+        seen = set()
+        for cx in range(min_cx, max_cx + 1):
+            for cy in range(min_cy, max_cy + 1):
+                bucket = self.cells.get((layer, cx, cy))
+                if not bucket:
+                    continue
+                for obj in bucket:
+                    if id(obj) not in seen:
+                        seen.add(id(obj))
+                        found.append(obj)
+
+        return found
@@ -0,0 +1,75 @@
+import pygame
+import math
+from collections import OrderedDict
+
+# Transparent background color for baked sprites (never used by game shapes)
+COLORKEY = (255, 0, 255)
+
+class SpriteCache:
+    """Pre-rendered rotation frames for outlined polygon shapes.
+
+    Each (shape, color, outline) combination is rasterised once per rotation
+    frame onto a colorkeyed surface, so drawing a rotated shape becomes a
+    single blit. Shapes are identified by a small hashable key that the
+    entity works out once when it gets its shape (e.g. the shape library's
+    type and variant), so a lookup never hashes the vertices themselves.
+    Frames are baked lazily the first time they are needed and the least
+    recently used ones are evicted once max_frames is exceeded.
+    """
+    def __init__(self, rotation_frames=64, max_frames=4096):
+        self.rotation_frames = rotation_frames
+        self.max_frames = max_frames
+        self.frames = OrderedDict()
+
+    def get_frame_index(self, rotation):
+        return int(round(rotation / (2 * math.pi) * self.rotation_frames)) % self.rotation_frames
+
+    def bake(self, points, color, outline_color, outline_width, frame_index):
+        """Rasterise one rotation frame; returns (surface, half_size)"""
+        angle = frame_index * 2 * math.pi / self.rotation_frames
+        cos_a = math.cos(angle)
+        sin_a = math.sin(angle)
+
+        extent = max(math.hypot(x, y) for x, y in points)
+        half = int(math.ceil(extent)) + outline_width + 1
+
+        rotated = [(x * cos_a - y * sin_a + half, x * sin_a + y * cos_a + half) for x, y in points]
+
+        # Shapes are opaque, so a colorkeyed RLE surface blits much faster than per-pixel alpha
+        surface = pygame.Surface((half * 2, half * 2))
+        surface.fill(COLORKEY)
+        pygame.draw.polygon(surface, color, rotated)
+        if outline_width:
+            pygame.draw.polygon(surface, outline_color, rotated, outline_width)
+        surface.set_colorkey(COLORKEY, pygame.RLEACCEL)
+
+        return surface, half
+
+    def get_frame(self, shape_key, points, color, rotation, outline_color=(255, 255, 255), outline_width=1):
+        """Return (surface, half_size) for a shape; shape_key must identify points"""
+        frame_index = self.get_frame_index(rotation)
+        key = (shape_key, color, outline_color, outline_width, frame_index)
+
+        frame = self.frames.get(key)
+        if frame is not None:
+            self.frames.move_to_end(key)
+            return frame
+
+        frame = self.bake(points, color, outline_color, outline_width, frame_index)
+        self.frames[key] = frame
+        if len(self.frames) > self.max_frames:
+            self.frames.popitem(last=False)
+        return frame
+
+    def draw(self, screen, shape_key, points, color, x, y, rotation, outline_color=(255, 255, 255),
+             outline_width=1):
+        """Blit a rotated polygon centred on (x, y); returns the blitted rect"""
+        surface, half = self.get_frame(shape_key, points, color, rotation, outline_color, outline_width)
+        return screen.blit(surface, (int(round(x)) - half, int(round(y)) - half))
+
+    def clear(self):
+        self.frames.clear()
+
+
+# Shared instance used by all polygon entities
+sprite_cache = SpriteCache()
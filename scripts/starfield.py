@@ -1,109 +1,201 @@
 import pygame
 import random
+from .surface_cache import surface_cache
+
+# Transparent background color for star layers
+COLORKEY = (255, 0, 255)
+
 
 class Star:
-    def __init__(self, x, y, size, speed, color=(255, 255, 255)):
+    def __init__(self, x, y, size, speed, color=(255, 255, 255), rng=None):
+        rng = rng if rng is not None else random
         self.x = x
         self.y = y
         self.size = size
         self.speed = speed
         self.color = color
-        self.brightness = random.randint(100, 255)
-        self.twinkle_direction = random.choice([-1, 1])
-        self.twinkle_speed = random.uniform(0.5, 2.0)
-    
-    def update(self, dt):
-        # Move the star downward (simulating ship movement)
-        self.y += self.speed * dt * 60
-        
-        # Twinkle effect
-        self.brightness += self.twinkle_direction * self.twinkle_speed
-        if self.brightness >= 255:
-            self.brightness = 255
-            self.twinkle_direction = -1
-        elif self.brightness <= 100:
-            self.brightness = 100
-            self.twinkle_direction = 1
-    
-    def draw(self, screen):
-        # Calculate color with brightness
-        r = min(255, int(self.color[0] * self.brightness / 255))
-        g = min(255, int(self.color[1] * self.brightness / 255))
-        b = min(255, int(self.color[2] * self.brightness / 255))
-        
-        # Draw the star as a small circle
-        pygame.draw.circle(screen, (r, g, b), (int(self.x), int(self.y)), self.size)
+
+        # Twinkle phase (0-1 along the brightness cycle) and cycles per twinkle loop
+        self.twinkle_phase = rng.random()
+        self.twinkle_cycles = rng.choice([1, 2])
+
+    def get_brightness(self, loop_position):
+        """Return the 100-255 brightness at a position (0-1) in the twinkle loop"""
+        cycle = (self.twinkle_phase + loop_position * self.twinkle_cycles) % 1.0
+        return 100 + 155 * (1 - abs(2 * cycle - 1))
+
+    def get_color(self, loop_position):
+        brightness = self.get_brightness(loop_position)
+        return (min(255, int(self.color[0] * brightness / 255)),
+                min(255, int(self.color[1] * brightness / 255)),
+                min(255, int(self.color[2] * brightness / 255)))
+
+
+class StarLayer:
+    """Stars of one size that scroll together, pre-rendered at each twinkle frame.
+
+    Each twinkle frame is a full-screen colorkeyed RLE surface, so drawing the
+    layer is two blits (the wrapped scroll position) whichever frame is shown.
+    Frames are baked the first time they are needed.
+    """
+    def __init__(self, width, height, speed, stars, twinkle_frames):
+        self.width = width
+        self.height = height
+        self.speed = speed
+        self.stars = stars
+        self.twinkle_frames = twinkle_frames
+        self.offset = 0.0
+        self.frames = {}
+
+    def clear(self):
+        self.frames.clear()
+
+    def get_frame(self, frame_index):
+        frame = self.frames.get(frame_index)
+        if frame is None:
+            frame = self.bake(frame_index)
+            self.frames[frame_index] = frame
+        return frame
+
+    def bake(self, frame_index):
+        loop_position = frame_index / self.twinkle_frames
+        surface = pygame.Surface((self.width, self.height))
+        surface.fill(COLORKEY)
+        for star in self.stars:
+            color = star.get_color(loop_position)
+            # Draw stars near the edges twice so the layer tiles seamlessly while scrolling
+            for y in (star.y - self.height, star.y, star.y + self.height):
+                if -star.size <= y <= self.height + star.size:
+                    pygame.draw.circle(surface, color, (star.x, y), star.size)
+        surface.set_colorkey(COLORKEY, pygame.RLEACCEL)
+        return surface
+
+    def get_star_positions(self):
+        offset = int(self.offset)
+        return [(star, star.x, (star.y + offset) % self.height) for star in self.stars]
+
+    def draw(self, screen, frame_index):
+        surface = self.get_frame(frame_index)
+        offset = int(self.offset)
+        screen.blit(surface, (0, offset))
+        screen.blit(surface, (0, offset - self.height))
 
 
 class Starfield:
-    def __init__(self, width, height, num_stars):
+    """Scrolling parallax background built from pre-rendered layers.
+
+    Stars are grouped into one layer per size (larger stars scroll faster) and
+    the dust clouds are baked, together with the black background, into an
+    opaque layer. Twinkling cycles through baked frames of each star layer, so
+    drawing the background is a handful of blits per frame.
+    """
+    def __init__(self, width, height, num_stars, rng=None, twinkle_frames=32, twinkle_loop=6.0):
+        self.rng = rng if rng is not None else random
         self.width = width
         self.height = height
         self.stars = []
         self.dust_clouds = []
         self.star_color = (255, 255, 255)
         self.dust_color = (50, 50, 100, 30)
-        
+
+        # Twinkle animation: twinkle_frames baked frames per twinkle_loop seconds
+        self.twinkle_frames = twinkle_frames
+        self.twinkle_loop = twinkle_loop
+        self.twinkle_time = 0.0
+
         # Create initial stars
         for _ in range(num_stars):
-            x = random.randint(0, width)
-            y = random.randint(0, height)
-            size = random.randint(1, 3)
+            x = self.rng.randint(0, width)
+            y = self.rng.randint(0, height)
+            size = self.rng.randint(1, 3)
             speed = 0.2 + (size * 0.1)  # Larger stars move faster (parallax effect)
-            self.stars.append(Star(x, y, size, speed, self.star_color))
-        
+            self.stars.append(Star(x, y, size, speed, self.star_color, self.rng))
+
+        # Group stars into one layer per size
+        self.layers = []
+        for size in sorted(set(star.size for star in self.stars)):
+            stars = [star for star in self.stars if star.size == size]
+            self.layers.append(StarLayer(width, height, stars[0].speed, stars, twinkle_frames))
+
         # Create dust clouds
         for _ in range(10):
             self.dust_clouds.append({
-                'x': random.randint(0, width),
-                'y': random.randint(0, height),
-                'size': random.randint(50, 150),
-                'speed': random.uniform(0.05, 0.15),
-                'alpha': random.randint(20, 50)
+                'x': self.rng.randint(0, width),
+                'y': self.rng.randint(0, height),
+                'size': self.rng.randint(50, 150)
             })
-    
+
+        # The dust layer scrolls slower than every star layer
+        self.dust_speed = 0.1
+        self.dust_offset = 0.0
+        self.dust_layer = None
+
     def set_colors(self, star_color, dust_color):
         """Set colors for the starfield"""
         self.star_color = star_color
         self.dust_color = dust_color
-        
+
         # Update existing stars
         for star in self.stars:
             star.color = star_color
-    
+
+        # Re-bake the layers with the new colors
+        for layer in self.layers:
+            layer.clear()
+        self.dust_layer = None
+
     def update(self, dt):
-        # Update all stars
-        for star in self.stars:
-            star.update(dt)
-            
-            # If star goes off screen, reset it at the top
-            if star.y > self.height:
-                star.y = 0
-                star.x = random.randint(0, self.width)
-                star.color = self.star_color
-        
-        # Update dust clouds
+        # Scroll the layers downward (simulating ship movement)
+        for layer in self.layers:
+            layer.offset = (layer.offset + layer.speed * dt * 60) % self.height
+        self.dust_offset = (self.dust_offset + self.dust_speed * dt * 60) % self.height
+
+        # Advance the twinkle animation
+        self.twinkle_time = (self.twinkle_time + dt) % self.twinkle_loop
+
+    def get_twinkle_frame(self):
+        return int(self.twinkle_time / self.twinkle_loop * self.twinkle_frames) % self.twinkle_frames
+
+    def bake_dust_layer(self):
+        surface = pygame.Surface((self.width, self.height))
+        surface.fill((0, 0, 0))
         for cloud in self.dust_clouds:
-            cloud['y'] += cloud['speed'] * dt * 60
-            
-            # If cloud goes off screen, reset it at the top
-            if cloud['y'] - cloud['size'] > self.height:
-                cloud['y'] = -cloud['size']
-                cloud['x'] = random.randint(0, self.width)
-    
+            sprite = surface_cache.get_circle(cloud['size'], self.dust_color)
+            # Draw clouds crossing the edges twice so the layer tiles seamlessly
+            for y in (cloud['y'] - self.height, cloud['y'], cloud['y'] + self.height):
+                surface.blit(sprite, (cloud['x'] - cloud['size'], y - cloud['size']))
+        return surface
+
     def draw(self, screen):
-        # Draw dust clouds
-        for cloud in self.dust_clouds:
-            # Create a surface with per-pixel alpha
-            cloud_surface = pygame.Surface((cloud['size'] * 2, cloud['size'] * 2), pygame.SRCALPHA)
-            
-            # Draw the cloud with alpha
-            pygame.draw.circle(cloud_surface, self.dust_color, 
-                              (cloud['size'], cloud['size']), cloud['size'])
-            
-            # Blit the cloud surface onto the screen
-            screen.blit(cloud_surface, (int(cloud['x'] - cloud['size']), int(cloud['y'] - cloud['size'])))
-        
-        # Draw all stars
-        for star in self.stars:
-            star.draw(screen)
+        self.draw_dust(screen)
+        self.draw_stars(screen)
+
+    def draw_dust(self, screen):
+        """Draw the opaque background: black with the dust clouds"""
+        if self.dust_layer is None:
+            self.dust_layer = self.bake_dust_layer()
+
+        offset = int(self.dust_offset)
+        screen.blit(self.dust_layer, (0, offset))
+        screen.blit(self.dust_layer, (0, offset - self.height))
+
+    def draw_stars(self, screen):
+        frame_index = self.get_twinkle_frame()
+        for layer in self.layers:
+            layer.draw(screen, frame_index)
+
+    def draw_star_points(self, screen):
+        """Draw each star individually (used when only changed regions are redrawn)"""
+        loop_position = self.get_twinkle_frame() / self.twinkle_frames
+        for layer in self.layers:
+            for star, x, y in layer.get_star_positions():
+                pygame.draw.circle(screen, star.get_color(loop_position), (x, y), star.size)
+
+    def get_star_rects(self):
+        """Return the screen area covered by each star, for dirty-rect rendering"""
+        rects = []
+        for layer in self.layers:
+            for star, x, y in layer.get_star_positions():
+                rects.append(pygame.Rect(x - star.size - 1, y - star.size - 1,
+                                         star.size * 2 + 3, star.size * 2 + 3))
+        return rects
@@ -0,0 +1,55 @@
+import time
+from contextlib import contextmanager
+
+
+class StartupProfiler:
+    """Times the steps between program start and the first menu frame.
+
+    main.py wraps its imports and the construction of the game and menu in
+    section() blocks. Recording stops at finish(), so sections entered
+    later (or in processes that never show a menu) cost nothing.
+    """
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.sections = []  # (kind, name, seconds)
+        self.total = None
+        self.active = True
+
+    @contextmanager
+    def section(self, kind, name):
+        if not self.active:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.sections.append((kind, name, time.perf_counter() - start))
+
+    def finish(self):
+        """Stop recording; the elapsed time is the time to the first menu frame"""
+        if self.active:
+            self.total = time.perf_counter() - self.start
+            self.active = False
+
+    def get_report(self):
+        total = self.total if self.total is not None else time.perf_counter() - self.start
+        lines = [f"Time to first menu frame: {total * 1000:.1f} ms", ""]
+        lines.append(f"{'kind':<12}  {'step':<28}  {'ms':>8}  {'share':>6}")
+        for kind, name, seconds in self.sections:
+            lines.append(f"{kind:<12}  {name:<28}  {seconds * 1000:>8.1f}  {seconds / total:>6.1%}")
+
+        # Totals per kind, plus whatever no section covered
+        lines.append("")
+        kinds = {}
+        for kind, _, seconds in self.sections:
+            kinds[kind] = kinds.get(kind, 0.0) + seconds
+        for kind, seconds in kinds.items():
+            lines.append(f"{kind:<12}  {'(total)':<28}  {seconds * 1000:>8.1f}  {seconds / total:>6.1%}")
+        other = total - sum(kinds.values())
+        lines.append(f"{'other':<12}  {'(untimed)':<28}  {other * 1000:>8.1f}  {other / total:>6.1%}")
+        return "\n".join(lines)
+
+
+# Shared instance, created when main.py first imports this module
+startup_profiler = StartupProfiler()
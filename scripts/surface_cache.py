@@ -0,0 +1,78 @@
+import pygame
+from collections import OrderedDict
+
+class SurfaceCache:
+    """Shared pool of pre-filled alpha surfaces for overlays, glows and shields.
+
+    Surfaces are keyed by their size, flags and fill parameters and built only
+    on a cache miss, so draw code no longer allocates a new SRCALPHA surface
+    every frame. Returned surfaces are shared: callers blit them but must
+    never draw into them. The least recently used surfaces are evicted once
+    max_surfaces is exceeded.
+    """
+    def __init__(self, max_surfaces=256):
+        self.surfaces = OrderedDict()
+        self.max_surfaces = max_surfaces
+
+    def get(self, key, build):
+        """Return the surface cached under key, calling build() to create it on a miss"""
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.surfaces.move_to_end(key)
+            return surface
+
+        surface = build()
+
+        # Match the display's pixel format for faster blits once a window exists
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha()
+
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.max_surfaces:
+            self.surfaces.popitem(last=False)
+        return surface
+
+    def get_filled(self, size, color, flags=pygame.SRCALPHA):
+        """Return a surface of the given size filled with an RGBA color"""
+        size = (int(size[0]), int(size[1]))
+        color = tuple(color)
+
+        def build():
+            surface = pygame.Surface(size, flags)
+            surface.fill(color)
+            return surface
+
+        return self.get(("filled", size, flags, color), build)
+
+    def get_circle(self, radius, color, flags=pygame.SRCALPHA):
+        """Return a (2r x 2r) surface holding a filled RGBA circle of radius r"""
+        radius = int(radius)
+        color = tuple(color)
+
+        def build():
+            surface = pygame.Surface((radius * 2, radius * 2), flags)
+            pygame.draw.circle(surface, color, (radius, radius), radius)
+            return surface
+
+        return self.get(("circle", radius, flags, color), build)
+
+    def get_glow(self, radius, color, rings=3, alpha=100, alpha_step=30, ring_step=2):
+        """Return a glow of concentric translucent circles fading inwards from radius"""
+        radius = int(radius)
+        color = tuple(color[:3])
+
+        def build():
+            surface = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+            for i in range(rings):
+                pygame.draw.circle(surface, (*color, alpha - i * alpha_step),
+                                   (radius, radius), radius - i * ring_step)
+            return surface
+
+        return self.get(("glow", radius, color, rings, alpha, alpha_step, ring_step), build)
+
+    def clear(self):
+        self.surfaces.clear()
+
+
+# Shared instance used by all draw code
+surface_cache = SurfaceCache()
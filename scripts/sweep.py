@@ -0,0 +1,262 @@
+import argparse
+import csv
+import itertools
+import json
+import multiprocessing
+import time
+import pygame
+from .campaign import Campaign
+from .headless import PILOTS, create_headless_game, create_pilot
+from .profiler import FrameProfiler
+from .shop import Shop
+
+# Game time runs at 60 ticks per second
+TICKS_PER_SECOND = 60
+
+# A wave lasts at most 60 seconds plus the 3 second transition
+TICKS_PER_WAVE = 63 * TICKS_PER_SECOND + 60
+
+# Columns of the results table
+TABLE_COLUMNS = ["runs", "survived", "survival_s", "score", "waves", "update_ms", "update_p95_ms", "update_max_ms"]
+
+# Game reused by every job a worker process runs
+worker_game = None
+
+
+def get_shop_items():
+    # The shop creates its fonts up front, which needs only the font module
+    pygame.font.init()
+    return Shop(0, 0).items
+
+
+def get_upgrade_names():
+    return [item.name for item in get_shop_items()]
+
+
+def get_loadouts(names, levels="ends"):
+    """Return every combination of levels for the named upgrades.
+
+    levels="ends" tries each upgrade at level 0 and its maximum level,
+    levels="all" tries every level in between as well.
+    """
+    max_levels = {item.name: item.max_level for item in get_shop_items()}
+    choices = []
+    for name in names:
+        if levels == "all":
+            choices.append(range(max_levels[name] + 1))
+        else:
+            choices.append((0, max_levels[name]))
+    return [dict(zip(names, combination)) for combination in itertools.product(*choices)]
+
+
+def get_loadout_label(loadout):
+    """Short label for a loadout, e.g. "SS5 RF0" for Ship Speed 5 and Rapid Fire 0"""
+    if not loadout:
+        return "none"
+    return " ".join("".join(word[0] for word in name.split()) + str(level) for name, level in loadout.items())
+
+
+def advance_to_wave(game, wave):
+    """Apply the wave scaling of start_next_wave until the game is at the given wave"""
+    while game.wave < wave:
+        # Start every wave from an empty field, as after a completed wave
+        game.clear_asteroids()
+        game.boss = None
+        game.start_next_wave()
+
+
+def run_job(job):
+    """Play one game with a fixed loadout until it ends or the wave budget is used up"""
+    global worker_game
+    if worker_game is None:
+        worker_game = create_headless_game()
+    game = worker_game
+    pilot = create_pilot(job["pilot"])
+
+    # Set up the sector, starting wave and upgrades
+    game.reset(job["seed"])
+    game.set_campaign_mission(Campaign.create_sectors()[job["sector"]])
+    for item in game.shop.items:
+        item.current_level = job["loadout"].get(item.name, 0)
+    game.upgrades.update(game.shop.get_upgrades())
+    game.apply_upgrades()
+    advance_to_wave(game, job["wave"])
+
+    update_ms = []
+    waves_completed = 0
+    status = None
+    while len(update_ms) < job["max_ticks"]:
+        if game.shop_active:
+            # The loadout is fixed, so the shop is skipped without buying anything
+            waves_completed += 1
+            if waves_completed >= job["waves"]:
+                break
+            game.close_shop()
+
+        game.apply_input(pilot.get_input(game))
+        start = time.perf_counter()
+        status = game.update()
+        update_ms.append((time.perf_counter() - start) * 1000)
+        game.end_frame()
+
+        if status == "game_over":
+            break
+
+    update_ms.sort()
+    return {
+        "sector": job["sector"],
+        "sector_name": job["sector_name"],
+        "wave": job["wave"],
+        "upgrades": get_loadout_label(job["loadout"]),
+        "seed": job["seed"],
+        "survived": status != "game_over",
+        "survival_s": len(update_ms) / TICKS_PER_SECOND,
+        "score": game.score,
+        "waves": waves_completed,
+        "ticks": len(update_ms),
+        "update_ms": sum(update_ms) / len(update_ms) if update_ms else 0.0,
+        "update_p95_ms": FrameProfiler.percentile(update_ms, 0.95),
+        "update_max_ms": update_ms[-1] if update_ms else 0.0
+    }
+
+
+def create_jobs(sectors, waves, loadouts, seeds, waves_per_run=1, pilot="auto", base_seed=0):
+    """Return one job per sector, starting wave, loadout and seed"""
+    names = [sector.name for sector in Campaign.create_sectors()]
+    jobs = []
+    for sector, wave, loadout, seed in itertools.product(sectors, waves, loadouts, range(seeds)):
+        jobs.append({
+            "sector": sector,
+            "sector_name": names[sector],
+            "wave": wave,
+            "loadout": loadout,
+            "seed": base_seed + seed,
+            "waves": waves_per_run,
+            "max_ticks": waves_per_run * TICKS_PER_WAVE,
+            "pilot": pilot
+        })
+    return jobs
+
+
+def run_sweep(jobs, workers=None, progress=None):
+    """Run the jobs on a process pool; returns the per-game results in job order"""
+    results = [None] * len(jobs)
+    with multiprocessing.Pool(workers) as pool:
+        for done, (index, result) in enumerate(pool.imap_unordered(run_indexed_job, enumerate(jobs)), 1):
+            results[index] = result
+            if progress:
+                progress(done, len(jobs))
+    return results
+
+
+def run_indexed_job(indexed_job):
+    index, job = indexed_job
+    return index, run_job(job)
+
+
+def aggregate(results, group_by=("sector", "wave")):
+    """Average the per-game results over every group of equal group_by values"""
+    groups = {}
+    for result in results:
+        key = tuple(result[name] for name in group_by)
+        groups.setdefault(key, []).append(result)
+
+    rows = []
+    for key, group in sorted(groups.items()):
+        runs = len(group)
+        row = dict(zip(group_by, key))
+        if "sector" in row:
+            row["sector"] = f"{row['sector']} {group[0]['sector_name']}"
+        row["runs"] = runs
+        row["survived"] = sum(result["survived"] for result in group) / runs
+        for name in ("survival_s", "score", "waves", "update_ms", "update_p95_ms"):
+            row[name] = sum(result[name] for result in group) / runs
+        row["update_max_ms"] = max(result["update_max_ms"] for result in group)
+        rows.append(row)
+    return rows
+
+
+def format_table(rows, group_by):
+    columns = list(group_by) + TABLE_COLUMNS
+    cells = [[format_cell(name, row[name]) for name in columns] for row in rows]
+    widths = [max([len(name)] + [len(line[i]) for line in cells]) for i, name in enumerate(columns)]
+
+    lines = ["  ".join(name.ljust(width) for name, width in zip(columns, widths))]
+    lines.append("  ".join("-" * width for width in widths))
+    for line in cells:
+        lines.append("  ".join(cell.ljust(width) for cell, width in zip(line, widths)))
+    return "\n".join(lines)
+
+
+def format_cell(name, value):
+    if name == "survived":
+        return f"{value:.0%}"
+    if isinstance(value, float):
+        return f"{value:.3f}" if name.endswith("_ms") else f"{value:.1f}"
+    return str(value)
+
+
+def write_results(results, path):
+    """Write the per-game results as CSV if path ends in .csv, otherwise as JSON"""
+    if path.lower().endswith(".csv"):
+        with open(path, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=list(results[0].keys()))
+            writer.writeheader()
+            writer.writerows(results)
+    else:
+        with open(path, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+def parse_list(text, convert=str):
+    return [convert(value.strip()) for value in text.split(",") if value.strip()]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sweep headless games over sectors, waves and shop upgrades")
+    parser.add_argument("--sectors", default=None, help="comma-separated sector indices (default: all)")
+    parser.add_argument("--waves", default="1,3,5", help="comma-separated starting waves")
+    parser.add_argument("--waves-per-run", type=int, default=1, help="waves to play in each game")
+    parser.add_argument("--upgrades", default="Ship Speed,Rapid Fire,Fuel Efficiency",
+                        help="comma-separated shop upgrades to vary ('' for none)")
+    parser.add_argument("--levels", choices=["ends", "all"], default="ends",
+                        help="try upgrades at level 0 and max only, or at every level")
+    parser.add_argument("--seeds", type=int, default=2, help="games per combination")
+    parser.add_argument("--seed", type=int, default=0, help="first seed")
+    parser.add_argument("--pilot", choices=PILOTS, default="auto")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--group-by", default="sector,wave",
+                        help="comma-separated columns to aggregate by (sector, wave, upgrades)")
+    parser.add_argument("--out", metavar="PATH", help="write per-game results to PATH (.json or .csv)")
+    args = parser.parse_args(argv)
+
+    sector_count = len(Campaign.create_sectors())
+    sectors = parse_list(args.sectors, int) if args.sectors else list(range(sector_count))
+    names = parse_list(args.upgrades)
+    unknown = set(names) - set(get_upgrade_names())
+    if unknown:
+        parser.error(f"unknown upgrades: {', '.join(sorted(unknown))}")
+
+    jobs = create_jobs(sectors, parse_list(args.waves, int), get_loadouts(names, args.levels), args.seeds,
+                       args.waves_per_run, args.pilot, args.seed)
+    print(f"Running {len(jobs)} games on {args.workers or multiprocessing.cpu_count()} workers")
+
+    def progress(done, total):
+        print(f"\r{done}/{total} games", end="", flush=True)
+
+    start = time.perf_counter()
+    results = run_sweep(jobs, args.workers, progress)
+    elapsed = time.perf_counter() - start
+    ticks = sum(result["ticks"] for result in results)
+    print(f"\nSimulated {ticks} ticks in {elapsed:.1f}s ({ticks / elapsed:.0f} ticks/sec)\n")
+
+    group_by = parse_list(args.group_by)
+    print(format_table(aggregate(results, group_by), group_by))
+
+    if args.out:
+        write_results(results, args.out)
+        print(f"\nWrote per-game results to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+import pygame
+from collections import OrderedDict
+
+class TextCache:
+    """Shared font registry and LRU cache of rendered text surfaces.
+
+    Static labels are rendered once and reused. Frequently changing values
+    (scores, timers) are drawn from cached per-character glyphs so they never
+    hit the font rasteriser after the first few frames.
+    """
+    def __init__(self, max_surfaces=512):
+        self.fonts = {}
+        self.surfaces = OrderedDict()
+        self.max_surfaces = max_surfaces
+
+    def get_font(self, size, name=None):
+        """Return a shared SysFont, creating it on first use"""
+        key = (name, size)
+        font = self.fonts.get(key)
+        if font is None:
+            font = pygame.font.SysFont(name, size)
+            self.fonts[key] = font
+        return font
+
+    def render(self, font, text, color):
+        """Return the antialiased surface for text, rendering it only on a cache miss"""
+        key = (font, text, tuple(color))
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.surfaces.move_to_end(key)
+            return surface
+
+        surface = font.render(text, True, color)
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.max_surfaces:
+            self.surfaces.popitem(last=False)
+        return surface
+
+    def get_composed_width(self, font, label, value, color):
+        width = self.render(font, label, color).get_width() if label else 0
+        for char in value:
+            width += self.render(font, char, color).get_width()
+        return width
+
+    def draw_composed(self, screen, font, label, value, color, x, y, align="left"):
+        """Draw a cached static label followed by a value built from cached glyphs.
+
+        align positions the whole string relative to x ("left", "center" or "right").
+        Returns the bounding rect of the drawn text.
+        """
+        width = self.get_composed_width(font, label, value, color)
+        if align == "center":
+            x -= width // 2
+        elif align == "right":
+            x -= width
+
+        start_x = x
+        height = 0
+        if label:
+            surface = self.render(font, label, color)
+            screen.blit(surface, (x, y))
+            x += surface.get_width()
+            height = surface.get_height()
+
+        for char in value:
+            surface = self.render(font, char, color)
+            screen.blit(surface, (x, y))
+            x += surface.get_width()
+            height = max(height, surface.get_height())
+
+        return pygame.Rect(start_x, y, width, height)
+
+    def clear(self):
+        self.surfaces.clear()
+
+
+# Shared instance used by all draw code
+text_cache = TextCache()
+
+
+class SharedFont:
+    """Class attribute resolving to a shared font, so it is only loaded on first use.
+
+    Declaring fonts as class attributes (font_small = SharedFont(24)) keeps
+    constructors from loading fonts that a screen may never draw.
+    """
+    def __init__(self, size, name=None):
+        self.size = size
+        self.name = name
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        return text_cache.get_font(self.size, self.name)
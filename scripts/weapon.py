@@ -1,10 +1,31 @@
 import pygame
 import math
+from .entity_store import Column, X, Y, PREV_X, PREV_Y, VELOCITY_1, VELOCITY_2, RADIUS, LIFETIME
 
 class Projectile:
+    __slots__ = ("_x", "_y", "_prev_x", "_prev_y", "angle", "speed", "color", "_radius",
+                 "_lifetime", "_velocity_x", "_velocity_y", "store", "store_index")
+    
+    # Kept in the game's EntityStore columns while the projectile is in flight
+    x = Column(X)
+    y = Column(Y)
+    prev_x = Column(PREV_X, optional=True)
+    prev_y = Column(PREV_Y, optional=True)
+    velocity_x = Column(VELOCITY_1)
+    velocity_y = Column(VELOCITY_2)
+    radius = Column(RADIUS)
+    lifetime = Column(LIFETIME)
+    
     def __init__(self, x, y, angle, speed=10, color=(255, 255, 0), radius=3):
+        self.store = None
+        self.reset(x, y, angle, speed, color, radius)
+    
+    def reset(self, x, y, angle, speed=10, color=(255, 255, 0), radius=3):
+        """(Re)initialise the projectile; pooled projectiles are reused through this"""
         self.x = x
         self.y = y
+        self.prev_x = None
+        self.prev_y = None
         self.angle = angle
         self.speed = speed
         self.color = color
@@ -44,8 +65,11 @@ class Projectile:
 
 
 class Weapon:
-    def __init__(self, sound_manager):
+    def __init__(self, sound_manager, projectile_pool):
         self.sound_manager = sound_manager
+        
+        # The game's pool of projectiles, released by the game when they expire or hit
+        self.projectile_pool = projectile_pool
         self.cooldown = 0
         self.cooldown_time = 0.25  # 4 shots per second
     
@@ -57,21 +81,22 @@ class Weapon:
         """Fire a single projectile"""
         if self.cooldown <= 0:
             self.cooldown = self.cooldown_time
-            self.sound_manager.play_sound("laser")
-            return [Projectile(x, y, angle)]
+            self.sound_manager.play_sound("laser", x)
+            return [self.projectile_pool.acquire(x, y, angle)]
         return []
     
     def fire_rapid(self, x, y, angle):
         """Fire multiple projectiles in a spread pattern"""
         if self.cooldown <= 0:
             self.cooldown = self.cooldown_time / 3  # Faster firing rate
-            self.sound_manager.play_sound("laser")
+            self.sound_manager.play_sound("laser", x)
             
             # Create three projectiles in a spread
             spread = 0.1  # Spread angle in radians
+            pool = self.projectile_pool
             return [
-                Projectile(x, y, angle - spread, color=(255, 200, 0)),
-                Projectile(x, y, angle, color=(255, 255, 0)),
-                Projectile(x, y, angle + spread, color=(255, 200, 0))
+                pool.acquire(x, y, angle - spread, color=(255, 200, 0)),
+                pool.acquire(x, y, angle, color=(255, 255, 0)),
+                pool.acquire(x, y, angle + spread, color=(255, 200, 0))
             ]
         return []
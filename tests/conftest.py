@@ -0,0 +1,5 @@
+import os
+
+# Games built by the tests never open a window or an audio device
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
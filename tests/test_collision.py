@@ -0,0 +1,105 @@
+import math
+import random
+
+import pytest
+
+from scripts.collision import (MIN_BATCH_SIZE, ConvexHull, convex_hull, find_sweep_hits, circle_hits_shape,
+                               path_hits_shape, polygon_hits_shape, sweep_time)
+
+SQUARE = ((-5, -5), (5, -5), (5, 5), (-5, 5))
+
+# A long thin bar along the x axis
+BAR = ((-20, -2), (20, -2), (20, 2), (-20, 2))
+
+
+class Shape:
+    def __init__(self, points, x=0.0, y=0.0, rotation=0.0):
+        self.points = points
+        self.x = x
+        self.y = y
+        self.rotation = rotation
+
+
+def test_sweep_finds_the_first_contact():
+    # Moving right from x = -10 towards a circle of radius 2 touches it at x = -2
+    assert sweep_time(-10, 0, 20, 0, 2) == pytest.approx(0.4)
+
+
+def test_sweep_misses_when_passing_beside():
+    assert sweep_time(-10, 5, 20, 0, 2) is None
+
+
+def test_sweep_parallel_motion_never_closes_in():
+    # Moving parallel to the circle's edge at a constant distance of 3
+    assert sweep_time(-10, 3, 20, 0, 2) is None
+    assert sweep_time(-10, 3, 20, 0, 3) == pytest.approx(0.5)
+
+
+def test_sweep_starting_overlapped_hits_at_zero():
+    assert sweep_time(1, 0, 20, 0, 2) == 0.0
+    assert sweep_time(1, 0, -20, 0, 2) == 0.0
+
+
+def test_sweep_without_motion_only_hits_when_overlapped():
+    assert sweep_time(5, 0, 0, 0, 2) is None
+    assert sweep_time(1, 0, 0, 0, 2) == 0.0
+
+
+def test_sweep_ignores_contact_outside_the_step():
+    # Moving away from the circle, and stopping short of it
+    assert sweep_time(5, 0, 10, 0, 2) is None
+    assert sweep_time(-10, 0, 5, 0, 2) is None
+    assert sweep_time(-10, 0, 8, 0, 2) == pytest.approx(1.0)
+
+
+def test_batched_sweep_matches_single_pairs():
+    rng = random.Random(0)
+    count = MIN_BATCH_SIZE * 2
+    pairs = [(rng.uniform(-20, 20), rng.uniform(-20, 20), rng.uniform(-30, 30), rng.uniform(-30, 30),
+              rng.uniform(1, 10)) for _ in range(count)]
+    pairs.append((5, 0, 0, 0, 2))  # not moving and not overlapped
+    pairs.append((1, 0, 0, 0, 2))  # not moving but overlapped
+
+    expected = [(t, index) for index, pair in enumerate(pairs)
+                if (t := sweep_time(*pair)) is not None]
+    hits = find_sweep_hits(*zip(*pairs))
+
+    assert [index for _, index in hits] == [index for _, index in expected]
+    assert [t for t, _ in hits] == pytest.approx([t for t, _ in expected])
+
+
+def test_convex_hull_drops_interior_points():
+    hull = convex_hull(SQUARE + ((0, 0), (1, 2)))
+    assert sorted(hull) == sorted(SQUARE)
+
+
+def test_hull_circle_test_rounds_the_corners():
+    hull = ConvexHull(SQUARE)
+    # Within the radius of both edges' lines but not of the corner itself
+    assert not hull.overlaps_circle(7, 7, 2)
+    assert hull.overlaps_circle(7, 7, 3)
+    assert hull.overlaps_circle(0, 0, 1)
+    assert hull.radius == pytest.approx(math.hypot(5, 5))
+
+
+def test_sat_finds_a_separating_axis_on_either_polygon():
+    hull = ConvexHull(SQUARE)
+    # Overlaps the square on both of its axes; only the triangle's diagonal edge separates them
+    assert not hull.overlaps_polygon([(6.5, 4.5), (9, 9), (4.5, 6.5)])
+    assert hull.overlaps_polygon([(4, 4), (8, 4), (4, 8)])
+    assert not hull.overlaps_polygon([(6, -1), (8, -1), (8, 1), (6, 1)])
+
+
+def test_rotated_shapes_are_tested_in_their_own_frame():
+    bar = Shape(BAR, x=100, y=100, rotation=math.pi / 2)
+    assert circle_hits_shape(100, 115, 1, bar)
+    assert not circle_hits_shape(115, 100, 1, bar)
+    assert polygon_hits_shape([(99, 118), (101, 118), (101, 130), (99, 130)], bar)
+    assert not polygon_hits_shape([(110, 99), (120, 99), (120, 101), (110, 101)], bar)
+
+
+def test_swept_path_cannot_tunnel_through_a_thin_shape():
+    bar = Shape(BAR)
+    # Both ends are clear of the bar, but the path crosses it
+    assert path_hits_shape(0, -30, 0, 30, 1, bar)
+    assert not path_hits_shape(25, -30, 25, 30, 1, bar)
@@ -0,0 +1,60 @@
+import random
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from scripts.asteroid import Asteroid
+from scripts.entity_store import EntityStore, X
+
+
+def make_asteroid(x, y):
+    return Asteroid(x, y, "small", 0.0, 1, rng=random.Random(0))
+
+
+def test_attributes_read_and_write_the_columns():
+    store = EntityStore()
+    asteroid = make_asteroid(10, 20)
+    store.append(asteroid)
+
+    asteroid.x = 42.0
+    assert store.column(X)[0] == 42.0
+    store.column(X)[0] = 7.0
+    assert asteroid.x == 7.0
+
+
+def test_remove_swaps_in_the_last_entity():
+    store = EntityStore()
+    first, middle, last = (make_asteroid(x, 0) for x in (1, 2, 3))
+    store.extend([first, middle, last])
+
+    store.remove(first)
+
+    assert list(store) == [last, middle]
+    assert last.store_index == 0 and last.x == 3
+    assert first not in store
+    assert middle in store and last in store
+
+
+def test_removed_entities_keep_their_state():
+    store = EntityStore()
+    asteroid = make_asteroid(5, 6)
+    store.append(asteroid)
+    asteroid.prev_x = None
+    store.update(0.5, 800, 600)
+    x, y = asteroid.x, asteroid.y
+
+    store.remove(asteroid)
+
+    assert asteroid.store is None
+    assert (asteroid.x, asteroid.y, asteroid.prev_x) == (x, y, None)
+
+
+def test_update_culls_offscreen_entities():
+    store = EntityStore(cull_buffer=10)
+    inside = make_asteroid(400, 300)
+    outside = make_asteroid(-500, 300)
+    store.extend([inside, outside])
+
+    assert store.update(0.0, 800, 600) == [outside]
+    assert list(store) == [inside]
@@ -0,0 +1,71 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from scripts.env import OBSERVATION_SIZE, PLAYER_FEATURES, AsteroidDodgerEnv
+from scripts.game import INPUT_FIRE, INPUT_FORWARD
+
+
+class Body:
+    def __init__(self, x, y, prev_x, prev_y, radius=10):
+        self.x = x
+        self.y = y
+        self.prev_x = prev_x
+        self.prev_y = prev_y
+        self.radius = radius
+
+
+def play(seed, steps=60):
+    env = AsteroidDodgerEnv(frame_skip=2)
+    observation, info = env.reset(seed)
+    observations = [observation]
+    rewards = []
+    for step in range(steps):
+        observation, reward, terminated, truncated, info = env.step((INPUT_FORWARD | INPUT_FIRE) if step % 3 else 0)
+        observations.append(observation)
+        rewards.append(reward)
+        if terminated or truncated:
+            break
+    return np.stack(observations), rewards
+
+
+def test_reset_returns_an_observation_and_info():
+    env = AsteroidDodgerEnv()
+    observation, info = env.reset(7)
+
+    assert observation.shape == (OBSERVATION_SIZE,)
+    assert observation.dtype == np.float32
+    assert info["steps"] == 0 and info["wave"] == 1
+
+
+def test_step_returns_the_gymnasium_five_tuple():
+    env = AsteroidDodgerEnv(max_steps=3)
+    env.reset(7)
+
+    results = [env.step(0) for _ in range(3)]
+
+    for observation, reward, terminated, truncated, info in results:
+        assert observation.shape == (OBSERVATION_SIZE,)
+        assert isinstance(reward, float)
+        assert isinstance(terminated, bool) and isinstance(truncated, bool)
+    assert [truncated for _, _, _, truncated, _ in results] == [False, False, True]
+    assert results[-1][4]["steps"] == 3
+
+
+def test_episodes_are_deterministic_under_a_seed():
+    first = play(11)
+    second = play(11)
+
+    assert np.array_equal(first[0], second[0])
+    assert first[1] == second[1]
+
+
+def test_velocity_uses_a_previous_position_of_zero():
+    env = AsteroidDodgerEnv()
+    env.reset(7)
+    observation = np.zeros(OBSERVATION_SIZE, dtype=np.float32)
+
+    env.fill_objects(observation, PLAYER_FEATURES, [(Body(3.0, 2.0, 0.0, 0.0), 0)], 1)
+
+    vx, vy = observation[PLAYER_FEATURES + 2:PLAYER_FEATURES + 4]
+    assert (vx, vy) == pytest.approx((0.3, 0.2))
@@ -0,0 +1,86 @@
+import math
+import random
+
+import pytest
+
+from scripts.gravity import GravityField
+from scripts.hazard import BlackHole
+
+
+class Ship:
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+        self.velocity_x = 0.0
+        self.velocity_y = 0.0
+
+
+class Rock:
+    def __init__(self, x, y, angle=0.0, speed=0.0):
+        self.x = x
+        self.y = y
+        self.angle = angle
+        self.speed = speed
+
+
+def make_hole(x, y):
+    return BlackHole(x, y, radius=30, rng=random.Random(0))
+
+
+def test_pull_points_at_the_hole_and_fades_with_distance():
+    hole = make_hole(0, 0)
+    near = Ship(-50, 0)
+    far = Ship(-120, 0)
+    outside = Ship(-200, 0)
+
+    GravityField().apply([hole], [near, far, outside], 1 / 60)
+
+    assert near.velocity_x > far.velocity_x > 0
+    assert near.velocity_y == 0
+    assert outside.velocity_x == 0
+
+
+def test_pull_on_angle_and_speed_bodies():
+    rock = Rock(0, 50)
+
+    GravityField().apply([make_hole(0, 0)], [rock], 1 / 60)
+
+    # Falls straight up the screen towards the hole
+    assert rock.angle == pytest.approx(-math.pi / 2)
+    assert rock.speed > 0
+
+
+def test_bodies_in_the_core_are_swallowed():
+    hole = make_hole(0, 0)
+    inside = Ship(20, 0)
+    centred = Ship(0, 0)
+    outside = Ship(100, 0)
+
+    swallowed = GravityField().apply([hole], [inside, centred, outside], 1 / 60)
+
+    # A body exactly at the centre has no direction to be pulled in
+    assert swallowed == [inside]
+
+
+def test_vectorised_pull_matches_the_plain_loop():
+    rng = random.Random(3)
+    holes = [make_hole(rng.uniform(0, 800), rng.uniform(0, 600)) for _ in range(4)]
+
+    def bodies():
+        rng = random.Random(4)
+        return ([Ship(rng.uniform(0, 800), rng.uniform(0, 600)) for _ in range(50)] +
+                [Rock(rng.uniform(0, 800), rng.uniform(0, 600), rng.uniform(0, 6), rng.uniform(0, 3))
+                 for _ in range(50)])
+
+    field = GravityField()
+    batched = bodies()
+    each = bodies()
+    swallowed = field.apply(holes, batched, 1 / 60)
+    swallowed_each = field.apply_each(holes, each, 1 / 60)
+
+    assert [batched.index(body) for body in swallowed] == [each.index(body) for body in swallowed_each]
+    for a, b in zip(batched, each):
+        if isinstance(a, Ship):
+            assert (a.velocity_x, a.velocity_y) == pytest.approx((b.velocity_x, b.velocity_y))
+        else:
+            assert (a.angle, a.speed) == pytest.approx((b.angle, b.speed))
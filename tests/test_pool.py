@@ -0,0 +1,84 @@
+from scripts.headless import create_headless_game
+from scripts.pool import ObjectPool
+
+
+class Thing:
+    def __init__(self, value=0):
+        self.reset(value)
+
+    def reset(self, value=0):
+        self.value = value
+
+
+class SpecialThing(Thing):
+    pass
+
+
+def test_released_objects_are_reused_after_recycle():
+    pool = ObjectPool(Thing)
+    thing = pool.acquire(1)
+    pool.release(thing)
+
+    assert pool.acquire(2) is not thing
+    pool.recycle()
+    assert pool.acquire(3) is thing and thing.value == 3
+
+
+def test_double_release_hands_the_object_out_once():
+    pool = ObjectPool(Thing)
+    thing = pool.acquire()
+    pool.release(thing)
+    pool.release(thing)
+    pool.recycle()
+
+    first = pool.acquire()
+    second = pool.acquire()
+    assert first is thing and second is not thing
+    assert pool.get_stats()["released"] == 1
+
+
+def test_objects_can_be_released_again_after_reuse():
+    pool = ObjectPool(Thing)
+    thing = pool.acquire()
+    pool.release(thing)
+    pool.recycle()
+    assert pool.acquire() is thing
+
+    pool.release(thing)
+    pool.recycle()
+    assert pool.acquire() is thing
+
+
+def test_subclass_instances_are_not_pooled():
+    pool = ObjectPool(Thing)
+    pool.release(SpecialThing())
+    pool.recycle()
+
+    assert pool.get_stats()["free"] == 0
+
+
+def test_games_do_not_share_pools():
+    first = create_headless_game()
+    second = create_headless_game()
+
+    assert first.asteroid_pool is not second.asteroid_pool
+    assert first.projectile_pool is not second.projectile_pool
+    assert first.weapon.projectile_pool is first.projectile_pool
+
+
+def test_clearing_asteroids_returns_them_to_the_pool():
+    game = create_headless_game()
+    for _ in range(5):
+        game.spawn_asteroid()
+    pooled = [asteroid for asteroid in game.asteroids if type(asteroid) is game.asteroid_pool.cls]
+    assert pooled
+    stats = game.asteroid_pool.get_stats()
+
+    game.clear_asteroids()
+    game.asteroid_pool.recycle()
+
+    assert len(game.asteroids) == 0
+    after = game.asteroid_pool.get_stats()
+    assert after["released"] == stats["released"] + len(pooled)
+    assert after["in_use"] == stats["in_use"] - len(pooled)
+    assert after["free"] == stats["free"] + len(pooled)
@@ -0,0 +1,70 @@
+import struct
+import pytest
+from scripts.campaign import Campaign
+from scripts.headless import AutoPilot, create_headless_game
+from scripts.replay import (HEADER, MAGIC, VERSION, ReplayRecorder, load_replay, play_replay,
+                            read_varint, write_varint)
+
+
+def record_game(sector_index, ticks, seed=1234, asteroid_bounce=False):
+    game = create_headless_game()
+    game.asteroid_bounce = asteroid_bounce
+    game.reset(seed)
+    if sector_index >= 0:
+        game.set_campaign_mission(Campaign.create_sectors()[sector_index])
+    recorder = game.recorder = ReplayRecorder(game, sector_index)
+
+    pilot = AutoPilot()
+    for _ in range(ticks):
+        if game.shop_active:
+            recorder.record_purchase(0)
+            game.shop.purchase_item(0)
+            recorder.record_continue()
+            game.close_shop()
+        game.apply_input(pilot.get_input(game))
+        if game.update() == "game_over":
+            break
+    return game, recorder
+
+
+@pytest.mark.parametrize("value", [0, 1, 127, 128, 300, 2 ** 21, 2 ** 32 - 1])
+def test_varint_round_trip(value):
+    out = bytearray()
+    write_varint(out, value)
+    assert read_varint(out, 0) == (value, len(out))
+
+
+@pytest.mark.parametrize("sector_index, asteroid_bounce", [(-1, False), (7, False), (-1, True)])
+def test_replay_reproduces_the_recorded_state(tmp_path, sector_index, asteroid_bounce):
+    game, recorder = record_game(sector_index, 1500, asteroid_bounce=asteroid_bounce)
+    path = tmp_path / "game.adrp"
+    recorder.save(str(path))
+
+    replay = load_replay(str(path))
+    assert replay.seed == game.seed
+    assert replay.sector_index == sector_index
+    assert replay.ticks == recorder.ticks
+    assert replay.asteroid_bounce == asteroid_bounce
+
+    # Played back with the recorded bounce setting, whatever the game was created with
+    replayed, matches = play_replay(replay, create_headless_game())
+    assert replayed.asteroid_bounce == asteroid_bounce
+    assert matches
+    assert replayed.get_state_hash() == game.get_state_hash()
+    assert replayed.score == game.score
+
+
+def test_other_versions_are_rejected(tmp_path):
+    path = tmp_path / "old.adrp"
+    path.write_bytes(HEADER.pack(MAGIC, VERSION - 1, 1, 800, 600, -1, 0, 0, False))
+
+    with pytest.raises(ValueError):
+        load_replay(str(path))
+
+
+def test_other_files_are_rejected(tmp_path):
+    path = tmp_path / "not_a_replay.adrp"
+    path.write_bytes(struct.pack("<4s", b"PNG!") + bytes(HEADER.size))
+
+    with pytest.raises(ValueError):
+        load_replay(str(path))
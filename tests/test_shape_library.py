@@ -0,0 +1,43 @@
+import json
+
+from scripts.shape_library import ShapeLibrary
+
+
+def write_cache(tmp_path, variants=4):
+    path = tmp_path / "shapes.json"
+    ShapeLibrary(variants=variants).load_or_generate(str(path))
+    return path
+
+
+def test_cache_round_trip(tmp_path):
+    path = write_cache(tmp_path)
+    generated = ShapeLibrary(variants=4)
+    generated.generate()
+
+    loaded = ShapeLibrary(variants=4)
+    assert loaded.load(str(path))
+    assert loaded.shapes == generated.shapes
+
+
+def test_partial_cache_is_regenerated(tmp_path):
+    path = write_cache(tmp_path)
+    data = json.loads(path.read_text())
+    del data["shapes"]["crystal"]
+    data["shapes"]["large"] = data["shapes"]["large"][:2]
+    path.write_text(json.dumps(data))
+
+    assert not ShapeLibrary(variants=4).load(str(path))
+
+    library = ShapeLibrary(variants=4, cache_path=str(path))
+    key, points = library.pick_shape("crystal")
+    assert key[0] == "crystal" and points
+    assert len(library.get_shapes()["large"]) == 4
+    assert ShapeLibrary(variants=4).load(str(path))
+
+
+def test_stale_or_corrupt_cache_is_not_loaded(tmp_path):
+    path = write_cache(tmp_path)
+    assert not ShapeLibrary(variants=8).load(str(path))
+
+    path.write_text("not json")
+    assert not ShapeLibrary(variants=4).load(str(path))
@@ -0,0 +1,73 @@
+import random
+
+import pytest
+
+from scripts.asteroid import Asteroid
+from scripts.entity_store import create_entity_list
+from scripts.sort_and_sweep import MIN_BATCH_SIZE, SortAndSweep
+
+
+class Body:
+    def __init__(self, x, y, radius):
+        self.x = x
+        self.y = y
+        self.radius = radius
+
+
+def brute_force_pairs(objects):
+    pairs = set()
+    for i, a in enumerate(objects):
+        for b in objects[i + 1:]:
+            if abs(a.x - b.x) <= a.radius + b.radius and abs(a.y - b.y) <= a.radius + b.radius:
+                pairs.add(frozenset((id(a), id(b))))
+    return pairs
+
+
+def found_pairs(sweep, objects):
+    pairs = sweep.find_pairs(objects)
+    found = {frozenset((id(a), id(b))) for a, b in pairs}
+    assert len(found) == len(pairs)  # no pair reported twice
+    return found
+
+
+def random_bodies(rng, count):
+    return [Body(rng.uniform(0, 400), rng.uniform(0, 300), rng.uniform(2, 20)) for _ in range(count)]
+
+
+@pytest.mark.parametrize("count", [10, MIN_BATCH_SIZE * 3])
+def test_sweep_finds_every_overlapping_pair(count):
+    rng = random.Random(count)
+    bodies = random_bodies(rng, count)
+    sweep = SortAndSweep()
+
+    # Same pairs over several ticks of movement, as the kept order goes stale
+    for _ in range(5):
+        assert found_pairs(sweep, bodies) == brute_force_pairs(bodies)
+        for body in bodies:
+            body.x += rng.uniform(-15, 15)
+            body.y += rng.uniform(-15, 15)
+
+
+def test_sweep_follows_added_and_removed_objects():
+    rng = random.Random(1)
+    bodies = random_bodies(rng, 40)
+    sweep = SortAndSweep()
+    found_pairs(sweep, bodies)
+
+    bodies = bodies[10:] + random_bodies(rng, 15)
+    assert found_pairs(sweep, bodies) == brute_force_pairs(bodies)
+
+
+def test_sweep_reads_entity_store_columns():
+    store = create_entity_list()
+    if isinstance(store, list):
+        pytest.skip("entity stores need NumPy")
+    rng = random.Random(2)
+    for _ in range(30):
+        store.append(Asteroid(rng.uniform(0, 400), rng.uniform(0, 300), "medium", 0.0, 1, rng=rng))
+    sweep = SortAndSweep()
+
+    assert found_pairs(sweep, store) == brute_force_pairs(list(store))
+    store.remove(store[0])
+    store[3].x += 50
+    assert found_pairs(sweep, store) == brute_force_pairs(list(store))
@@ -0,0 +1,81 @@
+from scripts.spatial_hash import SpatialHash
+
+
+class Body:
+    def __init__(self, x, y, radius=5):
+        self.x = x
+        self.y = y
+        self.radius = radius
+
+
+def test_query_finds_nearby_objects_only():
+    grid = SpatialHash(cell_size=64)
+    near = Body(100, 100)
+    far = Body(600, 600)
+    grid.insert(near, "asteroids")
+    grid.insert(far, "asteroids")
+
+    assert grid.query(110, 90, 10, "asteroids") == [near]
+    assert grid.query(300, 300, 10, "asteroids") == []
+
+
+def test_layers_are_separate():
+    grid = SpatialHash()
+    asteroid = Body(50, 50)
+    powerup = Body(50, 50)
+    grid.insert(asteroid, "asteroids")
+    grid.insert(powerup, "powerups")
+
+    assert grid.query(50, 50, 5, "asteroids") == [asteroid]
+    assert grid.query(50, 50, 5, "powerups") == [powerup]
+
+
+def test_object_spanning_cells_is_returned_once():
+    grid = SpatialHash(cell_size=32)
+    big = Body(64, 64, radius=40)
+    grid.insert(big, "asteroids")
+
+    assert len(grid.object_cells[id(big)]) > 1
+    assert grid.query(64, 64, 60, "asteroids") == [big]
+
+
+def test_insert_radius_overrides_object_radius():
+    grid = SpatialHash(cell_size=32)
+    body = Body(16, 16, radius=1)
+    grid.insert(body, "asteroids", radius=40)
+
+    assert grid.query(60, 16, 1, "asteroids") == [body]
+
+
+def test_remove():
+    grid = SpatialHash()
+    body = Body(10, 10)
+    grid.insert(body, "asteroids")
+    grid.remove(body)
+
+    assert not grid.contains(body)
+    assert grid.query(10, 10, 5, "asteroids") == []
+    assert grid.cells == {}
+
+    # Removing an object that isn't in the grid is a no-op
+    grid.remove(body)
+
+
+def test_update_moves_object_to_new_cells():
+    grid = SpatialHash(cell_size=64)
+    body = Body(10, 10)
+    grid.insert(body, "asteroids")
+    body.x, body.y = 500, 500
+    grid.update(body)
+
+    assert grid.query(10, 10, 5, "asteroids") == []
+    assert grid.query(500, 500, 5, "asteroids") == [body]
+
+
+def test_clear():
+    grid = SpatialHash()
+    grid.insert(Body(10, 10), "asteroids")
+    grid.clear()
+
+    assert grid.cells == {}
+    assert grid.object_cells == {}
@@ -0,0 +1,66 @@
+import random
+
+from scripts.hazard import Wormhole
+from scripts.spatial_hash import SpatialHash
+
+
+class Body:
+    def __init__(self, x, y, radius=5):
+        self.x = x
+        self.y = y
+        self.prev_x = x
+        self.prev_y = y
+        self.radius = radius
+
+
+def make_network(portals):
+    return Wormhole(portals, radius=25, rng=random.Random(0))
+
+
+def index_bodies(bodies, layer="asteroids"):
+    grid = SpatialHash(cell_size=64)
+    for body in bodies:
+        grid.insert(body, layer)
+    return grid
+
+
+def test_portals_send_objects_round_the_ring():
+    wormhole = make_network([(100, 100), (400, 100), (250, 400)])
+    first = Body(105, 100)
+    last = Body(250, 395)
+    bystander = Body(180, 100)
+
+    wormhole.update(1 / 60, index_bodies([first, last, bystander]))
+
+    assert (first.x, first.y) == (400, 100)
+    assert (last.x, last.y) == (100, 100)
+    assert (bystander.x, bystander.y) == (180, 100)
+    # The jump isn't interpolated
+    assert (first.prev_x, first.prev_y) == (400, 100)
+
+
+def test_cooldown_stops_an_immediate_return():
+    wormhole = make_network([(100, 100), (400, 100)])
+    body = Body(100, 100)
+    grid = index_bodies([body])
+
+    wormhole.update(1 / 60, grid)
+    assert (body.x, body.y) == (400, 100)
+    wormhole.update(1 / 60, grid)
+    assert (body.x, body.y) == (400, 100)
+
+    # Once the cooldown has run out it travels back
+    wormhole.update(wormhole.cooldown_time, grid)
+    assert (body.x, body.y) == (100, 100)
+
+
+def test_every_layer_travels():
+    wormhole = make_network([(100, 100), (400, 100)])
+    grid = SpatialHash(cell_size=64)
+    bodies = {layer: Body(100, 100) for layer in Wormhole.LAYERS}
+    for layer, body in bodies.items():
+        grid.insert(body, layer)
+
+    wormhole.update(1 / 60, grid)
+
+    assert all((body.x, body.y) == (400, 100) for body in bodies.values())